@@ -0,0 +1,60 @@
+"""
+기후 데이터 수집의 캐시 미스 비용: 연도별 파일을 순서대로 받을 때 vs. 연결 풀을 공유하는 동시 수집.
+
+네트워크 없이 `kma_standin.py`의 로컬 HTTP 스탠드인(요청마다 지연 추가)과 로컬 디렉터리 미러를 소스로 씁니다.
+
+    $ python benchmarks/bench_climate.py
+    $ python benchmarks/bench_climate.py --latency-ms 300 --workers 1 4 8 16
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from dashboard.climate import fetch_climate  # noqa: E402
+from kma_standin import serve, write_directory  # noqa: E402
+
+
+def timed(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=100, help="스탠드인 요청당 지연")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16], help="동시 작업 수 (1 = 순차)")
+    parser.add_argument("--years", type=int, nargs=2, default=(2000, 2023), metavar=("FIRST", "LAST"))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    years = range(args.years[0], args.years[1] + 1)
+    server = serve(latency=args.latency_ms / 1000, years=years)
+    url = f"http://127.0.0.1:{server.server_port}/"
+    print(f"{len(years)} yearly files, {args.latency_ms:.0f} ms per request")
+    print(f"{'source':<8} {'workers':>7} {'median ms':>10} {'rows':>6}")
+    try:
+        for workers in args.workers:
+            ms, df = timed(lambda: fetch_climate(url, years, max_workers=workers), args.repeat)
+            print(f"{'http':<8} {workers:>7} {ms:>10.1f} {len(df):>6}")
+        with tempfile.TemporaryDirectory() as mirror:
+            write_directory(mirror, years)
+            for workers in (1, max(args.workers)):
+                ms, df = timed(lambda: fetch_climate(mirror, years, max_workers=workers), args.repeat)
+                print(f"{'local':<8} {workers:>7} {ms:>10.1f} {len(df):>6}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
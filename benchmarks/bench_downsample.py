@@ -0,0 +1,77 @@
+"""
+LTTB 다운샘플링 전후의 GDP 선 그래프 비교: 전송 점 수, Figure JSON 페이로드 크기, 빌드+직렬화 시간.
+
+브라우저 렌더링 시간은 헤드리스 환경에서 잴 수 없으므로, 프런트엔드가 그려야 하는 점 수(페이로드)를
+대리 지표로 봅니다. 데이터는 한 국가, 전체 국가를 이어 붙인 시계열, 그리고 월별 길이의 합성 랜덤 워크입니다.
+
+    $ python benchmarks/bench_downsample.py
+    $ python benchmarks/bench_downsample.py --max-points 800 --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from dashboard.downsample import DEFAULT_MAX_POINTS, lttb_indices  # noqa: E402
+from dashboard.figures import build_gdp_line  # noqa: E402
+from dashboard.gdp_cache import load_gdp_table  # noqa: E402
+
+
+def frames():
+    table = load_gdp_table(os.path.join(ROOT, "data", "gdp_data.csv")).to_pandas().dropna(subset=["value"])
+    kor = table[table["code"] == "KOR"]
+    yield "one country", pd.DataFrame({"date": pd.to_datetime(kor["year"].astype(str)), "gdp": kor["value"]})
+    # 전체 국가를 한 줄로 이어 붙인 긴 시계열 (x는 순번 날짜)
+    yield "all countries", pd.DataFrame({
+        "date": pd.date_range("1800-01-01", periods=len(table), freq="D"),
+        "gdp": table["value"].to_numpy(),
+    })
+    rng = np.random.default_rng(0)
+    for n in (100_000, 1_000_000):
+        yield f"random walk {n:,}", pd.DataFrame({
+            "date": pd.date_range("1900-01-01", periods=n, freq="h"),
+            "gdp": np.cumsum(rng.normal(size=n)),
+        })
+
+
+def measure(df, max_points, repeat):
+    """(JSON 바이트, 빌드+직렬화 ms 중앙값, 전송 점 수)."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payload = build_gdp_line(df, None, max_points=max_points).to_json()
+        times.append(time.perf_counter() - start)
+    return len(payload.encode("utf-8")), statistics.median(times) * 1000, min(len(df), max_points)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-points", type=int, default=DEFAULT_MAX_POINTS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'series':<22} {'rows':>9} {'points':>7} {'full KiB':>10} {'lttb KiB':>9} {'ratio':>6} "
+        f"{'full ms':>9} {'lttb ms':>8} {'lttb only ms':>13}"
+    )
+    for name, df in frames():
+        full_bytes, full_ms, _ = measure(df, len(df), args.repeat)
+        lttb_bytes, lttb_ms, points = measure(df, args.max_points, args.repeat)
+        start = time.perf_counter()
+        lttb_indices(df["date"].to_numpy(), df["gdp"].to_numpy(), args.max_points)
+        only_ms = (time.perf_counter() - start) * 1000
+        print(
+            f"{name:<22} {len(df):>9} {points:>7} {full_bytes / 1024:>10.1f} {lttb_bytes / 1024:>9.1f} "
+            f"{full_bytes / lttb_bytes:>6.1f} {full_ms:>9.1f} {lttb_ms:>8.1f} {only_ms:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
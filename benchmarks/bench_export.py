@@ -0,0 +1,96 @@
+"""
+다운로드 버튼 1개에 대해 앱과 같은 `ExportCache.download_data` 경로의 비용을 앱이 실제로 내보내는 크기의 프레임으로 잽니다.
+`EAGER_MAX_ROWS` 이하 프레임은 캐시 미스 rerun에서 바로 직렬화하고(eager), 그보다 크면 콜러블만 넘겨 클릭 때 직렬화합니다(deferred).
+rerun(미스/적중)과 클릭마다 소요 시간(ms)과 최대 추가 할당(KiB)을 출력하고,
+이어서 클릭 시 페이로드를 만드는 최대 메모리를 한 번에 문자열 → 인코딩 vs. 청크 스트리밍(형식별)으로 비교합니다.
+
+    $ python benchmarks/bench_export.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+from functools import partial
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+
+from dashboard.events import user_events_frame  # noqa: E402
+from dashboard.export import EAGER_MAX_ROWS, EXPORT_FORMATS, ExportCache, export_bytes, to_csv  # noqa: E402
+from dashboard.gdp_cache import load_gdp_table  # noqa: E402
+
+REPEAT = 5
+
+
+def allocated(func):
+    """func() 실행 중 최대 추가 할당 바이트."""
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - baseline
+
+
+def elapsed_ms(func, repeat=REPEAT):
+    """func() 최소 소요 시간(ms)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def measure(func):
+    return elapsed_ms(func), allocated(func) / 1024
+
+
+def download_costs(df):
+    """(경로, rerun 미스, rerun 적중, 클릭) — 각각 (ms, KiB), 클릭은 deferred일 때만."""
+    key = ("bench", len(df), "csv")
+    factory = partial(to_csv, df)
+
+    def miss():
+        return ExportCache().download_data(key, factory, len(df))
+
+    path = "deferred" if callable(miss()) else "eager"
+    cache = ExportCache()
+    cache.get_or_create(key, factory)
+    hit = measure(lambda: cache.download_data(key, factory, len(df)))
+    click = measure(lambda: ExportCache().download_data(key, factory, len(df))()) if path == "deferred" else None
+    return path, measure(miss), hit, click
+
+
+def main():
+    table = load_gdp_table(os.path.join(ROOT, "data", "gdp_data.csv")).to_pandas()
+    # 탭 2 표, 탭 1 국가 하나(연도 필터 전체), 임계값 바로 위아래, 전체 국가
+    frames = {
+        "user tab": user_events_frame(),
+        "one country": table[table["code"] == "KOR"],
+        "at threshold": table.head(EAGER_MAX_ROWS),
+        "over threshold": table.head(EAGER_MAX_ROWS + 1),
+        "all countries": table,
+        "all x 10": pd.concat([table] * 10, ignore_index=True),
+    }
+
+    print(f"download_data, CSV (EAGER_MAX_ROWS = {EAGER_MAX_ROWS})")
+    columns = ("rerun miss", "rerun hit", "click")
+    print(f"{'frame':<15} {'rows':>7} {'path':<9} " + " ".join(f"{c + ' ms':>14} {c + ' KiB':>15}" for c in columns))
+    for name, df in frames.items():
+        path, *costs = download_costs(df)
+        cells = " ".join(f"{cost[0]:>14.2f} {cost[1]:>15.1f}" if cost else f"{'-':>14} {'-':>15}" for cost in costs)
+        print(f"{name:<15} {len(df):>7} {path:<9} {cells}")
+
+    print()
+    print(f"{'frame':<15} {'legacy KiB':>11} " + " ".join(f"{fmt + ' KiB':>13}" for fmt in EXPORT_FORMATS))
+    for name, df in frames.items():
+        legacy = allocated(lambda: df.to_csv(index=False).encode('utf-8-sig'))
+        streamed = [allocated(lambda: export_bytes(df, fmt)) for fmt in EXPORT_FORMATS]
+        print(f"{name:<15} {legacy / 1024:>11.1f} " + " ".join(f"{v / 1024:>13.1f}" for v in streamed))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+`FigureCache` 적중 비용: 앱이 그리는 차트마다 빌드(미스) vs. 적중 vs. 이전 방식(Figure JSON 보관 → `pio.from_json` 복원).
+
+적중 비용에는 `st.plotly_chart`가 받은 Figure로 하는 일(`return_figure_from_figure_or_data` → `to_json(validate=False)`)을
+포함하므로, 세 열 모두 rerun에서 차트 하나를 내보내기까지의 시간입니다. 데이터는 앱과 같은 크기
+(국가 하나의 연간 GDP, 기후 월별 자료, 사용자 재해 데이터)입니다.
+
+    $ python benchmarks/bench_figures.py
+    $ python benchmarks/bench_figures.py --repeat 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from functools import partial
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import plotly.io as pio  # noqa: E402
+import plotly.tools  # noqa: E402
+
+from dashboard import synthetic  # noqa: E402
+from dashboard.events import user_events_frame  # noqa: E402
+from dashboard.figures import (  # noqa: E402
+    FigureCache,
+    build_climate_chart,
+    build_gdp_bar,
+    build_gdp_line,
+    build_rain_detail_bar,
+    build_region_pie,
+    build_user_bar,
+)
+from dashboard.gdp_cache import load_gdp_table  # noqa: E402
+from dashboard.gdp_store import GDPStore  # noqa: E402
+
+
+def send(fig):
+    """st.plotly_chart가 Figure를 프런트엔드 JSON으로 만드는 부분."""
+    figure = plotly.tools.return_figure_from_figure_or_data(fig, validate_figure=True)
+    return pio.to_json(figure, validate=False)
+
+
+def median_ms(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    gdp = GDPStore.from_table(load_gdp_table(os.path.join(ROOT, "data", "gdp_data.csv"))).frame("KOR")
+    user = user_events_frame()
+    charts = {
+        "build_gdp_line": (build_gdp_line, gdp),
+        "build_gdp_bar": (build_gdp_bar, gdp),
+        "build_climate_chart": (build_climate_chart, synthetic.climate_frame(months=24 * 12)),
+        "build_user_bar": (build_user_bar, user),
+        "build_region_pie": (build_region_pie, user),
+        "build_rain_detail_bar": (build_rain_detail_bar, user[user["event"] == "전국 폭우"]),
+    }
+
+    print(f"{'chart':<22} {'rows':>6} {'miss ms':>9} {'hit ms':>8} {'from_json hit ms':>17}")
+    for name, (builder, df) in charts.items():
+        build = partial(builder, df, None)
+        cache = FigureCache()
+        cache.get_or_build(name, build)
+        spec = build().to_json()
+        miss = median_ms(lambda: send(FigureCache().get_or_build(name, build)), args.repeat)
+        hit = median_ms(lambda: send(cache.get_or_build(name, build)), args.repeat)
+        json_hit = median_ms(lambda: send(pio.from_json(spec)), args.repeat)
+        print(f"{name:<22} {len(df):>6} {miss:>9.2f} {hit:>8.2f} {json_hit:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
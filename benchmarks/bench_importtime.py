@@ -0,0 +1,119 @@
+"""
+streamlit_app.py 최상위 import 구문의 콜드 import 비용 (`python -X importtime` 요약).
+
+앱 파일의 모듈 수준 import 문만 뽑아 새 인터프리터에서 실행하고, 최상위 패키지별 누적 시간을 집계합니다.
+`importtime_baseline.json`과 비교해 금지 모듈(지연 로드 대상)이 다시 들어오거나, 총 시간이 허용치를 넘으면 실패합니다.
+
+총 시간은 절대값이 아니라 같은 실행에서 번갈아 잰 기준 import(`import streamlit, pandas`)에 대한 배율로 비교합니다.
+머신 속도나 다른 작업의 부하는 두 측정에 함께 걸리므로, 기준선을 다른 머신에서 만들었어도 앱 쪽 import가 늘었을 때만 실패합니다.
+
+    $ python benchmarks/bench_importtime.py            # 요약 출력 + 기준선 검사
+    $ python benchmarks/bench_importtime.py --update   # 기준선 갱신
+"""
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "streamlit_app.py")
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "importtime_baseline.json")
+# 앱 import 블록의 시간을 이 import에 대한 배율로 비교 (앱이 어차피 쓰는 가장 큰 두 패키지)
+REFERENCE_SOURCE = "import streamlit\nimport pandas"
+
+
+def app_import_block(app_path=APP_PATH):
+    """앱 파일의 모듈 수준 import 문만 모은 소스."""
+    with open(app_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    nodes = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.unparse(node) for node in nodes)
+
+
+def measure(source):
+    """새 프로세스에서 source를 실행하고 {최상위 패키지: 누적 µs}, 총 µs를 돌려준다."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", source],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stderr
+    packages = defaultdict(int)
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        _, cumulative, raw_name = line[len("import time:"):].split("|")
+        # 들여쓰기가 없는(공백 1칸) 항목이 최상위 import (누적값에 하위 import 포함)
+        name = raw_name.strip()
+        if len(raw_name) - len(raw_name.lstrip()) == 1:
+            package = name.split(".")[0]
+            packages[package] += int(cumulative)
+            total += int(cumulative)
+    return dict(packages), total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=12)
+    parser.add_argument("--update", action="store_true", help="기준선 파일을 현재 측정값으로 갱신")
+    args = parser.parse_args()
+
+    source = app_import_block()
+    runs, reference_runs = [], []
+    for _ in range(args.repeat):
+        # 부하 변화가 양쪽에 고르게 걸리도록 번갈아 측정
+        runs.append(measure(source))
+        reference_runs.append(measure(REFERENCE_SOURCE))
+    total_ms = statistics.median(total for _, total in runs) / 1000
+    reference_ms = statistics.median(total for _, total in reference_runs) / 1000
+    ratio = statistics.median(run[1] / reference[1] for run, reference in zip(runs, reference_runs))
+    packages = {
+        name: statistics.median(run[0].get(name, 0) for run in runs) / 1000
+        for name in runs[0][0]
+    }
+
+    print(f"app import block: {total_ms:.1f} ms (median of {args.repeat})")
+    for name, ms in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<24} {ms:>8.1f} ms")
+    print(f"reference ({REFERENCE_SOURCE.replace(chr(10), '; ')}): {reference_ms:.1f} ms -> ratio {ratio:.2f}")
+
+    if args.update or not os.path.exists(BASELINE_PATH):
+        measured = {"ratio": round(ratio, 2), "total_ms": round(total_ms, 1)}
+        baseline = {"forbidden": ["matplotlib", "seaborn", "requests", "scipy"], **measured, "tolerance": 0.2}
+        if os.path.exists(BASELINE_PATH):
+            with open(BASELINE_PATH, encoding="utf-8") as f:
+                baseline = {**json.load(f), **measured}
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+            f.write("\n")
+        print(f"baseline written to {os.path.relpath(BASELINE_PATH, ROOT)}")
+        return
+
+    with open(BASELINE_PATH, encoding="utf-8") as f:
+        baseline = json.load(f)
+    loaded = subprocess.run(
+        [sys.executable, "-c", source + "\nimport sys; print(' '.join(sys.modules))"],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout.split()
+    eager = sorted({name.split(".")[0] for name in loaded} & set(baseline["forbidden"]))
+    limit = baseline["ratio"] * (1 + baseline["tolerance"])
+
+    failures = []
+    if eager:
+        failures.append(f"modules that should load lazily were imported eagerly: {', '.join(eager)}")
+    if ratio > limit:
+        failures.append(f"import block took {ratio:.2f}x the reference import, over the {limit:.2f}x budget "
+                        f"(baseline {baseline['ratio']:.2f}x)")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"OK: within {limit:.2f}x budget, no eager imports of {', '.join(baseline['forbidden'])}")
+
+
+if __name__ == "__main__":
+    main()
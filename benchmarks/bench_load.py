@@ -0,0 +1,111 @@
+"""
+load_public_data()의 콜드 로드 비용 비교: 기존 CSV 파싱 vs. Arrow 캐시(메모리 매핑) vs. 오프라인 빌드 산출물
+(`python -m dashboard.etl build`의 매니페스트 + 메모리 매핑, 원본 CSV는 읽지 않음).
+
+각 측정은 새 프로세스에서 실행되므로 '새 서버 프로세스의 첫 캐시 미스'에 해당합니다.
+
+    $ python benchmarks/bench_load.py [--repeat 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dashboard.etl import build  # noqa: E402
+
+CSV_PATH = os.path.join(ROOT, "data", "gdp_data.csv")
+
+_CHILD = r'''
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+import pandas as pd
+import pyarrow.compute as pc
+from dashboard import etl, gdp_cache
+
+mode, csv_path, cache_dir = sys.argv[1:4]
+
+def legacy():
+    df = pd.read_csv(csv_path, encoding='euc-kr')
+    df_korea = df[df['Country Name'] == 'Korea, Rep.'].copy()
+    years = [str(y) for y in range(1960, 2023)]
+    gdp_values = df_korea[years].T.reset_index()
+    gdp_values.columns = ['date', 'gdp']
+    gdp_values['date'] = pd.to_datetime(gdp_values['date'], format='%Y')
+    gdp_values['gdp'] = pd.to_numeric(gdp_values['gdp'], errors='coerce')
+    return gdp_values.dropna()
+
+def cached():
+    table = gdp_cache.load_gdp_table(csv_path, cache_dir)
+    table_korea = table.filter(pc.equal(table['country'], 'Korea, Rep.'))
+    return pd.DataFrame({{
+        'date': pd.to_datetime(table_korea['year'].to_numpy().astype(str), format='%Y'),
+        'gdp': table_korea['value'].to_numpy(),
+    }}).dropna()
+
+def artifact():
+    table, _ = etl.read_artifact(etl.load_manifest(cache_dir), 'gdp', cache_dir)
+    table_korea = table.filter(pc.equal(table['country'], 'Korea, Rep.'))
+    return pd.DataFrame({{
+        'date': pd.to_datetime(table_korea['year'].to_numpy().astype(str), format='%Y'),
+        'gdp': table_korea['value'].to_numpy(),
+    }}).dropna()
+
+loaders = {{'csv': legacy, 'arrow-build': cached, 'arrow-mmap': cached, 'artifact': artifact}}
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+loaders[mode]()
+elapsed = time.perf_counter() - start
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{'seconds': elapsed, 'peak_rss_kb': rss_after, 'rss_delta_kb': rss_after - rss_before}}))
+'''
+
+
+def run_child(mode, cache_dir):
+    code = _CHILD.format(root=ROOT)
+    out = subprocess.run(
+        [sys.executable, "-c", code, mode, CSV_PATH, cache_dir],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--cache-dir", default=os.path.join(ROOT, "data", ".cache", "bench"))
+    args = parser.parse_args()
+
+    results = {"csv": [], "arrow-build": [], "arrow-mmap": [], "artifact": []}
+    # 배포 전 빌드 단계에 해당하므로 측정에서 제외하고 한 번만 만든다
+    artifact_dir = tempfile.mkdtemp(prefix="bench-artifacts-")
+    build(artifact_dir, CSV_PATH)
+    for _ in range(args.repeat):
+        results["csv"].append(run_child("csv", args.cache_dir))
+        # 캐시 파일을 지운 상태: 최초 1회 변환 비용 포함
+        for name in os.listdir(args.cache_dir) if os.path.isdir(args.cache_dir) else []:
+            os.remove(os.path.join(args.cache_dir, name))
+        results["arrow-build"].append(run_child("arrow-build", args.cache_dir))
+        # 캐시 파일이 있는 상태: 이후 모든 콜드 스타트/TTL 만료
+        results["arrow-mmap"].append(run_child("arrow-mmap", args.cache_dir))
+        results["artifact"].append(run_child("artifact", artifact_dir))
+    shutil.rmtree(artifact_dir)
+
+    print(f"{'mode':<12} {'median ms':>10} {'peak RSS MB':>12} {'RSS delta MB':>13}")
+    for mode, runs in results.items():
+        print(
+            f"{mode:<12} "
+            f"{statistics.median(r['seconds'] for r in runs) * 1000:>10.2f} "
+            f"{statistics.median(r['peak_rss_kb'] for r in runs) / 1024:>12.1f} "
+            f"{statistics.median(r['rss_delta_kb'] for r in runs) / 1024:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
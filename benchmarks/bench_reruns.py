@@ -0,0 +1,241 @@
+"""
+streamlit_app.py를 AppTest로 헤드리스 실행하며 상호작용별 rerun 비용을 측정합니다.
+
+시나리오: 최초 로드, "연도 선택" 슬라이더 드래그, "이동 통계 보기" 토글, "재해 유형 선택" 변경, 탭 전환.
+시나리오마다 rerun 지연(p50/p95), rerun 중 최대 추가 할당(tracemalloc), 프로세스 최대 RSS를 기록하고,
+`--json`으로 결과를 저장해 시간에 따른 회귀를 추적할 수 있습니다.
+
+각 앱은 별도 프로세스에서 실행됩니다. `--compare REF`를 주면 해당 git 리비전의 streamlit_app.py와 나란히 비교합니다.
+
+    $ python benchmarks/bench_reruns.py --iterations 20 --json bench_output.json
+    $ python benchmarks/bench_reruns.py --compare HEAD~1
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "streamlit_app.py")
+
+YEAR_SLIDER = "연도 선택"
+# 이전 리비전과 비교할 수 있도록 예전 라벨도 함께 찾음 (str.startswith는 튜플을 받음)
+SMOOTHING_CHECKBOX = ("이동 통계 보기", "이동 평균 보기")
+EVENT_MULTISELECT = "재해 유형 선택"
+TAB_KEY = "active_tab"
+TAB_LABELS = ("공식 공개 데이터 대시보드", "사용자 입력 데이터 대시보드")
+
+
+def _timed_run(at):
+    """rerun 1회의 소요 시간과 rerun 중 최대 추가 할당 바이트. 앱 예외는 error로 기록."""
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    sample = {"seconds": elapsed, "alloc_bytes": peak - baseline}
+    if at.exception:
+        sample["error"] = at.exception[0].value.splitlines()[0]
+    return sample
+
+
+def _widget(widgets, label):
+    """label로 시작하는 첫 위젯 (라벨의 괄호 설명 등이 바뀌어도 찾을 수 있도록)."""
+    for widget in widgets:
+        if widget.label.startswith(label):
+            return widget
+    raise LookupError(f"widget {label!r} not found")
+
+
+def _new_session(app_path):
+    from streamlit.testing.v1 import AppTest
+
+    return AppTest.from_file(app_path, default_timeout=120)
+
+
+def scenario_initial_load(app_path, iterations):
+    """새 세션의 첫 실행 (프로세스 수준 캐시는 데워진 상태)."""
+    return [_timed_run(_new_session(app_path)) for _ in range(iterations)]
+
+
+def scenario_slider_drag(at, iterations):
+    """끝 연도를 한 칸씩 줄였다가 다시 늘리는 드래그 (되돌아올 때 같은 값 재방문)."""
+    slider = _widget(at.sidebar.slider, YEAR_SLIDER)
+    lo, hi = slider.min, slider.max
+    half = max(iterations // 2, 1)
+    ends = [max(hi - step, lo) for step in range(1, half + 1)]
+    ends += ends[::-1]
+    samples = []
+    for end in ends[:iterations]:
+        _widget(at.sidebar.slider, YEAR_SLIDER).set_range(lo, end)
+        samples.append(_timed_run(at))
+    return samples
+
+
+def scenario_smoothing_toggle(at, iterations):
+    samples = []
+    for _ in range(iterations):
+        checkbox = _widget(at.sidebar.checkbox, SMOOTHING_CHECKBOX)
+        checkbox.set_value(not checkbox.value)
+        samples.append(_timed_run(at))
+    return samples
+
+
+def scenario_event_multiselect(at, iterations):
+    events = list(_widget(at.sidebar.multiselect, EVENT_MULTISELECT).options)
+    samples = []
+    for i in range(iterations):
+        _widget(at.sidebar.multiselect, EVENT_MULTISELECT).set_value(events[: 1 + i % len(events)])
+        samples.append(_timed_run(at))
+    return samples
+
+
+def scenario_tab_switch(at, iterations):
+    samples = []
+    for i in range(iterations):
+        at.session_state[TAB_KEY] = TAB_LABELS[(i + 1) % len(TAB_LABELS)]
+        samples.append(_timed_run(at))
+    at.session_state[TAB_KEY] = TAB_LABELS[0]
+    return samples
+
+
+def run_scenarios(app_path, iterations):
+    tracemalloc.start()
+    at = _new_session(app_path)
+    results = {"cold_start": [_timed_run(at)]}
+    results["initial_load"] = scenario_initial_load(app_path, iterations)
+    for name, scenario in (
+        ("slider_drag", scenario_slider_drag),
+        ("smoothing_toggle", scenario_smoothing_toggle),
+        ("event_multiselect", scenario_event_multiselect),
+        ("tab_switch", scenario_tab_switch),
+    ):
+        try:
+            results[name] = scenario(at, iterations)
+        except LookupError as e:
+            # 비교 대상 리비전에 해당 위젯이 없는 경우
+            results[name] = [{"seconds": 0.0, "alloc_bytes": 0, "error": str(e)}]
+        # 실패한 시나리오가 세션 상태를 망가뜨려도 다음 시나리오는 새 세션에서 시작
+        if any("error" in sample for sample in results[name]):
+            at = _new_session(app_path)
+            _timed_run(at)
+    return {
+        "scenarios": results,
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def summarize(samples):
+    ok = [s for s in samples if "error" not in s]
+    summary = {"runs": len(samples), "errors": len(samples) - len(ok)}
+    if ok:
+        seconds = sorted(s["seconds"] for s in ok)
+        summary.update({
+            "p50_ms": statistics.median(seconds) * 1000,
+            "p95_ms": (statistics.quantiles(seconds, n=100, method="inclusive")[94] if len(seconds) > 1 else seconds[0]) * 1000,
+            "alloc_p50_kib": statistics.median(s["alloc_bytes"] for s in ok) / 1024,
+        })
+    errors = sorted({s["error"] for s in samples if "error" in s})
+    if errors:
+        summary["error_messages"] = errors
+    return summary
+
+
+def _materialize(ref):
+    """git 리비전의 앱 파일을 저장소 루트에 임시로 꺼낸다 (상대 경로 데이터/모듈 import 유지)."""
+    source = subprocess.run(
+        ["git", "show", f"{ref}:streamlit_app.py"],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout
+    path = os.path.join(ROOT, f".bench_app_{abs(hash(ref)):x}.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source)
+    return path
+
+
+def _run_child(app_path, iterations):
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", app_path, "--iterations", str(iterations)],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, check=True, capture_output=True, text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_report(report):
+    print(f"{'app':<12} {'scenario':<18} {'runs':>5} {'p50 ms':>9} {'p95 ms':>9} {'alloc KiB':>10} {'peak RSS MB':>12}")
+    for app, result in report["apps"].items():
+        rss_mb = result["peak_rss_kb"] / 1024
+        for name, summary in result["summary"].items():
+            if "p50_ms" in summary:
+                print(
+                    f"{app:<12} {name:<18} {summary['runs']:>5} {summary['p50_ms']:>9.1f} "
+                    f"{summary['p95_ms']:>9.1f} {summary['alloc_p50_kib']:>10.1f} {rss_mb:>12.1f}"
+                )
+            for message in summary.get("error_messages", []):
+                print(f"{app:<12} {name:<18} error: {message}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--compare", metavar="REF", help="비교할 git 리비전")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_scenarios(args.child, args.iterations)))
+        return
+
+    import streamlit
+
+    apps = {"worktree": APP_PATH}
+    if args.compare:
+        apps = {args.compare: _materialize(args.compare), **apps}
+    try:
+        raw = {name: _run_child(path, args.iterations) for name, path in apps.items()}
+    finally:
+        for path in apps.values():
+            if path != APP_PATH:
+                os.remove(path)
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "iterations": args.iterations,
+        "apps": {
+            name: {
+                "peak_rss_kb": result["peak_rss_kb"],
+                "summary": {scenario: summarize(samples) for scenario, samples in result["scenarios"].items()},
+                "samples": result["scenarios"],
+            }
+            for name, result in raw.items()
+        },
+    }
+    _print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
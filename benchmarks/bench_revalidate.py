@@ -0,0 +1,94 @@
+"""
+기후 데이터 캐시 만료 후 재수집 비용: 무조건 다시 받기(기존 TTL 동작) vs. ETag/Last-Modified 조건부 재검증.
+
+`kma_standin.py`의 로컬 HTTP 스탠드인을 써서 네 단계를 차례로 실행하고, 단계마다 소요 시간, 응답 코드별 횟수,
+파싱 횟수, 받은 본문 바이트를 출력합니다. 각 단계의 결과가 기대와 다르면 종료 코드 1로 끝납니다.
+
+1. cold: 디스크 캐시가 빈 상태 — 모든 연도 200, 모두 파싱
+2. revalidate: 원본이 그대로 — 모든 연도 304, 파싱 없음
+3. one changed: 스탠드인에서 한 연도만 갱신 — 그 연도만 200 + 파싱, 나머지 304
+4. unconditional: 비교용으로 캐시 없이 다시 받기 — 모든 연도 200, 모두 파싱
+
+    $ python benchmarks/bench_revalidate.py --latency-ms 50
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import dashboard.climate as climate  # noqa: E402
+from dashboard.http_cache import HTTPCache  # noqa: E402
+from kma_standin import serve  # noqa: E402
+
+
+class CountingParse:
+    """parse_monthly_csv 호출 횟수와 파싱한 바이트 수를 센다."""
+
+    def __init__(self, parse):
+        self.parse = parse
+        self.calls = 0
+        self.bytes = 0
+
+    def __call__(self, raw, *args, **kwargs):
+        self.calls += 1
+        self.bytes += len(raw)
+        return self.parse(raw, *args, **kwargs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--years", type=int, nargs=2, default=(2000, 2023), metavar=("FIRST", "LAST"))
+    args = parser.parse_args()
+
+    years = range(args.years[0], args.years[1] + 1)
+    server = serve(latency=args.latency_ms / 1000, years=years)
+    url = f"http://127.0.0.1:{server.server_port}/"
+    counting = CountingParse(climate.parse_monthly_csv)
+    climate.parse_monthly_csv = counting
+
+    n = len(years)
+    expected = {
+        "cold": ({200: n}, n),
+        "revalidate": ({304: n}, 0),
+        "one changed": ({200: 1, 304: n - 1}, 1),
+        "unconditional": ({200: n}, n),
+    }
+    failures = []
+    print(f"{len(years)} yearly files, {args.latency_ms:.0f} ms per request")
+    print(f"{'step':<14} {'ms':>8} {'200':>5} {'304':>5} {'parsed':>7} {'parsed KiB':>11} {'rows':>6}")
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = HTTPCache(cache_dir)
+            for step, (expected_status, expected_parsed) in expected.items():
+                if step == "one changed":
+                    server.bump(years[-1])
+                server.status_counts.clear()
+                counting.calls = counting.bytes = 0
+                start = time.perf_counter()
+                df = climate.fetch_climate(url, years, http_cache=None if step == "unconditional" else cache)
+                ms = (time.perf_counter() - start) * 1000
+                status = dict(server.status_counts)
+                print(
+                    f"{step:<14} {ms:>8.1f} {status.get(200, 0):>5} {status.get(304, 0):>5} "
+                    f"{counting.calls:>7} {counting.bytes / 1024:>11.1f} {len(df):>6}"
+                )
+                if status != expected_status or counting.calls != expected_parsed:
+                    failures.append(f"{step}: expected {expected_status} / {expected_parsed} parsed, "
+                                    f"got {status} / {counting.calls} parsed")
+            print(f"http cache: hits={cache.hits} misses={cache.misses}")
+    finally:
+        server.shutdown()
+
+    for failure in failures:
+        print("FAIL", failure)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
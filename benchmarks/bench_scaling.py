@@ -0,0 +1,319 @@
+"""
+데이터 크기(10² ~ 10⁷행)에 따른 대시보드 단계별 비용.
+
+`dashboard.synthetic`으로 크기별 합성 데이터(GDP 시계열, 기후 월별 자료, 재해 행)를 만들어, 탭이 실제로 호출하는
+코드 경로에 그대로 넣습니다. 단계마다 소요 시간(최솟값)과 최대 추가 할당(tracemalloc)을 재고,
+가장 큰 두 크기 사이의 로그-로그 기울기(1이면 선형)로 초선형으로 커지는 단계를 표시합니다.
+
+- 공식 데이터 탭: `TimeSeries` 생성, 연도 범위 필터(가운데 절반), 이동 통계 4종(첫 계산), 두 Plotly 빌더, 표, CSV
+- 기후 구간: 연도 범위 필터, `build_climate_chart`
+- 사용자 데이터 탭: 재해 유형 필터, `groupby('region')` 집계, 세 Plotly 빌더, 표, CSV
+
+Figure는 앱과 같이 `FigureCache` 미스 경로(빌드)로 재고, 표는 `st.dataframe`과 같이
+15만 행을 넘으면 첫 페이지만, 아니면 전체를 Arrow 바이트로 직렬화합니다. 세 탭의 데이터는 차례로 만들고 버립니다.
+
+건너뛰는 경우 (표에는 `-`, 이유는 마지막 "skipped" 목록에)
+- 한 크기에서 --budget-s를 넘긴 단계: 더 큰 크기 전부
+- 직전 크기의 최대 할당을 선형 외삽한 값이 사용 가능한 메모리를 넘는 단계: 그 크기부터 (OOM으로 전체가 죽지 않도록)
+- tracemalloc을 켠 측정이 --budget-s를 넘을 만큼 느린 단계: 메모리 측정만
+tracemalloc은 pyarrow 메모리 풀 할당을 세지 않으므로 표 직렬화의 메모리는 과소 측정됩니다.
+
+    $ python benchmarks/bench_scaling.py --max-rows 1000000
+    $ python benchmarks/bench_scaling.py --json scaling.json --plot scaling.png
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+from functools import partial
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dashboard import synthetic  # noqa: E402
+from dashboard.export import export_bytes  # noqa: E402
+from dashboard.figures import (  # noqa: E402
+    FigureCache,
+    build_climate_chart,
+    build_gdp_bar,
+    build_gdp_line,
+    build_rain_detail_bar,
+    build_region_pie,
+    build_user_bar,
+)
+from dashboard.rolling import ROLLING_METHODS  # noqa: E402
+from dashboard.timeseries import TimeSeries  # noqa: E402
+
+DEFAULT_SIZES = [10 ** k for k in range(2, 8)]
+# 기후 자료는 지점당 이 개월 수(100년)까지만 쓰고, 나머지 행은 지점 수로 채움
+CLIMATE_MONTHS = 1200
+# 가장 큰 두 크기 사이 기울기가 이보다 크면 초선형으로 표시
+SUPERLINEAR_SLOPE = 1.15
+# 이보다 짧은 측정은 잡음이 커서 기울기 계산에서 제외
+MIN_SLOPE_MS = 1.0
+# tracemalloc을 켜면 파이썬 객체를 많이 만드는 단계가 이만큼까지 느려짐 — 메모리 측정도 --budget-s 안에 들도록 생략
+TRACE_OVERHEAD = 20
+# 직전 크기의 최대 할당을 행 수에 비례해 늘린 값의 이 배수가 사용 가능한 메모리보다 크면 건너뜀
+# (tracemalloc에 안 잡히는 할당과 단편화 몫)
+MEMORY_HEADROOM = 2
+# (빈도, 연간 포인트 수): 행 수가 60년 안에 들어가는 가장 긴 간격을 고름
+FREQUENCIES = (("YS", 1), ("MS", 12), ("D", 365.25), ("h", 8766), ("min", 525960))
+
+
+def gdp_freq(rows):
+    for freq, per_year in FREQUENCIES:
+        if rows / per_year <= 60:
+            return freq
+    return FREQUENCIES[-1][0]
+
+
+def middle_half(series):
+    """슬라이더를 가운데 절반 연도로 옮긴 선택 범위."""
+    span = series.year_max - series.year_min
+    return series.year_min + span // 4, series.year_max - span // 4
+
+
+def figure(builder, df):
+    """cached_figure의 캐시 미스 경로."""
+    return FigureCache(maxsize=1).get_or_build((builder.__name__,), partial(builder, df, None))
+
+
+def dataframe_bytes(df):
+    """st.dataframe이 프런트엔드로 보내는 Arrow 바이트 (큰 프레임은 첫 페이지만 보내는 지연 전송)."""
+    from streamlit import dataframe_util
+    from streamlit.dataframe import lazy_df_source
+
+    source = lazy_df_source.resolve_lazy_source(df, None, is_selection_activated=False)
+    if source is None:
+        return dataframe_util.convert_pandas_df_to_arrow_bytes(df)
+    return dataframe_util.convert_arrow_table_to_arrow_bytes(source.load_rows(0, lazy_df_source.DEFAULT_PAGE_SIZE))
+
+
+def public_stages(rows):
+    """(단계 이름, 준비 함수, 측정 함수) 목록 — 준비는 측정하지 않고, 준비 결과를 측정 함수에 넘긴다."""
+    gdp = synthetic.gdp_frame(periods=rows, start="1960", freq=gdp_freq(rows))
+    public = TimeSeries(gdp)
+    selected = middle_half(public)
+    filtered = public.slice_years(*selected)
+    smoothed = public.rolling_slice(*selected, "mean", 3)
+
+    result = [
+        ("public:load", lambda: gdp, TimeSeries),
+        ("public:filter", lambda: public, lambda s: s.slice_years(*selected)),
+    ]
+    for method in ROLLING_METHODS:
+        # 누적합은 열마다 첫 계산 때 만들어지므로 매번 새 TimeSeries에서 잼
+        result.append((f"public:rolling:{method}", lambda: TimeSeries(gdp),
+                       lambda s, method=method: s.rolling_slice(*selected, method, 3)))
+    return result + [
+        ("figure:build_gdp_line", lambda: smoothed, partial(figure, build_gdp_line)),
+        ("figure:build_gdp_bar", lambda: filtered, partial(figure, build_gdp_bar)),
+        ("public:dataframe", lambda: filtered, dataframe_bytes),
+        ("public:to_csv", lambda: filtered, partial(export_bytes, fmt="csv")),
+    ]
+
+
+def climate_stages(rows):
+    climate = TimeSeries(synthetic.climate_frame(months=min(rows, CLIMATE_MONTHS),
+                                                 stations=max(1, rows // CLIMATE_MONTHS)))
+    filtered = climate.slice_years(*middle_half(climate))
+    return [
+        ("climate:filter", lambda: climate, lambda s: s.slice_years(*middle_half(s))),
+        ("figure:build_climate_chart", lambda: filtered, partial(figure, build_climate_chart)),
+    ]
+
+
+def user_stages(rows):
+    user = TimeSeries(synthetic.events_frame(rows=rows)).frame
+    selected_events = list(user['event'].unique())
+    filtered = user[user['event'].isin(selected_events)]
+    return [
+        ("user:filter", lambda: user, lambda df: df[df['event'].isin(selected_events)]),
+        # build_region_pie 안의 집계만 따로
+        ("user:groupby_region", lambda: filtered,
+         lambda df: df[df['region'] != '전국'].groupby('region')['value'].sum().reset_index()),
+        ("figure:build_user_bar", lambda: filtered, partial(figure, build_user_bar)),
+        ("figure:build_region_pie", lambda: filtered, partial(figure, build_region_pie)),
+        ("figure:build_rain_detail_bar", lambda: filtered[filtered['event'] == '전국 폭우'],
+         partial(figure, build_rain_detail_bar)),
+        ("user:dataframe", lambda: filtered, dataframe_bytes),
+        ("user:to_csv", lambda: filtered, partial(export_bytes, fmt="csv")),
+    ]
+
+
+# 10⁷행에서는 세 데이터를 함께 들고 있으면 메모리가 부족하므로 탭마다 만들고 버림
+TABS = (public_stages, climate_stages, user_stages)
+
+
+def available_mib():
+    """사용 가능한 물리 메모리(MiB), 알 수 없으면 None (리눅스 /proc/meminfo)."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def projected_mib(entry, rows):
+    """가장 큰 측정 크기의 최대 할당을 rows행으로 선형 외삽한 값 (측정이 없으면 None)."""
+    if not entry["mib"]:
+        return None
+    measured = max(entry["mib"])
+    return entry["mib"][measured] * rows / measured * MEMORY_HEADROOM
+
+
+def measure_time(setup, run, repeat):
+    """최솟값(초). 한 번에 1초를 넘으면 반복하지 않음."""
+    best = math.inf
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        run(arg)
+        best = min(best, time.perf_counter() - start)
+        if best > 1.0:
+            break
+    return best
+
+
+def measure_memory(setup, run):
+    """run 실행 중 최대 추가 할당 바이트 (준비 단계의 할당은 제외)."""
+    arg = setup()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    run(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - baseline
+
+
+def slope(sizes, values, floor=0.0):
+    """값이 있는 가장 큰 두 크기 사이의 로그-로그 기울기 (측정이 부족하거나 floor보다 작으면 None)."""
+    points = [(n, v) for n, v in zip(sizes, values) if v is not None and v > floor]
+    if len(points) < 2:
+        return None
+    (n0, v0), (n1, v1) = points[-2:]
+    return math.log(v1 / v0) / math.log(n1 / n0)
+
+
+def warm_up(rows=100):
+    """첫 호출에만 드는 비용(지연 임포트, Plotly 템플릿 로드 등)이 가장 작은 크기에 섞이지 않도록 한 번 돌려 둠."""
+    for tab in TABS:
+        for _, setup, func in tab(rows):
+            func(setup())
+    synthetic.clear_cache()
+
+
+def run(sizes, repeat, budget_s, memory, verbose=False):
+    warm_up()
+    results = {}
+    skipped = {}
+    for rows in sizes:
+        started = time.perf_counter()
+        for tab in TABS:
+            for name, setup, func in tab(rows):
+                entry = results.setdefault(name, {"ms": {}, "mib": {}})
+                if name in skipped:
+                    continue
+                projected, available = projected_mib(entry, rows), available_mib()
+                if projected is not None and available is not None and projected > available:
+                    skipped[name] = (f"{rows:.0e} rows: projected {projected:,.0f} MiB "
+                                     f"> {available:,.0f} MiB available")
+                    continue
+                seconds = measure_time(setup, func, repeat)
+                entry["ms"][rows] = seconds * 1000
+                if memory and seconds * TRACE_OVERHEAD <= budget_s:
+                    entry["mib"][rows] = measure_memory(setup, func) / 2 ** 20
+                if seconds > budget_s:
+                    skipped[name] = f"above {rows:.0e} rows: {seconds:.1f}s > --budget-s {budget_s:g}"
+                if verbose:
+                    print(f"  {rows:>10,} {name:<30} {seconds * 1000:>10.1f} ms", file=sys.stderr)
+            synthetic.clear_cache()
+            gc.collect()
+        print(f"  {rows:>10,} rows done in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return results, skipped
+
+
+def _cell(value, fmt):
+    return f"{'-':>10}" if value is None else f"{value:>10{fmt}}"
+
+
+def print_table(results, sizes, key, title, fmt, floor):
+    print(f"\n{title}")
+    header = " ".join(f"{n:>10.0e}" for n in sizes)
+    print(f"{'stage':<30} {header} {'slope':>6}")
+    for name, entry in results.items():
+        values = [entry[key].get(n) for n in sizes]
+        s = slope(sizes, values, floor)
+        flag = "  superlinear" if s is not None and s > SUPERLINEAR_SLOPE else ""
+        cells = " ".join(_cell(v, fmt) for v in values)
+        print(f"{name:<30} {cells} {'' if s is None else f'{s:>6.2f}'}{flag}")
+
+
+def plot(results, sizes, path):
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print(f"matplotlib is not installed; skipping {path}", file=sys.stderr)
+        return
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    for ax, key, label in ((axes[0], "ms", "time (ms)"), (axes[1], "mib", "peak allocation (MiB)")):
+        # 단계가 19개라 기본 10색 순환으로는 곡선이 겹쳐 보임
+        for i, (name, entry) in enumerate(results.items()):
+            points = [(n, entry[key][n]) for n in sizes if entry[key].get(n)]
+            if points:
+                ax.plot(*zip(*points), marker="o", color=plt.cm.tab20(i % 20),
+                        linestyle="--" if name.startswith("figure:") else "-", label=name)
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_xlabel("rows")
+        ax.set_ylabel(label)
+        ax.grid(True, which="both", alpha=0.3)
+    axes[1].legend(fontsize=7, loc="upper left")
+    fig.tight_layout()
+    fig.savefig(path, dpi=120)
+    print(f"wrote {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="행 수 목록")
+    parser.add_argument("--max-rows", type=int, help="이보다 큰 크기는 생략")
+    parser.add_argument("--repeat", type=int, default=3, help="단계마다 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--budget-s", type=float, default=30, help="이 시간을 넘긴 단계는 더 큰 크기에서 건너뜀")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 측정 생략 (시간만)")
+    parser.add_argument("--verbose", action="store_true", help="단계마다 진행 상황 출력")
+    parser.add_argument("--json", help="결과를 JSON으로 저장")
+    parser.add_argument("--plot", help="시간/메모리 곡선을 PNG로 저장 (matplotlib 필요)")
+    args = parser.parse_args()
+
+    sizes = sorted(n for n in args.sizes if args.max_rows is None or n <= args.max_rows)
+    results, skipped = run(sizes, args.repeat, args.budget_s, not args.no_memory, args.verbose)
+
+    print_table(results, sizes, "ms", "time (ms, min of runs)", ".1f", MIN_SLOPE_MS)
+    if not args.no_memory:
+        print_table(results, sizes, "mib", "peak allocation (MiB)", ".2f", 0.0)
+    if skipped:
+        print("\nskipped")
+        for name, reason in skipped.items():
+            print(f"{name:<30} {reason}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"sizes": sizes, "stages": results, "skipped": skipped}, f, indent=2)
+        print(f"wrote {args.json}")
+    if args.plot:
+        plot(results, sizes, args.plot)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+TTL 만료와 일시적 장애 때의 기후 데이터 로드: 만료 시 호출한 요청에서 다시 받기(기존 TTL 동작) vs. stale-while-revalidate.
+
+`kma_standin.py`의 로컬 HTTP 스탠드인으로 `fetch_climate`를 `StaleWhileRevalidate`에 넣고 단계를 차례로 실행합니다.
+단계마다 `get()`이 걸린 시간, 결과(값/예외), 이전 값과 같은 객체인지를 출력하고, 기대와 다르면 종료 코드 1로 끝납니다.
+값의 나이는 로드를 시작한 시각부터 세므로, --ttl을 주지 않으면 콜드 로드 시간의 2배(최소 1초)로 정해
+fresh 단계가 이미 만료된 값을 보지 않게 합니다.
+
+1. cold: 값이 없음 — 호출한 쪽에서 로드
+2. fresh: ttl 이내 — 보관한 값
+3. expired: ttl이 지남 — 보관한 값을 바로 돌려주고 백그라운드에서 갱신 (비교: 기존 TTL 캐시는 여기서 로드를 기다림)
+4. source down: 스탠드인이 503 — 이전 값을 계속 내보내고 백그라운드 갱신 실패만 기록
+5. past max staleness: 장애가 한도보다 길어짐 — 예외 (한도를 넘긴 값이나 예시 데이터를 내보내지 않음)
+6. recovered: 스탠드인 복구 후 retry_after가 지남 — 다시 로드
+
+    $ python benchmarks/bench_stale.py --latency-ms 100
+"""
+import argparse
+import logging
+import math
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from dashboard.climate import fetch_climate  # noqa: E402
+from dashboard.http_cache import HTTPCache  # noqa: E402
+from dashboard.stale import StaleWhileRevalidate  # noqa: E402
+from kma_standin import serve  # noqa: E402
+
+
+def _wait_refreshed(loader, key, timeout=30):
+    """백그라운드 갱신이 끝날 때까지(값의 나이가 ttl 아래로 돌아올 때까지) 기다린다."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if loader.age(key) < loader.ttl:
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--ttl", type=float, help="기본: 콜드 로드 시간의 2배 (최소 1초)")
+    parser.add_argument("--max-staleness", type=float, help="기본: ttl의 3배")
+    parser.add_argument("--retry-after", type=float, default=0.5)
+    args = parser.parse_args()
+    # 장애 단계의 백그라운드 갱신 실패 경고(트레이스백)는 표의 failures 열로 대신함
+    logging.getLogger("dashboard.stale").setLevel(logging.ERROR)
+
+    server = serve(latency=args.latency_ms / 1000)
+    url = f"http://127.0.0.1:{server.server_port}/"
+    failures = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = HTTPCache(cache_dir)
+        # ttl/max_staleness는 콜드 로드를 잰 뒤 정함 (그 전에는 값이 없어 쓰이지 않음)
+        loader = StaleWhileRevalidate(lambda source: fetch_climate(source, http_cache=cache), ttl=math.inf,
+                                      retry_after=args.retry_after, name="climate")
+        previous = [None]
+        stale_hits = [0]
+
+        def step(name, expect, before=None, same=None, stale_hit=None):
+            if before:
+                before()
+            start = time.perf_counter()
+            try:
+                value, outcome = loader.get(url), "value"
+            except Exception as e:
+                value, outcome = None, f"error ({type(e).__name__})"
+            ms = (time.perf_counter() - start) * 1000
+            reused = value is not None and value is previous[0]
+            print(f"{name:<20} {ms:>9.1f} {outcome:<20} {'yes' if reused else 'no':>5} "
+                  f"{loader.stale_hits:>6} {loader.failures:>9}")
+            if not outcome.startswith(expect):
+                failures.append(f"{name}: expected {expect}, got {outcome}")
+            if same is not None and reused != same:
+                failures.append(f"{name}: expected {'the previous' if same else 'a new'} value")
+            if stale_hit is not None and (loader.stale_hits > stale_hits[0]) != stale_hit:
+                failures.append(f"{name}: expected {'a stale hit' if stale_hit else 'no stale hit'}")
+            stale_hits[0] = loader.stale_hits
+            if value is not None:
+                previous[0] = value
+            return ms
+
+        try:
+            print(f"{'step':<20} {'ms':>9} {'result':<20} {'same':>5} {'stale':>6} {'failures':>9}")
+            cold_ms = step("cold", "value")
+            ttl = args.ttl if args.ttl is not None else max(1.0, 2 * cold_ms / 1000)
+            max_staleness = args.max_staleness if args.max_staleness is not None else 3 * ttl
+            loader.ttl, loader.max_staleness = ttl, max(max_staleness, ttl)
+            print(f"(ttl {ttl:.1f}s, max staleness {loader.max_staleness:.1f}s, {args.latency_ms:.0f} ms per request)")
+            step("fresh", "value", same=True, stale_hit=False)
+            expired_ms = step("expired", "value", lambda: time.sleep(ttl), same=True, stale_hit=True)
+            if not _wait_refreshed(loader, url):
+                failures.append("expired: background refresh did not finish")
+            # 다음 단계의 "same"은 백그라운드 갱신으로 교체된 값과 비교
+            previous[0] = loader.get(url)
+
+            def go_down():
+                server.down = True
+                time.sleep(ttl)
+
+            step("source down", "value", go_down, same=True, stale_hit=True)
+            time.sleep(loader.max_staleness)
+            step("past max staleness", "error")
+
+            def recover():
+                server.down = False
+                time.sleep(args.retry_after)
+
+            step("recovered", "value", recover)
+        finally:
+            server.shutdown()
+
+    print(f"\nexpired request: {expired_ms:.1f} ms with stale-while-revalidate "
+          f"vs. ~{cold_ms:.1f} ms blocking reload with a plain TTL cache")
+    for failure in failures:
+        print("FAIL", failure)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
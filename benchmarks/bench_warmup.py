@@ -0,0 +1,104 @@
+"""
+서버 시작 직후 첫 세션과 TTL 경계에서의 rerun 지연: 예열/미리 갱신 없음 vs. 있음.
+
+기후 데이터는 `kma_standin.py` 스탠드인(요청마다 --latency-ms 지연)에서 받으므로, 캐시 미스가 눈에 띄는 비용이 됩니다.
+
+1. cold start: `streamlit_app.py`(예열 없음)와 `serve.py`(lifespan 예열)를 각각 띄워 health가 응답할 때까지의 시간,
+   첫 세션과 두 번째 세션의 최초 rerun 시간을 비교
+2. ttl boundary: 짧은 주기(--period)로 띄운 서버에서 세션 하나가 --interval마다 rerun을 보내며 경계를 --boundaries번 넘김.
+   lead=0(주기가 지난 뒤 첫 요청이 백그라운드 갱신 시작) vs. lead>0(경계 전에 미리 갱신)의 p50/p95/최대 rerun 시간과
+   느린 rerun(p50보다 --slow-ms 넘게 오래 걸린 rerun) 수
+
+    $ python benchmarks/bench_warmup.py --latency-ms 100
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from kma_standin import serve  # noqa: E402
+from loadtest import ROOT, Session, _free_port, start_server  # noqa: E402
+
+
+async def _first_reruns(port, n):
+    """새 세션 n개를 차례로 열어 각 세션의 최초 rerun 시간(초)."""
+    times = []
+    for i in range(n):
+        session = Session(port, random.Random(i))
+        await session.connect()
+        try:
+            times.append(await session.rerun())
+        finally:
+            await session.close()
+    return times
+
+
+async def _rerun_for(port, duration, interval):
+    session = Session(port, random.Random(0))
+    await session.connect()
+    times = []
+    try:
+        await session.rerun()
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            times.append(await session.rerun())
+            await asyncio.sleep(interval)
+    finally:
+        await session.close()
+    return times
+
+
+def _run_server(app, env, body):
+    port = _free_port()
+    start = time.perf_counter()
+    proc = start_server(os.path.join(ROOT, app), port, env)
+    ready = time.perf_counter() - start
+    try:
+        return ready, asyncio.run(body(port))
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=100, help="스탠드인의 요청당 지연")
+    parser.add_argument("--period", type=int, default=8, help="ttl boundary 단계의 갱신 주기(초)")
+    parser.add_argument("--lead", type=int, default=3, help="미리 갱신할 때 경계보다 앞서는 시간(초)")
+    parser.add_argument("--boundaries", type=int, default=3, help="ttl boundary 단계에서 넘을 경계 수")
+    parser.add_argument("--interval", type=float, default=0.2, help="rerun 사이 간격(초)")
+    parser.add_argument("--slow-ms", type=float, default=200, help="p50보다 이만큼 넘게 걸린 rerun을 느린 rerun으로 셈")
+    args = parser.parse_args()
+
+    standin = serve(latency=args.latency_ms / 1000)
+    env = {"DASHBOARD_CLIMATE_SOURCE": f"http://127.0.0.1:{standin.server_port}/"}
+    try:
+        print("cold start")
+        print(f"{'app':<18} {'ready s':>8} {'1st session ms':>15} {'2nd session ms':>15}")
+        for app in ("streamlit_app.py", "serve.py"):
+            ready, (first, second) = _run_server(app, env, lambda port: _first_reruns(port, 2))
+            print(f"{app:<18} {ready:>8.2f} {first * 1000:>15.1f} {second * 1000:>15.1f}")
+
+        print(f"\nttl boundary (period {args.period}s, {args.boundaries} boundaries, "
+              f"rerun every {args.interval * 1000:.0f} ms)")
+        print(f"{'mode':<18} {'reruns':>7} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'slow':>5}")
+        duration = args.period * args.boundaries
+        for mode, lead in (("lead 0", 0), (f"refresh-ahead {args.lead}s", args.lead)):
+            mode_env = dict(env, DASHBOARD_REFRESH_PERIOD=str(args.period), DASHBOARD_REFRESH_LEAD=str(lead))
+            _, times = _run_server("serve.py", mode_env, lambda port: _rerun_for(port, duration, args.interval))
+            times_ms = sorted(t * 1000 for t in times)
+            p50 = statistics.median(times_ms)
+            p95 = statistics.quantiles(times_ms, n=20, method="inclusive")[-1]
+            slow = sum(1 for t in times_ms if t > p50 + args.slow_ms)
+            print(f"{mode:<18} {len(times_ms):>7} {p50:>8.1f} {p95:>8.1f} {times_ms[-1]:>8.1f} {slow:>5}")
+    finally:
+        standin.shutdown()
+
+
+if __name__ == "__main__":
+    main()
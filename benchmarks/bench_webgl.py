@@ -0,0 +1,65 @@
+"""
+GDP 선 그래프의 SVG(`Scatter`) vs. WebGL(`Scattergl`) 트레이스 비교: 데이터 크기별 Figure 빌드 시간,
+JSON 직렬화 시간, JSON 페이로드 크기.
+
+LTTB 다운샘플링은 끄고(점 예산 = 행 수) 트레이스 종류만 바꿔 측정합니다. "auto"는 앱과 같은
+`WEBGL_THRESHOLD` 기준으로 고른 결과입니다.
+
+    $ python benchmarks/bench_webgl.py
+    $ python benchmarks/bench_webgl.py --sizes 1000 100000 --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from dashboard.figures import WEBGL_THRESHOLD, build_gdp_line  # noqa: E402
+
+MODES = {"svg": None, "webgl": 0, "auto": WEBGL_THRESHOLD}
+
+
+def frame(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "date": pd.date_range("1900-01-01", periods=n, freq="h"),
+        "gdp": np.cumsum(rng.normal(size=n)),
+    })
+
+
+def measure(df, webgl_threshold, repeat):
+    """(빌드 ms, 직렬화 ms, JSON 바이트, 트레이스 종류) — 시간은 중앙값."""
+    build, serialize = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fig = build_gdp_line(df, None, max_points=len(df), webgl_threshold=webgl_threshold)
+        built = time.perf_counter()
+        payload = fig.to_json()
+        build.append(built - start)
+        serialize.append(time.perf_counter() - built)
+    return statistics.median(build) * 1000, statistics.median(serialize) * 1000, len(payload.encode("utf-8")), fig.data[0].type
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"WEBGL_THRESHOLD = {WEBGL_THRESHOLD}")
+    print(f"{'rows':>9} {'mode':<6} {'trace':<10} {'build ms':>9} {'to_json ms':>11} {'JSON KiB':>10}")
+    for n in args.sizes:
+        df = frame(n)
+        for mode, threshold in MODES.items():
+            build_ms, json_ms, size, trace_type = measure(df, threshold, args.repeat)
+            print(f"{n:>9} {mode:<6} {trace_type:<10} {build_ms:>9.1f} {json_ms:>11.1f} {size / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+기상청 월별 CSV를 흉내 내는 로컬 스탠드인 (오프라인 테스트/벤치마크용).
+
+연도마다 `{year}.csv` (euc-kr, 지점 여러 개 × 12개월)를 결정적으로 생성해, 로컬 디렉터리에 쓰거나
+요청마다 지연을 넣은 HTTP 서버로 제공합니다. 앱에서는 `DASHBOARD_CLIMATE_SOURCE`에 디렉터리나 URL을 지정합니다.
+HTTP 서버는 연도별 ETag/Last-Modified를 붙이고 조건부 요청이 일치하면 304로 응답하며,
+`server.bump(year)`로 해당 연도 파일을 "갱신"할 수 있습니다 (`server.status_counts`에 응답 코드별 횟수 기록).
+`server.down = True`이면 모든 요청에 503으로 응답합니다 (일시적 장애 흉내).
+
+    $ python benchmarks/kma_standin.py --write /tmp/kma
+    $ python benchmarks/kma_standin.py --serve --port 8765 --latency-ms 150
+    $ DASHBOARD_CLIMATE_SOURCE=http://127.0.0.1:8765/ streamlit run streamlit_app.py
+"""
+import argparse
+import email.utils
+import math
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STATIONS = {108: "서울", 159: "부산", 133: "대전"}
+HEADER = "지점,지점명,일시,평균기온(°C),평균최고기온(°C),평균최저기온(°C),월합강수량(00~24h만)(mm)"
+
+
+def year_csv(year, stations=STATIONS, revision=0):
+    """연도 하나의 월별 CSV 바이트 (같은 연도·리비전은 항상 같은 내용)."""
+    rng = random.Random(year * 1000 + revision)
+    lines = [HEADER]
+    for station, name in stations.items():
+        for month in range(1, 13):
+            season = math.sin((month - 4) * math.pi / 6)
+            temp = 12.5 + 14 * season + rng.uniform(-1.5, 1.5)
+            rain = max(0.0, 110 + 150 * season + rng.uniform(-60, 60))
+            lines.append(f"{station},{name},{year}-{month:02d},{temp:.1f},{temp + 5:.1f},{temp - 5:.1f},{rain:.1f}")
+    return ("\n".join(lines) + "\n").encode("euc-kr")
+
+
+def write_directory(path, years):
+    os.makedirs(path, exist_ok=True)
+    for year in years:
+        with open(os.path.join(path, f"{year}.csv"), "wb") as f:
+            f.write(year_csv(year))
+
+
+# 모든 파일의 최초 수정 시각 (리비전마다 하루씩 뒤로)
+BASE_MTIME = 1704067200  # 2024-01-01T00:00:00Z
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        name = self.path.split("?")[0].rsplit("/", 1)[-1]
+        stem = name[:-4] if name.endswith(".csv") else ""
+        if not stem.isdigit() or int(stem) not in server.years:
+            self._count(404)
+            self.send_error(404)
+            return
+        year = int(stem)
+        time.sleep(server.latency)
+        if server.down:
+            self._count(503)
+            self.send_error(503)
+            return
+        revision = server.revisions.get(year, 0)
+        etag = f'"{year}-{revision}"'
+        last_modified = email.utils.formatdate(BASE_MTIME + revision * 86400, usegmt=True)
+
+        if self._not_modified(etag, BASE_MTIME + revision * 86400):
+            self._count(304)
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.end_headers()
+            return
+
+        payload = year_csv(year, revision=revision)
+        self._count(200)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv; charset=euc-kr")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _not_modified(self, etag, mtime):
+        # If-None-Match가 있으면 그것만 보고, 없을 때만 If-Modified-Since를 본다 (RFC 9110)
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return etag in (tag.strip() for tag in if_none_match.split(","))
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                return mtime <= email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _count(self, status):
+        with self.server.lock:
+            self.server.status_counts[status] = self.server.status_counts.get(status, 0) + 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency=0.0, years=range(2000, 2024)):
+        super().__init__(address, StandinHandler)
+        self.latency = latency
+        self.years = years
+        self.revisions = {}
+        self.down = False
+        self.status_counts = {}
+        self.lock = threading.Lock()
+
+    def bump(self, year):
+        """연도 파일을 갱신된 것으로 표시 (내용, ETag, Last-Modified가 바뀜)."""
+        with self.lock:
+            self.revisions[year] = self.revisions.get(year, 0) + 1
+
+
+def serve(port=0, latency=0.0, years=range(2000, 2024), addr="127.0.0.1"):
+    """스탠드인 서버를 데몬 스레드로 띄우고 서버 객체를 돌려준다 (`server.server_port`로 포트 확인)."""
+    server = StandinServer((addr, port), latency, years)
+    threading.Thread(target=server.serve_forever, name="kma-standin", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--write", metavar="DIR", help="연도별 CSV를 디렉터리에 씀")
+    parser.add_argument("--serve", action="store_true", help="HTTP 스탠드인 서버 실행")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--years", type=int, nargs=2, default=(2000, 2023), metavar=("FIRST", "LAST"))
+    args = parser.parse_args()
+
+    years = range(args.years[0], args.years[1] + 1)
+    if args.write:
+        write_directory(args.write, years)
+        print(f"wrote {len(years)} files to {args.write}")
+    if args.serve:
+        server = serve(args.port, args.latency_ms / 1000, years)
+        print(f"serving {len(years)} yearly files on http://127.0.0.1:{server.server_port}/")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
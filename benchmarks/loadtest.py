@@ -0,0 +1,366 @@
+"""
+로컬 Streamlit 서버를 띄우고 동시 websocket 세션 N개로 부하를 걸어 동시성에 따른 확장성을 측정합니다.
+
+각 세션은 브라우저 프런트엔드처럼 `/_stcore/stream`에 접속해 BackMsg(rerun_script)를 보내고
+ForwardMsg(script_finished)를 받을 때까지의 시간을 잽니다. 상호작용은 세 가지입니다.
+"연도 선택" 슬라이더 이동(프래그먼트 rerun), "재해 유형 선택" 변경(전체 rerun), 다운로드 버튼 클릭
+(지연 생성 파일 요청 후 미디어 URL에서 본문 수신). 동시 세션 수 단계마다 초당 rerun 수,
+지연 p50/p95/p99, 서버 프로세스 RSS(최대/종료 시점)를 기록합니다. 네트워크 접속 없이 로컬에서만 동작합니다.
+
+    $ python benchmarks/loadtest.py --sessions 1 4 16 32 --duration 20
+    $ python benchmarks/loadtest.py --sessions 8 --think-ms 500 --json loadtest.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "streamlit_app.py")
+
+YEAR_SLIDER = "연도 선택"
+EVENT_MULTISELECT = "재해 유형 선택"
+DOWNLOAD_BUTTON = "처리된 데이터 다운로드"
+ACTIONS = ("slider", "multiselect", "download")
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _rss_kb(pid):
+    """/proc에서 읽은 서버 프로세스의 현재 RSS (KiB)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def start_server(app_path, port, env=None):
+    """헤드리스 streamlit 서버를 띄우고 health 엔드포인트가 응답할 때까지 기다린다 (env: 추가 환경 변수)."""
+    env = dict(os.environ, DASHBOARD_METRICS_PORT="0", **(env or {}))
+    # 파이프를 읽지 않으면 서버 로그가 쌓여 프로세스가 멈출 수 있으므로 임시 파일로 받는다.
+    log = tempfile.TemporaryFile()
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", app_path,
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--server.address", "127.0.0.1",
+            "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=ROOT, env=env, stdout=log, stderr=subprocess.STDOUT,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            log.seek(0)
+            raise RuntimeError(f"streamlit exited early:\n{log.read().decode(errors='replace')}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as resp:
+                if resp.read() == b"ok":
+                    return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("streamlit server did not become healthy within 60s")
+
+
+class Session:
+    """websocket 세션 하나. 화면에 그려진 위젯을 추적하고, 바꾼 위젯 상태를 매 rerun마다 모두 보낸다."""
+
+    def __init__(self, port, rng):
+        self.port = port
+        self.rng = rng
+        self.ws = None
+        self.session_id = None
+        self.widgets = {}
+        self.states = {}
+        self.errors = []
+        self._finished = None
+        self._pending_ops = {}
+        self._reader = None
+
+    async def connect(self):
+        import websockets
+
+        self.ws = await websockets.connect(
+            f"ws://127.0.0.1:{self.port}/_stcore/stream",
+            subprotocols=["streamlit"],
+            max_size=None,
+        )
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def close(self):
+        if self._reader:
+            self._reader.cancel()
+        if self.ws:
+            await self.ws.close()
+
+    async def _read_loop(self):
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        async for raw in self.ws:
+            msg = ForwardMsg()
+            msg.ParseFromString(raw)
+            kind = msg.WhichOneof("type")
+            if kind == "new_session":
+                self.session_id = msg.new_session.initialize.session_id
+            elif kind == "delta":
+                self._on_delta(msg.delta)
+            elif kind == "script_finished":
+                if self._finished and not self._finished.done():
+                    self._finished.set_result(msg.script_finished)
+            elif kind == "backend_operation_response":
+                future = self._pending_ops.pop(msg.backend_operation_response.request_id, None)
+                if future and not future.done():
+                    future.set_result(msg.backend_operation_response)
+
+    def _on_delta(self, delta):
+        if delta.WhichOneof("type") != "new_element":
+            return
+        element_type = delta.new_element.WhichOneof("type")
+        element = getattr(delta.new_element, element_type)
+        if element_type == "exception":
+            self.errors.append(element.message.splitlines()[0] if element.message else element.type)
+        elif getattr(element, "label", None):
+            # 라벨의 괄호 설명(예: 다운로드 형식)이 바뀌어도 찾을 수 있도록 접두어로 찾는다.
+            self.widgets[element.label] = (element_type, element, delta.fragment_id)
+
+    def _widget(self, prefix):
+        for label, widget in self.widgets.items():
+            if label.startswith(prefix):
+                return widget
+        raise LookupError(f"widget {prefix!r} not rendered")
+
+    async def rerun(self, fragment_id=""):
+        """현재 위젯 상태로 rerun을 요청하고 script_finished까지 기다린다. 소요 시간(초)을 돌려준다."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = ""
+        msg.rerun_script.fragment_id = fragment_id
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        self._finished = asyncio.get_running_loop().create_future()
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        await self._finished
+        return time.perf_counter() - start
+
+    def _set_state(self, widget_id, **value):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        state = WidgetState(id=widget_id)
+        for field, v in value.items():
+            target = getattr(state, field)
+            if isinstance(v, list):
+                target.data.extend(v)
+            else:
+                setattr(state, field, v)
+        self.states[widget_id] = state
+
+    async def move_slider(self):
+        _, slider, fragment_id = self._widget(YEAR_SLIDER)
+        start, end = sorted(self.rng.sample(range(int(slider.min), int(slider.max) + 1), 2))
+        self._set_state(slider.id, double_array_value=[float(start), float(end)])
+        return await self.rerun(fragment_id)
+
+    async def change_events(self):
+        _, multiselect, fragment_id = self._widget(EVENT_MULTISELECT)
+        options = list(multiselect.options)
+        picked = self.rng.sample(options, self.rng.randint(1, len(options)))
+        self._set_state(multiselect.id, string_array_value=picked)
+        return await self.rerun(fragment_id)
+
+    async def download(self):
+        """다운로드 버튼 클릭: 지연 생성이면 백엔드 작업으로 URL을 받은 뒤 본문을 끝까지 읽는다."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+
+        _, button, _ = self._widget(DOWNLOAD_BUTTON)
+        start = time.perf_counter()
+        url = button.url
+        if button.deferred_file_id:
+            request_id = f"{self.session_id}-{time.monotonic_ns()}"
+            future = asyncio.get_running_loop().create_future()
+            self._pending_ops[request_id] = future
+            msg = BackMsg()
+            msg.backend_operation_request.request_id = request_id
+            msg.backend_operation_request.session_id = self.session_id
+            msg.backend_operation_request.deferred_file.file_id = button.deferred_file_id
+            await self.ws.send(msg.SerializeToString())
+            response = await future
+            if response.error_msg:
+                raise RuntimeError(response.error_msg)
+            url = response.deferred_file.url
+        await asyncio.to_thread(_fetch, f"http://127.0.0.1:{self.port}{url}")
+        return time.perf_counter() - start
+
+
+def _fetch(url):
+    try:
+        with urllib.request.urlopen(url, timeout=60) as resp:
+            return len(resp.read())
+    except urllib.error.HTTPError as exc:
+        if exc.code != 404:
+            raise
+        # 지연 생성된 파일은 어느 세션에도 묶이지 않아, 다른 세션의 rerun이 두 번 끝나면
+        # 고아 파일 정리에서 지워진다. 동시 부하에서만 드러나므로 별도 오류로 구분한다.
+        raise RuntimeError("deferred download expired before fetch (404)") from None
+
+
+async def _sample_rss(pid, peak, stop):
+    while not stop.is_set():
+        rss = _rss_kb(pid)
+        if rss:
+            peak[0] = max(peak[0], rss)
+        try:
+            await asyncio.wait_for(stop.wait(), 0.2)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _drive(session, deadline, think_s, samples):
+    handlers = {"slider": session.move_slider, "multiselect": session.change_events, "download": session.download}
+    while time.monotonic() < deadline:
+        action = session.rng.choice(ACTIONS)
+        try:
+            seconds = await handlers[action]()
+            samples.append({"action": action, "seconds": seconds})
+        except Exception as exc:  # noqa: BLE001 - 부하 중 실패도 결과로 남긴다
+            samples.append({"action": action, "error": f"{type(exc).__name__}: {exc}"})
+        if think_s:
+            await asyncio.sleep(session.rng.uniform(0, 2 * think_s))
+
+
+async def run_level(port, pid, n_sessions, duration, think_s, seed):
+    """동시 세션 n_sessions개를 열어 최초 로드 후 duration초 동안 상호작용을 반복한다."""
+    sessions = [Session(port, random.Random(seed + i)) for i in range(n_sessions)]
+    peak = [_rss_kb(pid) or 0]
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(_sample_rss(pid, peak, stop))
+    samples = []
+    try:
+        await asyncio.gather(*(s.connect() for s in sessions))
+        initial = await asyncio.gather(*(s.rerun() for s in sessions))
+        samples += [{"action": "initial_load", "seconds": seconds} for seconds in initial]
+        start = time.monotonic()
+        await asyncio.gather(*(_drive(s, start + duration, think_s, samples) for s in sessions))
+        elapsed = time.monotonic() - start
+    finally:
+        stop.set()
+        await sampler
+        await asyncio.gather(*(s.close() for s in sessions), return_exceptions=True)
+    return {
+        "sessions": n_sessions,
+        "elapsed_s": elapsed,
+        "samples": samples,
+        "app_errors": sorted({e for s in sessions for e in s.errors}),
+        "peak_rss_kb": peak[0],
+        "end_rss_kb": _rss_kb(pid),
+    }
+
+
+def _percentile(sorted_values, q):
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    return statistics.quantiles(sorted_values, n=100, method="inclusive")[q - 1]
+
+
+def summarize(level):
+    reruns = [s for s in level["samples"] if s["action"] in ("slider", "multiselect") and "seconds" in s]
+    summary = {
+        "sessions": level["sessions"],
+        "reruns_per_s": len(reruns) / level["elapsed_s"],
+        "errors": sum(1 for s in level["samples"] if "error" in s),
+        "peak_rss_mb": level["peak_rss_kb"] / 1024,
+        "end_rss_mb": (level["end_rss_kb"] or 0) / 1024,
+        "actions": {},
+    }
+    for action in ("initial_load",) + ACTIONS:
+        seconds = sorted(s["seconds"] for s in level["samples"] if s["action"] == action and "seconds" in s)
+        if seconds:
+            summary["actions"][action] = {
+                "count": len(seconds),
+                "p50_ms": statistics.median(seconds) * 1000,
+                "p95_ms": _percentile(seconds, 95) * 1000,
+                "p99_ms": _percentile(seconds, 99) * 1000,
+            }
+    messages = sorted({s["error"] for s in level["samples"] if "error" in s} | set(level["app_errors"]))
+    if messages:
+        summary["error_messages"] = messages
+    return summary
+
+
+def _print_report(report):
+    print(f"{'sessions':>8} {'action':<13} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'reruns/s':>9} {'peak RSS MB':>12} {'end RSS MB':>11}")
+    for summary in report["levels"]:
+        for action, stats in summary["actions"].items():
+            print(
+                f"{summary['sessions']:>8} {action:<13} {stats['count']:>6} {stats['p50_ms']:>9.1f} "
+                f"{stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f} {summary['reruns_per_s']:>9.1f} "
+                f"{summary['peak_rss_mb']:>12.1f} {summary['end_rss_mb']:>11.1f}"
+            )
+        for message in summary.get("error_messages", []):
+            print(f"{summary['sessions']:>8} error: {message}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 16], help="단계별 동시 세션 수")
+    parser.add_argument("--duration", type=float, default=15, help="단계마다 상호작용을 반복할 시간(초)")
+    parser.add_argument("--think-ms", type=float, default=0, help="상호작용 사이 평균 대기 시간 (0이면 포화 부하)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--app", default=APP_PATH, help="부하를 걸 앱 파일")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    import streamlit
+
+    port = _free_port()
+    server = start_server(args.app, port)
+    levels = []
+    try:
+        for n_sessions in args.sessions:
+            level = asyncio.run(run_level(port, server.pid, n_sessions, args.duration, args.think_ms / 1000, args.seed))
+            levels.append({**summarize(level), "samples": level["samples"]})
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "cpu_count": os.cpu_count(),
+        "duration_s": args.duration,
+        "think_ms": args.think_ms,
+        "levels": levels,
+    }
+    _print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
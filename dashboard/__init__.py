@@ -0,0 +1 @@
+"""기후 위기-학업 영향 대시보드의 데이터/성능 지원 모듈."""
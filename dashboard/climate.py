@@ -0,0 +1,132 @@
+"""
+기상청(KMA) 월별 기후 CSV 수집.
+
+기상청 자료는 연도별 파일로 나뉘어 있으므로, 요청한 연도의 파일을 스레드 풀에서 동시에 받아
+한 개의 월별 `date`/`value_temp`/`value_rain` 프레임으로 합칩니다. 연도를 하나씩 순서대로 받으면
+캐시 미스 때마다 (연도 수 × 왕복 지연)만큼 기다려야 하기 때문입니다.
+
+- 원격 소스는 연결 풀을 공유하는 `requests.Session` 하나로 받습니다 (풀 크기 = 동시 작업 수).
+- `source`가 로컬 디렉터리이면 같은 파일 이름으로 디스크에서 읽으므로, 오프라인 테스트나 미러에 쓸 수 있습니다.
+  `python -m http.server`로 띄운 디렉터리나 `benchmarks/kma_standin.py`도 HTTP 소스로 쓸 수 있습니다.
+- `http_cache`(`HTTPCache`)를 넘기면 원격 파일은 ETag/Last-Modified 조건부 요청으로 재검증하고,
+  304이면 저장된 본문의 이전 파싱 결과를 그대로 씁니다 (바뀐 연도만 다시 받고 다시 파싱).
+- `requests`는 원격 소스를 받을 때만 import합니다 (앱 시작 import 비용에 포함되지 않도록).
+
+CSV 형식은 기상청 월별 자료(euc-kr, `지점`, `일시`(YYYY-MM), `평균기온(°C)`, `월합강수량(...)(mm)` 열)를 따르며,
+기온/강수량 열은 이름에 `평균기온`/`강수량`이 들어간 첫 열을 씁니다.
+"""
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+KMA_BASE_URL = "https://data.kma.go.kr/resources/AWS/since_2000_202312/CSV/MONTH/"
+FILE_TEMPLATE = "{year}.csv"
+DEFAULT_YEARS = range(2000, 2024)
+# 서울 (ASOS 108)
+DEFAULT_STATION = 108
+MAX_WORKERS = 8
+TIMEOUT = 30
+
+CLIMATE_COLUMNS = ("date", "value_temp", "value_rain")
+
+
+def is_remote(source):
+    return source.startswith(("http://", "https://"))
+
+
+def year_locations(source, years, template=FILE_TEMPLATE):
+    """{연도: URL 또는 파일 경로}."""
+    names = {year: template.format(year=year) for year in years}
+    if is_remote(source):
+        base = source if source.endswith("/") else source + "/"
+        return {year: base + name for year, name in names.items()}
+    return {year: os.path.join(source, name) for year, name in names.items()}
+
+
+def open_session(pool_size=MAX_WORKERS, retries=2):
+    """동시 작업 수만큼 연결을 재사용하는 세션 (일시적인 5xx/연결 오류는 짧게 재시도)."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.2, status_forcelist=(502, 503, 504), allowed_methods=("GET",))
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def read_location(location, session=None, timeout=TIMEOUT):
+    """URL이면 세션으로 받고, 아니면 디스크에서 읽은 원본 바이트."""
+    if not is_remote(location):
+        with open(location, "rb") as f:
+            return f.read()
+    response = session.get(location, timeout=timeout)
+    response.raise_for_status()
+    return response.content
+
+
+def _column(df, keyword):
+    for name in df.columns:
+        if keyword in str(name):
+            return name
+    raise KeyError(f"no column containing {keyword!r} in {list(df.columns)}")
+
+
+def parse_monthly_csv(raw, station=DEFAULT_STATION, encoding="euc-kr"):
+    """연도 파일 하나를 지점으로 걸러 `date`/`value_temp`/`value_rain` 프레임으로 변환한다."""
+    df = pd.read_csv(io.BytesIO(raw), encoding=encoding)
+    if station is not None and "지점" in df.columns:
+        df = df[pd.to_numeric(df["지점"], errors="coerce") == station]
+    return pd.DataFrame({
+        "date": pd.to_datetime(df[_column(df, "일시")].astype(str), format="%Y-%m"),
+        "value_temp": pd.to_numeric(df[_column(df, "평균기온")], errors="coerce"),
+        "value_rain": pd.to_numeric(df[_column(df, "강수량")], errors="coerce"),
+    })
+
+
+def fetch_climate(source=KMA_BASE_URL, years=DEFAULT_YEARS, station=DEFAULT_STATION,
+                  template=FILE_TEMPLATE, max_workers=MAX_WORKERS, timeout=TIMEOUT, session=None,
+                  http_cache=None):
+    """
+    연도별 파일을 동시에 받아 하나의 월별 프레임(날짜순, 중복 월 제거)으로 합친다.
+    한 연도라도 실패하면 실패한 연도 목록과 함께 RuntimeError를 낸다 (첫 오류를 원인으로 연결).
+    """
+    locations = year_locations(source, years, template)
+    own_session = session is None and is_remote(source)
+    if own_session:
+        session = open_session(max_workers)
+
+    parse = partial(parse_monthly_csv, station=station)
+
+    def fetch(location):
+        if http_cache is not None and is_remote(location):
+            return http_cache.get_parsed(session, location, parse, timeout)
+        return parse(read_location(location, session, timeout))
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="kma-fetch") as pool:
+            futures = {year: pool.submit(fetch, location) for year, location in locations.items()}
+            frames, errors = [], {}
+            for year, future in futures.items():
+                try:
+                    frames.append(future.result())
+                except Exception as e:
+                    errors[year] = e
+    finally:
+        if own_session:
+            session.close()
+
+    if errors:
+        first = next(iter(errors.values()))
+        raise RuntimeError(f"failed to fetch climate data for years {sorted(errors)}: {first}") from first
+    if not frames:
+        return pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in
+                             zip(CLIMATE_COLUMNS, ("datetime64[ns]", "float64", "float64"))})
+    merged = pd.concat(frames, ignore_index=True)
+    merged = merged.drop_duplicates(subset="date", keep="last").sort_values("date", kind="stable")
+    return merged.reset_index(drop=True)
@@ -0,0 +1,69 @@
+"""
+긴 시계열 선 그래프를 위한 LTTB(Largest-Triangle-Three-Buckets) 다운샘플링.
+
+차트 폭(픽셀)보다 훨씬 많은 점을 브라우저로 보내면 페이로드와 렌더링 비용만 커지고 화면은 같으므로,
+Figure를 만들기 전에 트레이스마다 점 예산(`DEFAULT_MAX_POINTS`) 이하로 줄입니다. 첫 점과 끝 점은 유지하고,
+가운데 점들은 버킷으로 나눠 버킷마다 (직전 선택점, 다음 버킷 평균)과 이루는 삼각형 면적이 가장 큰 점을 고릅니다.
+
+버킷 평균은 누적합으로 한 번에, 버킷 안의 면적 계산은 NumPy 벡터 연산으로 처리하며
+직전 선택점에 의존하는 버킷 간 진행만 순차로 돕니다 (반복 횟수 = 점 예산).
+원본 해상도 데이터는 캐시된 `TimeSeries`에 그대로 남아 있으므로, 연도 범위를 좁히면(확대)
+좁아진 구간의 원본에서 다시 샘플링해 세부가 드러납니다.
+"""
+import numpy as np
+
+# 반 폭 차트(약 700px)에서 픽셀당 2점 정도
+DEFAULT_MAX_POINTS = 1500
+
+
+def _as_float(values):
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        values = values.astype("datetime64[ns]").astype(np.int64)
+    return values.astype(np.float64, copy=False)
+
+
+def lttb_indices(x, y, max_points):
+    """LTTB로 고른 점의 위치 배열 (오름차순). 점이 예산 이하이면 전체 위치."""
+    n = len(x)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+    x = _as_float(x)
+    y = _as_float(y)
+
+    # 첫/끝 점을 뺀 가운데 n-2개 점을 max_points-2개 버킷으로 (간격 >= 1이므로 빈 버킷 없음)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+    counts = ends - starts
+    cx = np.concatenate(([0.0], np.cumsum(x)))
+    cy = np.concatenate(([0.0], np.cumsum(y)))
+    # 버킷 i의 세 번째 꼭짓점 = 다음 버킷의 평균 (마지막 버킷은 끝 점)
+    next_x = np.append(((cx[ends] - cx[starts]) / counts)[1:], x[-1])
+    next_y = np.append(((cy[ends] - cy[starts]) / counts)[1:], y[-1])
+
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        ax, ay = x[a], y[a]
+        # 면적의 2배 (상수배는 argmax에 영향 없음)
+        area = np.abs((ax - next_x[i]) * (y[start:end] - ay) - (ax - x[start:end]) * (next_y[i] - ay))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample_xy(x, y, max_points=DEFAULT_MAX_POINTS):
+    """
+    (x, y)에서 결측 y를 빼고 LTTB로 줄인 (x, y) NumPy 배열.
+    예산 이하이면 원본 값을 그대로(복사 없이) 돌려준다.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    finite = ~np.isnan(_as_float(y))
+    if not finite.all():
+        x, y = x[finite], y[finite]
+    if len(x) <= max_points:
+        return x, y
+    idx = lttb_indices(x, y, max_points)
+    return x[idx], y[idx]
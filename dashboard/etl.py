@@ -0,0 +1,200 @@
+"""
+배포 전에 대시보드 데이터를 미리 변환해 두는 오프라인 빌드.
+
+앱이 요청 시점에 하던 변환(euc-kr 디코딩, 와이드 → 롱 포맷, 숫자 변환, 결측 제거, 정렬, 재해 데이터 표준화,
+기상청 연도별 파일 병합)을 한 번만 실행해, 바로 그릴 수 있는 Arrow IPC 파일과 매니페스트로 저장합니다.
+앱은 매니페스트가 있으면 원본 대신 이 파일들을 메모리 매핑으로 읽으므로, 시작 비용이 원본 크기에 비례하지 않습니다.
+
+- 파일 이름에 내용 해시가 들어가므로(`gdp-<sha256 앞 12자리>.arrow`) 같은 이름은 항상 같은 내용입니다.
+- 매니페스트(`manifest.json`)는 모든 파일을 쓴 뒤 마지막에 원자적으로 교체하고, 새 매니페스트와 직전 매니페스트
+  어느 쪽도 가리키지 않는 파일만 지웁니다 (실행 중인 앱이 직전 매니페스트를 읽었거나 그 파일을 메모리 매핑하고 있을 수 있음).
+- 원본 CSV의 mtime/크기 키를 함께 기록해, 빌드 후 CSV가 바뀌면 앱은 그 항목을 무시하고 원본에서 다시 읽습니다.
+
+    $ python -m dashboard.etl build
+    $ python -m dashboard.etl build --climate-source http://127.0.0.1:8765/
+    $ python -m dashboard.etl show
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from dashboard.gdp_cache import cache_key, read_gdp_csv
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_DIR = os.path.join("data", "artifacts")
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT = 1
+GDP_CSV_PATH = os.path.join("data", "gdp_data.csv")
+
+
+def _write_table(table, name, out_dir):
+    """테이블을 Arrow IPC(비압축, 메모리 매핑 가능)로 쓰고 내용 해시로 이름을 붙인 매니페스트 항목을 돌려준다."""
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        digest = hashlib.sha256()
+        with open(tmp_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        sha256 = digest.hexdigest()
+        file_name = f"{name}-{sha256[:12]}.arrow"
+        os.replace(tmp_path, os.path.join(out_dir, file_name))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return {
+        "file": file_name,
+        "sha256": sha256,
+        "rows": table.num_rows,
+        "bytes": os.path.getsize(os.path.join(out_dir, file_name)),
+        "columns": table.schema.names,
+    }
+
+
+def build_gdp(csv_path=GDP_CSV_PATH):
+    return read_gdp_csv(csv_path), {"path": csv_path, "key": cache_key(csv_path)}
+
+
+def build_user_events():
+    from dashboard.events import user_events_frame
+
+    return pa.Table.from_pandas(user_events_frame(), preserve_index=False), {"module": "dashboard.events"}
+
+
+def build_climate(source, years=None):
+    from dashboard.climate import DEFAULT_STATION, DEFAULT_YEARS, fetch_climate
+
+    years = DEFAULT_YEARS if years is None else years
+    df = fetch_climate(source, years)
+    return pa.Table.from_pandas(df, preserve_index=False), {
+        "location": source,
+        "years": [years[0], years[-1]],
+        "station": DEFAULT_STATION,
+    }
+
+
+def build(out_dir=ARTIFACT_DIR, gdp_csv=GDP_CSV_PATH, climate_source=None, climate_years=None):
+    """모든 산출물을 만들고 매니페스트를 쓴 뒤 그 내용을 돌려준다."""
+    os.makedirs(out_dir, exist_ok=True)
+    steps = {
+        "gdp": lambda: build_gdp(gdp_csv),
+        "user_events": build_user_events,
+    }
+    if climate_source:
+        steps["climate"] = lambda: build_climate(climate_source, climate_years)
+
+    artifacts = {}
+    for name, step in steps.items():
+        table, source = step()
+        artifacts[name] = {**_write_table(table, name, out_dir), "source": source}
+        logger.info("built %s: %s rows -> %s", name, artifacts[name]["rows"], artifacts[name]["file"])
+
+    combined = hashlib.sha256("".join(a["sha256"] for _, a in sorted(artifacts.items())).encode()).hexdigest()
+    manifest = {
+        "format": MANIFEST_FORMAT,
+        "version": combined[:16],
+        "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "artifacts": artifacts,
+    }
+    previous = load_manifest(out_dir) or {}
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, os.path.join(out_dir, MANIFEST_NAME))
+
+    # 직전 세대의 파일은 다음 빌드 때 지움 (앱은 매니페스트가 바뀐 뒤 첫 rerun에 새 파일로 옮겨 감)
+    referenced = {a["file"] for a in artifacts.values()}
+    referenced |= {a["file"] for a in previous.get("artifacts", {}).values()}
+    for name in os.listdir(out_dir):
+        if name.endswith(".arrow") and name not in referenced:
+            os.remove(os.path.join(out_dir, name))
+    return manifest
+
+
+def load_manifest(out_dir=ARTIFACT_DIR):
+    """매니페스트 내용 (없거나 형식이 다르면 None → 앱은 원본에서 직접 로드)."""
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("format") != MANIFEST_FORMAT:
+        logger.warning("ignoring artifact manifest with format %r", manifest.get("format"))
+        return None
+    return manifest
+
+
+def _is_stale(entry):
+    """빌드 후 원본 CSV가 바뀌었는지 (원본이 배포되지 않았으면 산출물을 그대로 신뢰)."""
+    source = entry.get("source", {})
+    path = source.get("path")
+    if not path or not os.path.exists(path):
+        return False
+    return cache_key(path) != source.get("key")
+
+
+def read_artifact(manifest, name, out_dir=ARTIFACT_DIR):
+    """
+    (메모리 매핑한 테이블, 버전) — 매니페스트에 없거나, 원본보다 오래되었거나, 파일이 없으면 (None, None).
+    버전은 내용 해시 앞부분이라 캐시 키로 쓸 수 있다.
+    """
+    entry = (manifest or {}).get("artifacts", {}).get(name)
+    if entry is None:
+        return None, None
+    if _is_stale(entry):
+        logger.warning("artifact %s is older than its source; run `python -m dashboard.etl build`", name)
+        return None, None
+    path = os.path.join(out_dir, entry["file"])
+    if not os.path.exists(path):
+        logger.warning("artifact %s listed in the manifest is missing: %s", name, path)
+        return None, None
+    return ipc.open_file(pa.memory_map(path, "r")).read_all(), entry["sha256"][:16]
+
+
+def show(out_dir=ARTIFACT_DIR):
+    manifest = load_manifest(out_dir)
+    if manifest is None:
+        print(f"no manifest in {out_dir}")
+        return 1
+    print(f"version {manifest['version']}  built {manifest['built_at']}")
+    for name, entry in manifest["artifacts"].items():
+        state = "stale" if _is_stale(entry) else "ok"
+        print(f"  {name:<12} {entry['rows']:>8} rows {entry['bytes'] / 1024:>9.1f} KiB  {entry['file']}  [{state}]")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m dashboard.etl", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default=ARTIFACT_DIR, help="산출물 디렉터리")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_parser = commands.add_parser("build", help="산출물과 매니페스트 생성")
+    build_parser.add_argument("--gdp-csv", default=GDP_CSV_PATH)
+    build_parser.add_argument("--climate-source", default=os.environ.get("DASHBOARD_CLIMATE_SOURCE"),
+                              help="기상청 연도별 CSV의 기준 URL 또는 디렉터리 (없으면 기후 산출물 생략)")
+    build_parser.add_argument("--climate-years", type=int, nargs=2, metavar=("FIRST", "LAST"))
+    commands.add_parser("show", help="매니페스트 요약 출력")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.command == "build":
+        years = range(args.climate_years[0], args.climate_years[1] + 1) if args.climate_years else None
+        manifest = build(args.out, args.gdp_csv, args.climate_source, years)
+        print(f"wrote {os.path.join(args.out, MANIFEST_NAME)} (version {manifest['version']})")
+        return 0
+    return show(args.out)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
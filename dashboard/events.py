@@ -0,0 +1,53 @@
+"""
+사용자 입력(기사·연구 자료) 기반 기상 재해별 학교 피해 데이터.
+
+앱(`load_user_data`)과 오프라인 빌드(`python -m dashboard.etl build`)가 같은 변환을 쓰도록 한곳에 둡니다.
+"""
+from datetime import datetime
+
+import pandas as pd
+
+USER_EVENTS = {
+    'event': [
+        '태풍 카눈', '태풍 카눈', '태풍 카눈', '태풍 카눈',
+        '전국 폭우', '전국 폭우', '전국 폭우', '전국 폭우', '전국 폭우', '전국 폭우',
+        '충북 호우', '충북 호우', '충북 호우'
+    ],
+    'year': [
+        2023, 2023, 2023, 2023,
+        2025, 2025, 2025, 2025, 2025, 2025,
+        2023, 2023, 2023
+    ],
+    'region': [
+        '강원', '강원', '강원', '강원',
+        '전국', '전국', '전국', '전국', '전국', '전국',
+        '충북', '충북', '충북'
+    ],
+    'type': [
+        '휴업', '등교시간 조정', '개학 연기', '원격수업',
+        '학사일정 조정', '단축수업', '등교시간 조정', '휴업', '원격수업', '시설 피해',
+        '피해 학교·유치원', '등교시간 조정', '원격수업'
+    ],
+    'value': [
+        5, 1, 2, 2,
+        247, 156, 59, 29, 3, 451,
+        24, 7, 1
+    ],
+    'unit': ['곳'] * 13
+}
+
+
+def user_events_frame(data=USER_EVENTS):
+    """사용자 입력 텍스트를 기반으로 데이터프레임 생성 (`type` → `group`, 연도로 `date` 생성)"""
+    df = pd.DataFrame(data)
+
+    # 2025년 데이터는 가상의 데이터이므로, 오늘 날짜와 비교하여 필터링
+    today = datetime.now()
+    if today.year < 2025:
+        # st.warning("2025년 데이터는 미래 시점의 가상 데이터입니다.")
+        pass # 가상 데이터라도 일단 표시
+
+    # 데이터 표준화: 'date' 컬럼 생성 (연도만 사용)
+    df['date'] = pd.to_datetime(df['year'], format='%Y')
+    df.rename(columns={'type': 'group'}, inplace=True)
+    return df
@@ -0,0 +1,158 @@
+"""
+다운로드 버튼용 내보내기 바이트 생성과 LRU 캐시.
+
+`st.download_button(data=...)`에 바이트 대신 호출 가능한 객체를 넘기면 사용자가 버튼을
+누를 때만 직렬화가 일어납니다. 같은 조건(필터 파라미터)으로 다시 내려받으면 캐시된 바이트를 그대로 돌려줍니다.
+
+다만 지연 생성된 파일은 어느 세션에도 묶이지 않아, 다른 세션의 rerun이 끝날 때마다 도는 고아 파일 정리에서
+클라이언트가 받아 가기 전에 지워질 수 있습니다 (동시 접속이 많을수록 404가 잦음). 그래서 `download_data()`는
+캐시에 있거나 `EAGER_MAX_ROWS` 이하인 프레임은 바이트로 넘기고, 그보다 큰 프레임의 캐시 미스만 지연 생성합니다.
+
+직렬화는 행을 청크 단위로 나눠 임시 파일(일정 크기까지는 메모리, 넘으면 디스크)에 흘려 쓰므로,
+큰 프레임도 "전체 문자열 + 인코딩된 바이트" 두 벌이 동시에 메모리에 올라가지 않습니다.
+"""
+import gzip
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
+from functools import partial
+
+import pyarrow as pa
+
+CHUNK_ROWS = 50_000
+# 이 크기를 넘으면 임시 파일이 메모리에서 디스크로 넘어감
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+# 이 행 수 이하면 캐시 미스여도 rerun 중에 바로 직렬화 (세션에 묶인 파일이라 고아 정리에 지워지지 않음)
+EAGER_MAX_ROWS = 10_000
+
+ExportFormat = namedtuple("ExportFormat", ["label", "extension", "mime"])
+
+EXPORT_FORMATS = {
+    "csv": ExportFormat("CSV", ".csv", "text/csv"),
+    "csv.gz": ExportFormat("CSV, gzip", ".csv.gz", "application/gzip"),
+    "parquet": ExportFormat("Parquet", ".parquet", "application/vnd.apache.parquet"),
+}
+
+
+def iter_csv_chunks(df, chunk_rows=CHUNK_ROWS):
+    """CSV를 청크 단위 바이트로 생성 (첫 청크에만 헤더와 BOM 포함)."""
+    for start in range(0, max(len(df), 1), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        text = chunk.to_csv(index=False, header=start == 0)
+        yield text.encode('utf-8-sig' if start == 0 else 'utf-8')
+
+
+def write_csv(df, sink, chunk_rows=CHUNK_ROWS):
+    for block in iter_csv_chunks(df, chunk_rows):
+        sink.write(block)
+
+
+def write_csv_gz(df, sink, chunk_rows=CHUNK_ROWS):
+    # mtime=0: 같은 데이터면 같은 바이트가 나오도록 (캐시/ETag 친화적)
+    with gzip.GzipFile(fileobj=sink, mode='wb', mtime=0) as gz:
+        write_csv(df, gz, chunk_rows)
+
+
+def write_parquet(df, sink, chunk_rows=CHUNK_ROWS):
+    """청크마다 하나의 row group으로 기록."""
+    import pyarrow.parquet as pq
+
+    writer = None
+    for start in range(0, max(len(df), 1), chunk_rows):
+        table = pa.Table.from_pandas(df.iloc[start:start + chunk_rows], preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(sink, table.schema)
+        writer.write_table(table)
+    writer.close()
+
+
+_WRITERS = {
+    "csv": write_csv,
+    "csv.gz": write_csv_gz,
+    "parquet": write_parquet,
+}
+
+
+def export_file(df, fmt="csv", chunk_rows=CHUNK_ROWS):
+    """df를 fmt 형식으로 직렬화한 임시 파일(읽기 위치 0)을 반환한다."""
+    try:
+        writer = _WRITERS[fmt]
+    except KeyError:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {sorted(_WRITERS)}") from None
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    writer(df, spool, chunk_rows)
+    spool.seek(0)
+    return spool
+
+
+def export_bytes(df, fmt="csv", chunk_rows=CHUNK_ROWS):
+    with export_file(df, fmt, chunk_rows) as spool:
+        return spool.read()
+
+
+def to_csv(df):
+    return export_bytes(df, "csv")
+
+
+class ExportCache:
+    """필터 조건을 키로 내보내기 결과를 보관하는 LRU 캐시 (스레드 안전)."""
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_create(self, key, factory):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # 직렬화는 잠금 밖에서 수행 (동시에 같은 키를 만들면 마지막 결과가 남음)
+        payload = factory()
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return payload
+
+    def peek(self, key):
+        """캐시된 결과, 없으면 None (적중일 때만 세고, 미스는 이어지는 get_or_create/deferred가 셈)."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def deferred(self, key, factory):
+        """`st.download_button(data=...)`에 넘길 지연 생성 콜러블."""
+        return partial(self.get_or_create, key, factory)
+
+    def download_data(self, key, factory, rows, eager_max_rows=EAGER_MAX_ROWS, deferred_factory=None):
+        """
+        `st.download_button(data=...)`에 넘길 값: 캐시에 있거나 rows가 eager_max_rows 이하면 바이트,
+        아니면 지연 생성 콜러블 (key가 None이면 캐시하지 않음).
+        deferred_factory를 주면 클릭 시에는 factory 대신 그것을 호출 (예: 클릭 시 직렬화만 따로 계측하는 래퍼).
+        """
+        deferred_factory = factory if deferred_factory is None else deferred_factory
+        if key is None:
+            return factory() if rows <= eager_max_rows else deferred_factory
+        payload = self.peek(key)
+        if payload is not None:
+            return payload
+        if rows <= eager_max_rows:
+            return self.get_or_create(key, factory)
+        return self.deferred(key, deferred_factory)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
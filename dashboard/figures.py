@@ -0,0 +1,180 @@
+"""
+대시보드 Plotly 차트 빌더와 직렬화된 Figure 캐시.
+
+빌더는 (필터된 데이터, 폰트 이름)만으로 Figure를 만드는 순수 함수입니다. 모든 빌더는 마지막에
+`finish_figure`를 거치며, 여기서 공통 레이아웃(폰트 등)을 적용하고 점이 `WEBGL_THRESHOLD`보다 많은
+scatter 트레이스를 WebGL(`Scattergl`)로 바꿉니다 (SVG는 수천 점을 넘으면 브라우저에서 느려짐).
+`FigureCache`는 (빌더 이름, 데이터 버전, 필터 입력, 폰트)를 키로 만든 Figure 객체를 그대로 보관하므로,
+같은 조건의 rerun이나 같은 선택을 한 다른 세션은 plotly express로 다시 만들지 않고 같은 Figure를 받습니다
+(JSON에서 복원하면 속성 검증을 전부 다시 거쳐, 적중 비용이 빌드 비용에 가까워짐).
+`st.plotly_chart`는 받은 Figure를 `to_dict()` 복사본으로만 직렬화하므로 공유해도 안전합니다 — 호출자는 반환된 Figure를 수정하지 않습니다.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import plotly.express as px
+import plotly.graph_objects as go
+
+from dashboard.downsample import DEFAULT_MAX_POINTS, downsample_xy
+
+# 트레이스당 점이 이보다 많으면 WebGL로 그림 (plotly express render_mode="auto"와 같은 기준)
+WEBGL_THRESHOLD = int(os.environ.get("DASHBOARD_WEBGL_THRESHOLD", "1000"))
+
+
+def _font(font_name):
+    return dict(family=font_name) if font_name else None
+
+
+def _webgl(trace):
+    """scatter 트레이스와 같은 속성의 Scattergl 트레이스."""
+    spec = trace.to_plotly_json()
+    spec.pop("type", None)
+    return go.Scattergl(spec)
+
+
+def finish_figure(fig, font_name, webgl_threshold=WEBGL_THRESHOLD, **layout):
+    """
+    모든 차트 빌더가 공통으로 거치는 마무리 단계: 폰트/레이아웃 적용,
+    점이 webgl_threshold보다 많은 scatter 트레이스는 Scattergl로 교체 (None이면 교체하지 않음).
+    """
+    fig.update_layout(font=_font(font_name), **layout)
+    if webgl_threshold is None:
+        return fig
+    large = [
+        trace.type == "scatter" and trace.x is not None and len(trace.x) > webgl_threshold
+        for trace in fig.data
+    ]
+    if not any(large):
+        return fig
+    # Figure.data에는 기존 트레이스만 다시 넣을 수 있으므로, 비운 뒤 순서대로 다시 추가
+    # (레이아웃을 다시 검증하는 새 Figure 생성보다 훨씬 저렴)
+    data = [_webgl(trace) if swap else trace for trace, swap in zip(fig.data, large)]
+    fig.data = ()
+    fig.add_traces(data)
+    return fig
+
+
+# --- 탭 1: 공식 공개 데이터 ---
+def build_gdp_line(df, font_name, max_points=DEFAULT_MAX_POINTS, webgl_threshold=WEBGL_THRESHOLD):
+    # 트레이스마다 LTTB로 점 예산 이하로 줄여서 보냄 (예산 이하이면 원본 그대로)
+    def xy(column):
+        return downsample_xy(df['date'].to_numpy(), df[column].to_numpy(), max_points)
+
+    fig = go.Figure()
+    x, y = xy('gdp')
+    fig.add_trace(go.Scatter(x=x, y=y, mode='lines+markers', name='GDP', marker_color='#ff6347'))
+    # 이동 통계 열이 있으면 평활 값은 같은 축에 겹치고, 증가율(%)은 오른쪽 보조 축에 그림
+    if 'gdp_smooth' in df:
+        x, y = xy('gdp_smooth')
+        fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='GDP (평활)',
+                                 line=dict(color='#1f77b4', dash='dash')))
+    if 'gdp_yoy_pct' in df:
+        x, y = xy('gdp_yoy_pct')
+        fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='전년 대비 증가율 (%)',
+                                 line=dict(color='#2ca02c'), yaxis='y2'))
+        fig.update_layout(yaxis2=dict(title="전년 대비 증가율 (%)", overlaying='y', side='right', showgrid=False))
+    return finish_figure(
+        fig, font_name, webgl_threshold,
+        yaxis_title="GDP (current US$)",
+        xaxis_title="연도",
+    )
+
+
+def build_gdp_bar(df, font_name):
+    fig = px.bar(df, x='date', y='gdp', title="", labels={'gdp': 'GDP (current US$)', 'date': '연도'})
+    return finish_figure(
+        fig, font_name,
+        yaxis_title="GDP (current US$)",
+        xaxis_title="연도",
+    )
+
+
+def build_climate_chart(df, font_name, max_points=DEFAULT_MAX_POINTS):
+    # 기온은 선(왼쪽 축), 월 강수량은 막대(오른쪽 축)
+    x, y = downsample_xy(df['date'].to_numpy(), df['value_temp'].to_numpy(), max_points)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=df['date'], y=df['value_rain'], name='강수량 (mm)', marker_color='#87ceeb',
+                         opacity=0.6, yaxis='y2'))
+    fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='평균 기온 (°C)', line=dict(color='#ff6347')))
+    return finish_figure(
+        fig, font_name,
+        xaxis_title="월",
+        yaxis_title="평균 기온 (°C)",
+        yaxis2=dict(title="강수량 (mm)", overlaying='y', side='right', showgrid=False),
+    )
+
+
+# --- 탭 2: 사용자 입력 데이터 ---
+def build_user_bar(df, font_name):
+    fig = px.bar(
+        df,
+        x='event',
+        y='value',
+        color='group',
+        barmode='group',
+        title="주요 기상 재해별 학사일정 조정 및 피해 건수",
+        labels={'value': '학교/피해 건수', 'event': '재해 유형', 'group': '조치 유형'}
+    )
+    return finish_figure(fig, font_name)
+
+
+def build_region_pie(df, font_name):
+    # '전국' 제외
+    df_region = df[df['region'] != '전국'].groupby('region')['value'].sum().reset_index()
+    fig = px.pie(df_region, values='value', names='region', title="지역별 총 피해/조정 건수 (전국 제외)", hole=0.3)
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return finish_figure(fig, font_name)
+
+
+def build_rain_detail_bar(df, font_name):
+    fig = px.bar(
+        df,
+        x='group',
+        y='value',
+        color='group',
+        title="2025년 전국 폭우 조치 유형별 상세",
+        labels={'value': '학교/피해 건수', 'group': '조치 유형'}
+    )
+    return finish_figure(fig, font_name, showlegend=False)
+
+
+class FigureCache:
+    """Figure를 보관하는 LRU 캐시 (스레드 안전, 적중/미스 횟수 기록). 반환된 Figure는 모든 세션이 공유하는 읽기 전용 객체."""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_build(self, key, builder):
+        """key에 해당하는 Figure를 반환한다. 없으면 builder()로 만들어 저장한다."""
+        with self._lock:
+            fig = self._entries.get(key)
+            if fig is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return fig
+            self.misses += 1
+
+        # 빌드는 잠금 밖에서 수행 (동시에 같은 키를 만들면 마지막 결과가 남음)
+        fig = builder()
+        with self._lock:
+            self._entries[key] = fig
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return fig
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
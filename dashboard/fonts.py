@@ -0,0 +1,50 @@
+"""
+한글 폰트 탐색/등록.
+
+서버 프로세스당 한 번만 실행되도록 앱에서는 `st.cache_resource`로 감싸서 호출합니다.
+명시한 폰트 파일이 없으면 시스템에 설치된 한글 지원 폰트를 순서대로 찾습니다.
+"""
+import os
+
+# 1순위: 배포 이미지에 포함된 폰트 파일
+FONT_PATHS = (
+    '/fonts/Pretendard-Bold.ttf',
+)
+
+# 2순위: 시스템에 설치되어 있을 수 있는 한글 지원 폰트 패밀리
+KOREAN_FONT_FAMILIES = (
+    'Pretendard',
+    'NanumGothic',
+    'NanumBarunGothic',
+    'Noto Sans CJK KR',
+    'Noto Sans KR',
+    'Malgun Gothic',
+    'AppleGothic',
+    'UnDotum',
+)
+
+
+def register_font(font_paths=FONT_PATHS, families=KOREAN_FONT_FAMILIES):
+    """
+    사용할 한글 폰트 이름을 찾아 Matplotlib에 등록하고 그 이름을 반환한다.
+    찾지 못하면 None (Plotly/Matplotlib 기본 폰트 사용).
+    """
+    # pyplot은 백엔드까지 불러오므로 쓰지 않고, 전역 설정은 최상위 패키지의 rcParams로 바꿈
+    import matplotlib
+    import matplotlib.font_manager as fm
+
+    font_name = None
+    for path in font_paths:
+        if os.path.exists(path):
+            # Matplotlib에 폰트 추가
+            fm.fontManager.addfont(path)
+            font_name = fm.FontProperties(fname=path).get_name()
+            break
+    else:
+        installed = {font.name for font in fm.fontManager.ttflist}
+        font_name = next((family for family in families if family in installed), None)
+
+    if font_name:
+        matplotlib.rc('font', family=font_name)
+        matplotlib.rcParams['axes.unicode_minus'] = False # 마이너스 폰트 깨짐 방지
+    return font_name
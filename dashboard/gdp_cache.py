@@ -0,0 +1,94 @@
+"""
+GDP 원본 CSV(와이드 포맷)를 롱 포맷 Arrow 파일로 한 번만 변환해 두고,
+이후에는 메모리 매핑으로 읽어 오는 캐시 계층.
+
+- 캐시 파일 이름은 원본 CSV의 mtime/크기로 만든 키를 포함하므로, CSV가 바뀌면 자동으로 다시 만들어집니다.
+- 캐시 파일은 Arrow IPC(Feather v2, 비압축) 형식이라 `pa.memory_map`으로 복사 없이 열 수 있습니다.
+"""
+import os
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+CACHE_DIR = os.path.join("data", ".cache")
+
+# 롱 포맷 스키마: (국가명, 국가코드, 지표명, 연도, 값)
+GDP_SCHEMA = pa.schema([
+    ("country", pa.string()),
+    ("code", pa.string()),
+    ("indicator", pa.string()),
+    ("year", pa.int16()),
+    ("value", pa.float64()),
+])
+
+
+def cache_key(csv_path):
+    """원본 CSV의 mtime(ns)과 크기로 캐시 키를 만든다 (파일 내용을 읽지 않음)."""
+    stat = os.stat(csv_path)
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+
+def cache_path(csv_path, cache_dir=CACHE_DIR):
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(cache_dir, f"{stem}.{cache_key(csv_path)}.arrow")
+
+
+def read_gdp_csv(csv_path, encoding="euc-kr"):
+    """와이드 포맷 World Bank CSV를 읽어 롱 포맷 Arrow 테이블로 변환한다."""
+    df = pd.read_csv(csv_path, encoding=encoding)
+    year_cols = [c for c in df.columns if str(c).isdigit()]
+    long_df = df.melt(
+        id_vars=["Country Name", "Country Code", "Indicator Name"],
+        value_vars=year_cols,
+        var_name="year",
+        value_name="value",
+    )
+    long_df = long_df.dropna(subset=["value"])
+    long_df = long_df.rename(columns={
+        "Country Name": "country",
+        "Country Code": "code",
+        "Indicator Name": "indicator",
+    })
+    long_df["year"] = long_df["year"].astype("int16")
+    long_df["value"] = pd.to_numeric(long_df["value"], errors="coerce")
+    # 국가코드 → 연도 순으로 정렬해 두면 국가별 조회가 연속 구간이 된다
+    long_df = long_df.sort_values(["code", "year"], kind="stable")
+    return pa.Table.from_pandas(long_df, schema=GDP_SCHEMA, preserve_index=False)
+
+
+def build_gdp_cache(csv_path, cache_dir=CACHE_DIR):
+    """CSV를 파싱해 캐시 파일을 (원자적으로) 쓰고, 같은 원본의 오래된 캐시는 지운다."""
+    os.makedirs(cache_dir, exist_ok=True)
+    target = cache_path(csv_path, cache_dir)
+    table = read_gdp_csv(csv_path)
+
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    stem = os.path.splitext(os.path.basename(csv_path))[0] + "."
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if name.startswith(stem) and name.endswith(".arrow") and path != target:
+            os.remove(path)
+    return target
+
+
+def load_gdp_table(csv_path, cache_dir=CACHE_DIR):
+    """
+    롱 포맷 GDP 테이블을 반환한다.
+    캐시가 있으면 메모리 매핑(파일 열기 비용)만으로 읽고, 없으면 한 번 변환해서 만든다.
+    """
+    path = cache_path(csv_path, cache_dir)
+    if not os.path.exists(path):
+        path = build_gdp_cache(csv_path, cache_dir)
+    source = pa.memory_map(path, "r")
+    return ipc.open_file(source).read_all()
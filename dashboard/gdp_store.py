@@ -0,0 +1,73 @@
+"""
+전체 국가/지역 GDP를 (국가 × 연도) NumPy 행렬로 보관하는 프로세스 단위 저장소.
+
+와이드 CSV를 매번 `Country Name == ...` 마스크로 훑는 대신, 롱 포맷 테이블을 한 번만
+행렬로 펼쳐 두고 국가명/국가코드 → 행 번호 딕셔너리로 O(1) 조회합니다. 값 행렬은 읽기 전용입니다.
+"""
+import numpy as np
+import pandas as pd
+
+
+class GDPStore:
+    def __init__(self, codes, names, years, values, version=None):
+        self.codes = np.asarray(codes, dtype=object)
+        self.names = np.asarray(names, dtype=object)
+        self.years = np.asarray(years, dtype=np.int16)
+        self.values = np.asarray(values, dtype=np.float64)
+        # 모든 세션이 공유하는 행렬이므로 series()가 돌려주는 행 뷰로도 수정할 수 없게 고정
+        self.values.flags.writeable = False
+        # 원본 데이터 버전 (캐시 키 등에 사용)
+        self.version = version
+        if self.values.shape != (len(self.codes), len(self.years)):
+            raise ValueError(
+                f"values shape {self.values.shape} does not match "
+                f"{len(self.codes)} codes x {len(self.years)} years"
+            )
+        # 국가코드와 국가명 모두 같은 행 번호를 가리킴
+        self._index = {}
+        for row, (code, name) in enumerate(zip(self.codes, self.names)):
+            self._index[code] = row
+            self._index[name] = row
+
+    @classmethod
+    def from_table(cls, table, version=None):
+        """롱 포맷 Arrow 테이블(country, code, year, value)로부터 행렬을 만든다."""
+        codes = table["code"].to_numpy(zero_copy_only=False)
+        names = table["country"].to_numpy(zero_copy_only=False)
+        years = table["year"].to_numpy()
+        values = table["value"].to_numpy()
+
+        unique_codes, code_first, code_idx = np.unique(codes, return_index=True, return_inverse=True)
+        unique_years, year_idx = np.unique(years, return_inverse=True)
+        matrix = np.full((len(unique_codes), len(unique_years)), np.nan)
+        matrix[code_idx, year_idx] = values
+        return cls(unique_codes, names[code_first], unique_years, matrix, version=version)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def row(self, key):
+        """국가코드('KOR') 또는 국가명('Korea, Rep.')의 행 번호."""
+        try:
+            return self._index[key]
+        except KeyError:
+            raise KeyError(f"Unknown country or code: {key!r}") from None
+
+    def name(self, key):
+        return self.names[self.row(key)]
+
+    def series(self, key):
+        """(연도 배열, 값 배열) — 값은 행렬의 행 뷰이며 결측 연도는 NaN."""
+        return self.years, self.values[self.row(key)]
+
+    def frame(self, key):
+        """결측 연도를 제외한 `date`/`gdp` 데이터프레임."""
+        years, values = self.series(key)
+        mask = ~np.isnan(values)
+        return pd.DataFrame({
+            "date": pd.to_datetime(years[mask].astype(str), format="%Y"),
+            "gdp": values[mask],
+        })
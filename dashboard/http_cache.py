@@ -0,0 +1,121 @@
+"""
+원격 파일의 조건부 재검증(ETag / Last-Modified) 디스크 캐시.
+
+`st.cache_resource(ttl=...)`가 만료되면 데이터를 다시 받아야 하지만, 원본이 바뀌지 않았다면 다시 내려받거나
+다시 파싱할 필요가 없습니다. 이 캐시는 응답 본문을 검증자(ETag, Last-Modified)와 함께 디스크에 저장해 두고,
+다음 요청에는 `If-None-Match` / `If-Modified-Since`를 붙입니다.
+
+- 304 Not Modified: 저장해 둔 본문을 그대로 쓰고, 파싱 결과도 메모리에 있으면 재사용합니다 (적중).
+- 200 OK: 새 본문과 검증자를 원자적으로 저장하고 다시 파싱합니다 (미스).
+
+캐시 파일은 URL의 SHA-1을 이름으로 `<key>.body`(본문)와 `<key>.json`(URL, 검증자, 받은 시각)으로 저장됩니다.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import namedtuple
+
+HTTP_CACHE_DIR = os.path.join("data", ".cache", "http")
+
+CachedResponse = namedtuple("CachedResponse", "content etag last_modified modified")
+
+
+def _write_atomic(path, data):
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class HTTPCache:
+    """
+    URL별 본문/검증자 디스크 캐시와 파싱 결과 메모리 캐시 (스레드 안전).
+    hits는 304로 재검증된 요청 수, misses는 본문을 새로 받은 요청 수.
+    """
+
+    def __init__(self, cache_dir=HTTP_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._parsed = {}
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key + ".body"), os.path.join(self.cache_dir, key + ".json")
+
+    def _stored(self, url):
+        """(본문, 메타데이터) 또는 (None, None) — 둘 중 하나라도 없으면 없는 것으로 본다."""
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                return f.read(), meta
+        except (OSError, ValueError):
+            return None, None
+
+    def get(self, session, url, timeout=30):
+        """저장된 검증자로 조건부 GET을 보내고 `CachedResponse`를 돌려준다."""
+        content, meta = self._stored(url)
+        headers = {}
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and content is not None:
+            with self._lock:
+                self.hits += 1
+            return CachedResponse(content, meta.get("etag"), meta.get("last_modified"), False)
+        response.raise_for_status()
+
+        meta = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        }
+        body_path, meta_path = self._paths(url)
+        # 본문을 먼저 바꾸고 메타데이터를 나중에 바꾼다 (중간에 죽으면 다음 요청은 검증자 불일치로 200을 받음)
+        _write_atomic(body_path, response.content)
+        _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        with self._lock:
+            self.misses += 1
+        return CachedResponse(response.content, meta["etag"], meta["last_modified"], True)
+
+    def get_parsed(self, session, url, parse, timeout=30):
+        """
+        get()의 본문을 parse로 변환한 결과. 본문이 바뀌지 않았으면(304 또는 같은 내용) 이전 파싱 결과를 재사용한다.
+        프로세스 재시작 직후처럼 메모리에 결과가 없으면 저장된 본문을 한 번만 파싱한다.
+        """
+        response = self.get(session, url, timeout)
+        # 검증자를 주지 않는 서버는 항상 200을 돌려주므로 본문 해시까지 비교해 같은 내용이면 재사용
+        token = (response.etag, response.last_modified, hashlib.sha1(response.content).hexdigest())
+        with self._lock:
+            cached = self._parsed.get(url)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        result = parse(response.content)
+        with self._lock:
+            self._parsed[url] = (token, result)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._parsed.clear()
+        for name in os.listdir(self.cache_dir):
+            if name.endswith((".body", ".json")):
+                os.remove(os.path.join(self.cache_dir, name))
@@ -0,0 +1,314 @@
+"""
+Prometheus 텍스트 형식 메트릭.
+
+외부 의존성 없이 Counter/Gauge/Histogram과 `/metrics` HTTP 엔드포인트만 구현합니다.
+앱에서는 레지스트리와 서버를 `st.cache_resource`로 감싸 서버 프로세스당 한 번만 만듭니다.
+
+    $ curl http://127.0.0.1:9464/metrics
+"""
+import functools
+import logging
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple((name, labels[name]) for name in self.labelnames)
+
+    def add_callback(self, func):
+        """스크레이프 시점에 호출되어 [(labels dict, value), ...]를 돌려주는 함수 등록."""
+        self._callbacks.append(func)
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for func in self._callbacks:
+            try:
+                for labels, value in func():
+                    values[self._key(labels)] = value
+            except Exception:
+                logger.exception("metric callback for %s failed", self.name)
+        for key, value in sorted(values.items()):
+            yield self.name, key, value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        for name, labels, value in self.samples():
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.setdefault(key, {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0})
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["counts"][i] += 1
+            state["sum"] += value
+            state["count"] += 1
+
+    def samples(self):
+        with self._lock:
+            values = {key: {**state, "counts": list(state["counts"])} for key, state in self._values.items()}
+        for key, state in sorted(values.items()):
+            for bound, count in zip(self.buckets, state["counts"]):
+                yield f"{self.name}_bucket", key + (("le", _format_value(bound)),), count
+            yield f"{self.name}_sum", key, state["sum"]
+            yield f"{self.name}_count", key, state["count"]
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"metric {metric.name!r} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self):
+        """Prometheus 텍스트 노출 형식 문자열."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+def instrument_cache(counter, name, cache_decorator):
+    """
+    `st.cache_data(...)` 같은 캐시 데코레이터를 감싸 호출마다 적중/미스를 센다.
+    함수 본문이 실제로 실행되면(캐시 미스) 미스, 아니면 적중으로 기록한다.
+    """
+    def decorator(func):
+        state = threading.local()
+
+        @functools.wraps(func)
+        def body(*args, **kwargs):
+            state.missed = True
+            return func(*args, **kwargs)
+
+        cached = cache_decorator(body)
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            state.missed = False
+            try:
+                return cached(*args, **kwargs)
+            finally:
+                counter.inc(function=name, result="miss" if state.missed else "hit")
+
+        call.clear = cached.clear
+        return call
+    return decorator
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = None
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        payload = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        logger.debug("metrics: " + format, *args)
+
+
+def start_http_server(registry, port, addr="127.0.0.1"):
+    """registry를 `/metrics`로 노출하는 HTTP 서버를 데몬 스레드로 시작하고 서버 객체를 반환한다."""
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+    server = ThreadingHTTPServer((addr, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True)
+    thread.start()
+    return server
+
+
+def _streamlit_active_sessions():
+    """Streamlit 런타임의 활성 세션 수 (런타임 밖이거나 조회할 수 없으면 None)."""
+    try:
+        from streamlit import runtime
+
+        if not runtime.exists():
+            return None
+        return runtime.get_instance()._session_mgr.num_active_sessions()
+    except Exception:
+        return None
+
+
+class DashboardMetrics:
+    """대시보드가 노출하는 메트릭 묶음."""
+
+    # 이 시간 안에 rerun이 있었던 세션을 활성으로 간주 (런타임에서 세션 수를 얻을 수 없을 때)
+    SESSION_WINDOW_SECONDS = 300
+
+    def __init__(self, registry=None):
+        self.registry = registry or Registry()
+        self.cache_requests = self.registry.counter(
+            "dashboard_cache_requests_total",
+            "Cached function and cache lookups by result (hit or miss).",
+            ["function", "result"],
+        )
+        self.rerun_seconds = self.registry.histogram(
+            "dashboard_rerun_duration_seconds",
+            "Script rerun wall time (full script or standalone fragment).",
+            ["kind"],
+        )
+        self.stage_seconds = self.registry.histogram(
+            "dashboard_stage_duration_seconds",
+            "Wall time of instrumented stages within a rerun.",
+            ["stage"],
+        )
+        self.tab_seconds = self.registry.histogram(
+            "dashboard_tab_render_seconds",
+            "Wall time to render a dashboard tab.",
+            ["tab"],
+        )
+        self.active_sessions = self.registry.gauge(
+            "dashboard_active_sessions",
+            "Concurrent browser sessions connected to this server process.",
+        )
+        self.active_sessions.add_callback(self._session_count)
+        self.last_refresh = self.registry.gauge(
+            "dashboard_cache_last_refresh_timestamp_seconds",
+            "Unix time of the last successful warm-up or refresh-ahead run.",
+            ["function"],
+        )
+        self.refresh_failures = self.registry.counter(
+            "dashboard_cache_refresh_failures_total",
+            "Loads of a stale-while-revalidate loader that raised (the last good value keeps being served).",
+            ["function"],
+        )
+        self.stale_served = self.registry.counter(
+            "dashboard_stale_served_total",
+            "Requests answered with a value past its TTL while it was refreshed in the background.",
+            ["function"],
+        )
+        self.data_age = self.registry.gauge(
+            "dashboard_data_age_seconds",
+            "Age of the oldest value a stale-while-revalidate loader is serving.",
+            ["function"],
+        )
+        self._last_seen = {}
+        self._lock = threading.Lock()
+
+    def observe_rerun(self, run):
+        """TimingRecorder의 on_end 콜백: rerun 하나의 총 시간과 단계별 시간을 기록."""
+        self.rerun_seconds.observe(run["total_ms"] / 1000, kind=run["kind"])
+        for stage, ms in run["stages"]:
+            if stage.startswith("tab:"):
+                self.tab_seconds.observe(ms / 1000, tab=stage[len("tab:"):])
+            else:
+                self.stage_seconds.observe(ms / 1000, stage=stage)
+        if run.get("session_id"):
+            with self._lock:
+                self._last_seen[run["session_id"]] = time.monotonic()
+
+    def track_cache_stats(self, name, cache):
+        """hits/misses 속성을 가진 캐시 객체(FigureCache, ExportCache 등)의 값을 스크레이프 시 노출."""
+        self.cache_requests.add_callback(lambda: [
+            ({"function": name, "result": "hit"}, cache.hits),
+            ({"function": name, "result": "miss"}, cache.misses),
+        ])
+
+    def track_refresh(self, refresher):
+        """RefreshAhead의 작업별 마지막 갱신 시각을 스크레이프 시 노출."""
+        self.last_refresh.add_callback(lambda: [
+            ({"function": name}, when) for name, when in dict(refresher.last_refresh).items()
+        ])
+
+    def track_loader(self, name, loader):
+        """StaleWhileRevalidate 로더의 적중/미스, 오래된 값 응답 수, 실패 수, 데이터 나이를 스크레이프 시 노출."""
+        self.track_cache_stats(name, loader)
+        self.stale_served.add_callback(lambda: [({"function": name}, loader.stale_hits)])
+        self.refresh_failures.add_callback(lambda: [({"function": name}, loader.failures)])
+        self.data_age.add_callback(lambda: [({"function": name}, loader.max_age())])
+
+    def _session_count(self):
+        count = _streamlit_active_sessions()
+        if count is None:
+            cutoff = time.monotonic() - self.SESSION_WINDOW_SECONDS
+            with self._lock:
+                self._last_seen = {sid: seen for sid, seen in self._last_seen.items() if seen >= cutoff}
+                count = len(self._last_seen)
+        return [({}, count)]
@@ -0,0 +1,124 @@
+"""
+누적합 기반 이동 통계 엔진.
+
+시계열마다 값의 누적합과 유효(NaN 아님) 개수의 누적합을 한 번만 계산해 두면,
+임의의 윈도 길이에 대한 이동 평균은 `csum[i + 1] - csum[i + 1 - window]`로 점마다 O(1)에 구해집니다.
+선택된 연도 구간만 잘라서 계산하되 윈도는 구간 앞의 과거 값까지 포함하므로, 필터 경계에서도 값이 끊기지 않습니다.
+
+지수 이동 평균(EMA)은 윈도(span)별로 전체 시계열에 대해 한 번 계산해 보관하고 슬라이스만 돌려주며,
+이동 중앙값은 구간에 해당하는 윈도 뷰(`sliding_window_view`) 위에서 벡터화해 계산합니다.
+전년 대비 증가율은 날짜가 정확히 1년 전인 포인트와의 비율이며, 결측 연도를 뺀 시계열에서 그 포인트가 없으면 NaN입니다
+(날짜를 주지 않으면 1년치 포인트 수만큼 앞선 값과 비교).
+"""
+import threading
+import warnings
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+RollingMethod = namedtuple("RollingMethod", "label suffix")
+
+# suffix: 결과 열 이름 접미사 (같은 단위로 겹쳐 그리는 평활 값 / 다른 축의 증가율)
+ROLLING_METHODS = {
+    "mean": RollingMethod("이동 평균", "smooth"),
+    "ema": RollingMethod("지수 이동 평균 (EMA)", "smooth"),
+    "median": RollingMethod("이동 중앙값", "smooth"),
+    "yoy": RollingMethod("전년 대비 증가율 (%)", "yoy_pct"),
+}
+
+
+class RollingStats:
+    """1차원 수치 시계열 하나의 이동 통계. 결측값(NaN)은 윈도 안에서 건너뛴다."""
+
+    def __init__(self, values, periods_per_year=1, dates=None):
+        values = np.array(values, dtype=np.float64)
+        values.flags.writeable = False
+        self.values = values
+        self.periods_per_year = max(int(periods_per_year), 1)
+        # 오름차순 정렬된 datetime64 (전년 대비 비교 대상을 날짜로 찾을 때 사용)
+        self.dates = None if dates is None else np.asarray(dates, dtype="datetime64[ns]")
+        self._prev = None
+        valid = ~np.isnan(values)
+        self._csum = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+        self._count = np.concatenate(([0], np.cumsum(valid)))
+        self._ema = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.values)
+
+    def _positions(self, lo, hi):
+        hi = len(self.values) if hi is None else hi
+        return np.arange(lo, hi)
+
+    def mean(self, window, lo=0, hi=None):
+        """[lo, hi) 위치의 후행 이동 평균 (윈도 안의 유효값이 없으면 NaN)."""
+        idx = self._positions(lo, hi)
+        start = np.maximum(idx + 1 - window, 0)
+        total = self._csum[idx + 1] - self._csum[start]
+        count = self._count[idx + 1] - self._count[start]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(count > 0, total / count, np.nan)
+
+    def ema(self, window, lo=0, hi=None):
+        """span=window 지수 이동 평균. 재귀식이라 누적합으로 못 풀므로 span별로 한 번만 전체 계산해 둔다."""
+        with self._lock:
+            smoothed = self._ema.get(window)
+            if smoothed is None:
+                smoothed = pd.Series(self.values).ewm(span=window, ignore_na=True).mean().to_numpy()
+                smoothed.flags.writeable = False
+                self._ema[window] = smoothed
+        return smoothed[lo:hi]
+
+    def median(self, window, lo=0, hi=None):
+        """[lo, hi) 위치의 후행 이동 중앙값 (구간 시작 앞 window-1개 값까지 포함)."""
+        hi = len(self.values) if hi is None else hi
+        if hi <= lo:
+            return np.empty(0)
+        start = max(lo - (window - 1), 0)
+        padded = np.concatenate((np.full(window - 1 - (lo - start), np.nan), self.values[start:hi]))
+        windows = np.lib.stride_tricks.sliding_window_view(padded, window)
+        with warnings.catch_warnings():
+            # 전부 NaN인 윈도는 NaN으로 두면 되므로 경고는 무시
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return np.nanmedian(windows, axis=1)
+
+    def _previous_year(self):
+        """위치마다 1년 전 포인트의 위치 (없으면 -1). 전체 시계열에 대해 한 번만 계산해 둔다."""
+        with self._lock:
+            if self._prev is None:
+                idx = np.arange(len(self.values))
+                if self.dates is None:
+                    prev = idx - self.periods_per_year
+                else:
+                    # 같은 달/일의 1년 전 날짜 (2월 29일 → 전년 2월 28일)
+                    target = (pd.DatetimeIndex(self.dates) - pd.DateOffset(years=1)).to_numpy()
+                    pos = np.searchsorted(self.dates, target, side="left")
+                    found = pos < len(self.dates)
+                    found[found] = self.dates[pos[found]] == target[found]
+                    prev = np.where(found, pos, -1)
+                prev.flags.writeable = False
+                self._prev = prev
+        return self._prev
+
+    def yoy(self, lo=0, hi=None):
+        """1년 전 포인트 대비 증가율(%). 비교 대상(결측 연도 등)이 없으면 NaN."""
+        idx = self._positions(lo, hi)
+        prev = self._previous_year()[idx]
+        has_prev = prev >= 0
+        base = self.values[np.where(has_prev, prev, 0)]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            growth = (self.values[idx] / base - 1.0) * 100.0
+        return np.where(has_prev & (base != 0), growth, np.nan)
+
+    def compute(self, method, window, lo=0, hi=None):
+        if method == "mean":
+            return self.mean(window, lo, hi)
+        if method == "ema":
+            return self.ema(window, lo, hi)
+        if method == "median":
+            return self.median(window, lo, hi)
+        if method == "yoy":
+            return self.yoy(lo, hi)
+        raise ValueError(f"Unknown rolling method: {method!r}")
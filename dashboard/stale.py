@@ -0,0 +1,159 @@
+"""
+stale-while-revalidate 로더.
+
+키마다 마지막으로 성공한 값을 보관하고, `ttl`이 지나면 그 값을 계속 돌려주면서 백그라운드 스레드에서 다시 불러와
+성공했을 때만 교체합니다. 그래서 만료 시점의 rerun이 재로드를 기다리지 않고, 재로드가 일시적으로 실패해도
+마지막 정상 값이 그대로 남습니다 (예외를 캐시 값으로 덮어쓰지 않음).
+
+- fresh (나이 < ttl): 보관한 값
+- stale (ttl ≤ 나이 < max_staleness, 또는 원본 버전이 바뀜): 보관한 값 + 키당 하나의 백그라운드 갱신
+- 값이 없거나 max_staleness를 넘음: 호출한 스레드에서 직접 로드, 실패하면 예외 (오래된 값은 한도를 넘겨 내보내지 않음)
+
+`version(key)`를 주면 값을 불러올 때의 원본 버전을 함께 보관하고, 현재 버전과 다르면 나이와 관계없이 stale로 취급합니다
+(파일 mtime처럼 싸게 구할 수 있는 버전이어야 함 — 요청마다 호출됨).
+
+실패한 로드는 `retry_after`초 동안 그 예외를 원인으로 연결한 `RuntimeError`로 바로 응답해, 원본이 죽어 있을 때 rerun마다 원본을 두드리지 않습니다.
+"""
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 이보다 오래된 값은 갱신에 계속 실패해도 내보내지 않음 (초)
+MAX_STALENESS = int(os.environ.get("DASHBOARD_MAX_STALENESS", str(6 * 3600)))
+RETRY_AFTER = 30
+
+
+class _Entry:
+    __slots__ = ("current", "error", "failed_at", "refreshing", "lock")
+
+    def __init__(self):
+        # (값, 불러온 시각, 원본 버전) — 한 번의 대입으로 교체되므로 읽는 쪽에서 잠글 필요 없음
+        self.current = None
+        self.error = None
+        self.failed_at = None
+        self.refreshing = False
+        self.lock = threading.Lock()
+
+
+class StaleWhileRevalidate:
+    """load(key)의 결과를 키별로 보관하는 stale-while-revalidate 캐시 (스레드 안전)."""
+
+    def __init__(self, load, ttl, max_staleness=MAX_STALENESS, retry_after=RETRY_AFTER, name=None, clock=time.time,
+                 version=None):
+        self.load = load
+        self.version = version
+        self.ttl = ttl
+        self.max_staleness = max(max_staleness, ttl)
+        self.retry_after = retry_after
+        self.name = name or getattr(load, "__name__", "loader")
+        self.clock = clock
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.failures = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry()
+            return entry
+
+    def get(self, key):
+        entry = self._entry(key)
+        current = entry.current
+        if current is not None:
+            age = self.clock() - current[1]
+            if age < self.ttl and not self._changed(key, current):
+                self._count("hits")
+                return current[0]
+            if age < self.max_staleness:
+                self._count("stale_hits")
+                self._revalidate(key, entry)
+                return current[0]
+
+        # 같은 키를 동시에 요청한 세션은 한 번의 로드를 함께 기다림
+        with entry.lock:
+            current = entry.current
+            if current is not None and self.clock() - current[1] < self.ttl:
+                self._count("hits")
+                return current[0]
+            if entry.error is not None and self.clock() - entry.failed_at < self.retry_after:
+                # 보관한 예외 객체를 다시 던지면 세션 스레드마다 같은 __traceback__이 계속 길어지므로 새 예외로 감쌈
+                elapsed = self.clock() - entry.failed_at
+                raise RuntimeError(f"{entry.error} (failed {elapsed:.0f}s ago; retrying in "
+                                   f"{self.retry_after - elapsed:.0f}s)") from entry.error
+            self._count("misses")
+            return self._load(key, entry)
+
+    def refresh(self, key):
+        """지금 다시 불러와 성공하면 교체 (미리 갱신용). 실패하면 예외를 내고 이전 값은 그대로 둠."""
+        entry = self._entry(key)
+        with entry.lock:
+            return self._load(key, entry)
+
+    def age(self, key):
+        """보관한 값의 나이(초), 값이 없으면 None."""
+        current = self._entry(key).current
+        return None if current is None else self.clock() - current[1]
+
+    def max_age(self):
+        with self._lock:
+            entries = list(self._entries.values())
+        ages = [self.clock() - entry.current[1] for entry in entries if entry.current is not None]
+        return max(ages, default=0.0)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _changed(self, key, current):
+        return self.version is not None and self.version(key) != current[2]
+
+    def _load(self, key, entry):
+        # entry.lock을 잡은 상태에서 호출됨
+        started = self.clock()
+        # 로드 전에 읽어 두어, 로드 도중 원본이 또 바뀌면 다음 요청에서 다시 갱신되게 함
+        version = self.version(key) if self.version is not None else None
+        try:
+            value = self.load(key)
+        except Exception as e:
+            entry.error, entry.failed_at = e, self.clock()
+            self._count("failures")
+            raise
+        entry.current = (value, started, version)
+        entry.error = entry.failed_at = None
+        return value
+
+    def _revalidate(self, key, entry):
+        with self._lock:
+            if entry.refreshing:
+                return
+            if entry.error is not None and self.clock() - entry.failed_at < self.retry_after:
+                return
+            entry.refreshing = True
+        threading.Thread(target=self._background, args=(key, entry), name=f"revalidate-{self.name}",
+                         daemon=True).start()
+
+    def _background(self, key, entry):
+        try:
+            with entry.lock:
+                # 기다리는 사이 다른 스레드가 이미 갱신했으면 생략
+                current = entry.current
+                if current is None or self.clock() - current[1] >= self.ttl or self._changed(key, current):
+                    self._load(key, entry)
+        except Exception:
+            logger.warning("background refresh of %s(%r) failed; serving the previous value", self.name, key,
+                           exc_info=True)
+        finally:
+            with self._lock:
+                entry.refreshing = False
+
+    def _count(self, attr):
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
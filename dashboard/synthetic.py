@@ -0,0 +1,121 @@
+"""
+시드를 고정한 합성 데이터 생성기.
+
+공식 데이터를 한 번도 불러오지 못했을 때의 예시 데이터와 규모별 벤치마크용 대용량 데이터를 같은 코드로 만듭니다.
+
+- 난수는 `numpy.random.default_rng(seed)` 하나에서만 뽑으므로 같은 파라미터면 항상 같은 값이 나옵니다.
+- 모든 열을 (지점/국가 × 기간) 배열 연산으로 한 번에 만들고, 문자열 열은 범주 코드에서 만듭니다 (행 단위 루프 없음).
+- 파라미터 조합별로 결과를 LRU 캐시에 보관하고, 같은 호출은 같은 읽기 전용 프레임을 돌려줍니다
+  (`freeze_frame`과 같은 규칙: 수치 열 버퍼는 쓰기 불가). 큰 프레임을 여러 크기로 만들 때는 `clear_cache()`로 비웁니다.
+
+열 구성은 앱이 실제로 쓰는 프레임과 같습니다.
+
+- `climate_frame`: 월별 `date`/`value_temp`/`value_rain` (지점이 여러 개면 `station` 열 추가)
+- `gdp_frame`: `date`/`gdp` (국가가 여러 개면 `country` 열 추가) — `GDPStore.frame()`과 같은 모양
+- `events_frame`: `event`/`year`/`region`/`group`/`value`/`unit`/`date` — `user_events_frame()`과 같은 모양
+"""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from dashboard.events import USER_EVENTS
+from dashboard.timeseries import freeze_frame
+
+DEFAULT_SEED = 20230801
+CACHE_SIZE = 8
+
+REGIONS = (
+    '서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종', '경기',
+    '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주', '전국',
+)
+EVENTS = tuple(dict.fromkeys(USER_EVENTS['event']))
+GROUPS = tuple(dict.fromkeys(USER_EVENTS['type']))
+
+
+def _season(month_index):
+    """월 번호(0=1월)의 계절 성분: 7월 근처 +1, 1월 근처 -1."""
+    return np.sin((month_index - 3) * np.pi / 6)
+
+
+def _labels(codes, names):
+    """정수 코드 → 문자열 열 (`Categorical.astype("str")`보다 몇 배 빠름)."""
+    return pd.array(np.asarray(names, dtype=object)[codes], dtype="str")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def climate_frame(months=24, stations=1, start="2022-01", seed=DEFAULT_SEED):
+    """
+    지점 stations개 × start부터 months개월의 월평균 기온(°C)/월 강수량(mm).
+    지점마다 고정된 기온 편차와 강수 배율을 두고, 월마다 정규(기온)/감마(강수) 잡음을 더한다.
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start=start, periods=months, freq="MS")
+    season = _season(dates.month.to_numpy() - 1)
+
+    station_temp = rng.normal(0.0, 2.0, size=(stations, 1))
+    station_rain = rng.uniform(0.7, 1.3, size=(stations, 1))
+    temp = 12.5 + 14.0 * season + station_temp + rng.normal(0.0, 1.5, size=(stations, months))
+    # 여름철(계절 성분이 클수록) 강수량이 많고, 월별 변동은 오른쪽으로 긴 감마 분포
+    rain = station_rain * (season + 1.2) ** 2 * rng.gamma(2.0, 30.0, size=(stations, months))
+
+    columns = {}
+    if stations > 1:
+        columns['station'] = np.repeat(np.arange(stations, dtype=np.int32), months)
+    columns['date'] = np.tile(dates.to_numpy(), stations)
+    columns['value_temp'] = temp.round(1).ravel()
+    columns['value_rain'] = rain.round(1).ravel()
+    return freeze_frame(pd.DataFrame(columns))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def gdp_frame(periods=64, countries=1, start="1960", freq="YS", seed=DEFAULT_SEED):
+    """
+    국가 countries개 × periods 기간의 GDP(current US$) — 국가별 시작 규모(로그정규)에서 출발하는
+    성장률 랜덤 워크 (freq가 연 단위가 아니면 성장률을 기간 길이에 맞게 줄임).
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start=start, periods=periods, freq=freq)
+    # 연 3.5% ± 4% 성장을 기간 길이(연 단위)에 맞게 환산
+    span = 1.0 if periods < 2 else (dates[1] - dates[0]) / pd.Timedelta(days=365.25)
+    growth = rng.normal(0.035 * span, 0.04 * np.sqrt(span), size=(countries, periods))
+    base = rng.lognormal(mean=24.0, sigma=1.5, size=(countries, 1))
+    gdp = base * np.exp(np.cumsum(np.log1p(np.maximum(growth, -0.5)), axis=1))
+
+    columns = {}
+    if countries > 1:
+        columns['country'] = _labels(np.repeat(np.arange(countries), periods),
+                                     [f"C{i:04d}" for i in range(countries)])
+    columns['date'] = np.tile(dates.to_numpy(), countries)
+    columns['gdp'] = gdp.ravel()
+    return freeze_frame(pd.DataFrame(columns))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def events_frame(rows=13, first_year=2015, last_year=2025, seed=DEFAULT_SEED):
+    """재해 × 지역 × 조치 유형별 피해/조정 건수 rows행 (건수는 지역 규모에 비례하는 포아송)."""
+    rng = np.random.default_rng(seed)
+    event = rng.integers(0, len(EVENTS), size=rows)
+    region = rng.integers(0, len(REGIONS), size=rows)
+    group = rng.integers(0, len(GROUPS), size=rows)
+    year = rng.integers(first_year, last_year + 1, size=rows).astype(np.int64)
+    # '전국' 행은 지역 행보다 규모가 큼
+    scale = np.where(region == REGIONS.index('전국'), 120.0, 12.0)
+    value = rng.poisson(scale * rng.uniform(0.2, 1.5, size=rows)).astype(np.int64)
+
+    frame = pd.DataFrame({
+        'event': _labels(event, EVENTS),
+        'year': year,
+        'region': _labels(region, REGIONS),
+        'group': _labels(group, GROUPS),
+        'value': value,
+        'unit': pd.Series('곳', index=range(rows), dtype="str"),
+        # 연도 → 그해 1월 1일 (문자열 파싱 없이 datetime64 단위 변환)
+        'date': (year - 1970).astype('datetime64[Y]').astype('datetime64[us]'),
+    })
+    return freeze_frame(frame)
+
+
+def clear_cache():
+    for generator in (climate_frame, gdp_frame, events_frame):
+        generator.cache_clear()
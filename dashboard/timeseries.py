@@ -0,0 +1,106 @@
+"""
+연도 범위 필터를 위한 작은 시계열 컨테이너.
+
+로드 시 날짜순으로 한 번 정렬하고 연도 배열(int)을 미리 계산해 두므로,
+슬라이더 범위는 O(1)로 읽고 연도 범위 필터는 `searchsorted` 두 번으로 구한 위치 슬라이스(복사 없는 뷰)가 됩니다.
+
+컨테이너는 `st.cache_resource`로 모든 세션이 같은 객체를 공유하므로, 프레임의 NumPy 열 버퍼는
+쓰기 불가로 고정합니다. 제자리 대입은 ValueError가 나고, 파생 열은 `assign` 등으로 새 프레임에 붙입니다
+(기존 열은 복사 없이 공유됨). 이동 통계용 누적합(`RollingStats`)도 열마다 한 번만 만들어 공유합니다.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from dashboard.rolling import ROLLING_METHODS, RollingStats
+
+
+def freeze_frame(frame):
+    """
+    NumPy 기반 열을 쓰기 불가 버퍼로 고정한 프레임.
+    문자열/범주형 같은 확장 배열 열은 그대로 둔다 (값 자체가 불변이고 프레임 대입은 CoW로 분리됨).
+    """
+    columns = {}
+    for name in frame.columns:
+        column = frame[name]
+        if isinstance(column.dtype, np.dtype):
+            values = column.to_numpy(copy=True)
+            values.flags.writeable = False
+            columns[name] = values
+        else:
+            columns[name] = column
+    return pd.DataFrame(columns, index=frame.index, copy=False)
+
+
+class TimeSeries:
+    def __init__(self, frame, date_column='date', version=None):
+        frame = freeze_frame(frame.sort_values(date_column, kind='stable').reset_index(drop=True))
+        self.frame = frame
+        self.date_column = date_column
+        # 원본 데이터 버전 (캐시 키 등에 사용)
+        self.version = version
+        self.years = frame[date_column].dt.year.to_numpy(dtype=np.int32)
+        self.years.flags.writeable = False
+        self._rolling = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.frame)
+
+    @property
+    def empty(self):
+        return len(self.frame) == 0
+
+    @property
+    def year_min(self):
+        return int(self.years[0])
+
+    @property
+    def year_max(self):
+        return int(self.years[-1])
+
+    def year_bounds(self, start, end):
+        """[start, end] 연도에 해당하는 행 위치 구간 (lo, hi)."""
+        lo = int(np.searchsorted(self.years, start, side='left'))
+        hi = int(np.searchsorted(self.years, end, side='right'))
+        return lo, hi
+
+    def slice_years(self, start, end):
+        """start~end 연도(양 끝 포함)의 행 — 원본 프레임의 위치 슬라이스 (읽기 전용 버퍼 공유)."""
+        lo, hi = self.year_bounds(start, end)
+        return self.frame.iloc[lo:hi]
+
+    @property
+    def periods_per_year(self):
+        """연도당 평균 포인트 수 (연간 데이터 1, 월별 데이터 12) — 전년 대비 비교 간격."""
+        if self.empty:
+            return 1
+        return max(round(len(self.years) / len(np.unique(self.years))), 1)
+
+    @property
+    def numeric_columns(self):
+        return list(self.frame.select_dtypes('number').columns)
+
+    def rolling(self, column):
+        """열의 `RollingStats` (최초 호출 시 누적합을 한 번 계산해 보관)."""
+        with self._lock:
+            stats = self._rolling.get(column)
+            if stats is None:
+                stats = RollingStats(self.frame[column].to_numpy(dtype=np.float64), self.periods_per_year,
+                                     dates=self.frame[self.date_column].to_numpy())
+                self._rolling[column] = stats
+        return stats
+
+    def rolling_slice(self, start, end, method, window, columns=None):
+        """
+        slice_years(start, end)에 수치 열마다 `<열>_<접미사>` 이동 통계 열을 붙인 새 프레임.
+        윈도는 구간 앞의 과거 값까지 포함한다.
+        """
+        lo, hi = self.year_bounds(start, end)
+        suffix = ROLLING_METHODS[method].suffix
+        columns = self.numeric_columns if columns is None else columns
+        return self.frame.iloc[lo:hi].assign(**{
+            f"{column}_{suffix}": self.rolling(column).compute(method, window, lo, hi)
+            for column in columns
+        })
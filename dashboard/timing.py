@@ -0,0 +1,107 @@
+"""
+rerun 단계별 소요 시간 기록기.
+
+스크립트의 각 단계를 `with recorder.stage("이름"):`으로 감싸면, rerun(전체 실행 또는 프래그먼트 재실행)
+하나가 끝날 때 단계별 소요 시간이 프로세스 전역 링 버퍼에 쌓입니다.
+Streamlit은 세션마다 별도 스레드에서 스크립트를 실행하므로 진행 중인 rerun은 스레드 로컬로 관리합니다.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class TimingRecorder:
+    def __init__(self, maxlen=200, on_end=None):
+        self._runs = deque(maxlen=maxlen)
+        # 기록이 끝난 rerun을 받는 콜백 (예: 메트릭 히스토그램)
+        self.on_end = on_end
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def active(self):
+        """현재 스레드에서 기록 중인 rerun (없으면 None)."""
+        return getattr(self._local, "run", None)
+
+    def begin(self, kind="full", session_id=None):
+        """
+        rerun 기록 시작. 이전 rerun이 end() 없이 남아 있으면(사용자 입력으로 스크립트가 중단된 경우) 버린다.
+        """
+        self._local.run = {
+            "started": time.time(),
+            "kind": kind,
+            "session_id": session_id,
+            "stages": [],
+            "_start": time.perf_counter(),
+        }
+        return self._local.run
+
+    def end(self):
+        """진행 중인 rerun을 마치고 링 버퍼에 넣는다."""
+        run = self.active
+        if run is None:
+            return None
+        self._local.run = None
+        run["total_ms"] = (time.perf_counter() - run.pop("_start")) * 1000
+        self._append(run)
+        return run
+
+    def _append(self, run):
+        with self._lock:
+            self._runs.append(run)
+        if self.on_end is not None:
+            self.on_end(run)
+
+    @contextmanager
+    def rerun(self, kind="full", session_id=None):
+        """rerun 하나를 기록한다. 이미 기록 중이면(프래그먼트가 전체 실행 안에서 호출된 경우) 그대로 통과."""
+        if self.active is not None:
+            yield self.active
+            return
+        run = self.begin(kind, session_id)
+        try:
+            yield run
+        finally:
+            self.end()
+
+    @contextmanager
+    def stage(self, name):
+        """단계 하나의 소요 시간 기록 (rerun 밖에서 호출되면 기록하지 않음)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            run = self.active
+            if run is not None:
+                run["stages"].append((name, (time.perf_counter() - start) * 1000))
+
+    def record(self, kind, name, elapsed_ms, session_id=None):
+        """스크립트 스레드 밖에서 일어난 작업(예: 다운로드 클릭 시 직렬화)을 단일 단계 rerun으로 기록."""
+        self._append({
+            "started": time.time(),
+            "kind": kind,
+            "session_id": session_id,
+            "stages": [(name, elapsed_ms)],
+            "total_ms": elapsed_ms,
+        })
+
+    def timed(self, kind, name, func):
+        """호출될 때 소요 시간을 record()로 남기는 래퍼."""
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(kind, name, (time.perf_counter() - start) * 1000)
+        return wrapper
+
+    def recent(self, n=20):
+        """최근 n개의 rerun (최신순)."""
+        with self._lock:
+            runs = list(self._runs)
+        return runs[::-1][:n]
+
+    def clear(self):
+        with self._lock:
+            self._runs.clear()
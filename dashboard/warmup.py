@@ -0,0 +1,162 @@
+"""
+서버 시작 시 캐시 예열과 TTL 만료 전 미리 갱신(refresh-ahead).
+
+- 예열: `streamlit run serve.py`(ASGI 모드)로 띄우면 서버가 요청을 받기 전에 lifespan 훅(`warm_on_start`)이
+  화면 없는 세션 하나로 앱 스크립트를 `?warmup=<WARMUP_TOKEN>`으로 한 번 실행합니다. 실제 코드 경로 그대로 데이터/Figure 캐시가 채워지고,
+  예열 실행에서는 기본 화면의 내보내기 바이트도 미리 만들어 둡니다. 토큰은 서버 프로세스마다 새로 만드는 임의 값이라
+  방문자가 쿼리 파라미터로 예열 실행을 흉내 낼 수 없습니다 (`is_warmup_run`).
+- 미리 갱신: `RefreshAhead` 스레드가 주기(epoch = 현재 시각 // 주기) 경계 `lead`초 전에, 직전 주기에 요청된 키들을
+  다시 불러와 로더(`StaleWhileRevalidate.refresh`)의 값을 교체합니다. 경계를 넘은 요청은 갓 불러온 값을 받으므로
+  오래된 값을 내보내며 백그라운드에서 갱신하는 경우도 드뭅니다.
+
+    $ streamlit run serve.py
+"""
+import asyncio
+import logging
+import os
+import secrets
+import threading
+import time
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger(__name__)
+
+# 캐시 갱신 주기(초)와 경계보다 얼마나 먼저 갱신할지(초, 0이면 미리 갱신하지 않고 주기가 지난 뒤 첫 요청이 갱신을 시작)
+REFRESH_PERIOD = int(os.environ.get("DASHBOARD_REFRESH_PERIOD", "3600"))
+REFRESH_LEAD = int(os.environ.get("DASHBOARD_REFRESH_LEAD", "120"))
+# 예열 세션만 아는 값 (같은 프로세스에서 실행되는 앱 스크립트는 is_warmup_run으로 비교)
+WARMUP_TOKEN = secrets.token_urlsafe(16)
+WARMUP_QUERY = f"warmup={WARMUP_TOKEN}"
+WARMUP_TIMEOUT = float(os.environ.get("DASHBOARD_WARMUP_TIMEOUT", "120"))
+
+
+def is_warmup_run(query_params):
+    """현재 실행이 warm_on_start의 예열 세션인지 (쿼리 파라미터의 토큰이 이 프로세스의 것과 같을 때만)."""
+    return secrets.compare_digest(query_params.get("warmup", "").encode(), WARMUP_TOKEN.encode())
+
+
+class RefreshAhead:
+    """
+    주기 경계 전에 등록된 갱신 작업을 다음 epoch로 미리 호출하는 백그라운드 스케줄러 (스레드 안전).
+    마지막 갱신 시각(`last_refresh`)과 실패 횟수(`failures`)를 작업 이름별로 보관한다.
+    """
+
+    def __init__(self, period=REFRESH_PERIOD, lead=REFRESH_LEAD, clock=time.time):
+        self.period = period
+        self.lead = min(lead, period / 2)
+        self.clock = clock
+        self.last_refresh = {}
+        self.failures = {}
+        self._jobs = {}
+        self._keys = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def epoch(self, now=None):
+        return int((self.clock() if now is None else now) // self.period)
+
+    def register(self, name, refresh):
+        """refresh(key, epoch): key의 값을 다시 불러오는 함수 (실패하면 예외)."""
+        with self._lock:
+            self._jobs[name] = refresh
+            self._keys.setdefault(name, {})
+
+    def touch(self, name, key):
+        """이번 주기에 key가 요청되었음을 기록하고 현재 epoch를 돌려준다 (다음 경계 전 갱신 대상이 됨)."""
+        epoch = self.epoch()
+        with self._lock:
+            self._keys.setdefault(name, {})[key] = epoch
+        return epoch
+
+    def record(self, name, when=None):
+        with self._lock:
+            self.last_refresh[name] = self.clock() if when is None else when
+
+    def refresh(self, epoch):
+        """직전 주기 이후 요청된 키들을 epoch로 계산 (실패는 기록만 하고 다음 작업 계속)."""
+        with self._lock:
+            jobs = list(self._jobs.items())
+            # 한 주기 넘게 요청되지 않은 키는 더 이상 갱신하지 않음
+            keys = {name: [key for key, seen in self._keys.get(name, {}).items() if seen >= epoch - 1]
+                    for name, _ in jobs}
+            for name, _ in jobs:
+                self._keys[name] = {key: seen for key, seen in self._keys[name].items() if seen >= epoch - 1}
+        for name, refresh in jobs:
+            for key in keys[name]:
+                try:
+                    refresh(key, epoch)
+                except Exception:
+                    logger.exception("refresh-ahead of %s(%r) failed", name, key)
+                    with self._lock:
+                        self.failures[name] = self.failures.get(name, 0) + 1
+                else:
+                    self.record(name)
+
+    def _run(self):
+        while True:
+            next_epoch = self.epoch() + 1
+            delay = next_epoch * self.period - self.lead - self.clock()
+            if delay > 0 and self._stop.wait(delay):
+                return
+            if self._stop.is_set():
+                return
+            self.refresh(next_epoch)
+            # 같은 경계에서 다시 돌지 않도록 경계를 지날 때까지 대기
+            remaining = next_epoch * self.period - self.clock()
+            if remaining > 0 and self._stop.wait(remaining):
+                return
+
+    def start(self):
+        if self._thread is None and self.lead > 0:
+            self._thread = threading.Thread(target=self._run, name="refresh-ahead", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+
+class _HeadlessClient:
+    """ForwardMsg를 버리고 script_finished만 기다리는 세션 클라이언트."""
+
+    def __init__(self):
+        self.finished = asyncio.Event()
+
+    def write_forward_msg(self, msg):
+        if msg.WhichOneof("type") == "script_finished":
+            self.finished.set()
+
+    @property
+    def client_context(self):
+        return None
+
+
+async def run_headless_session(query_string=WARMUP_QUERY, timeout=WARMUP_TIMEOUT):
+    """실행 중인 런타임에 화면 없는 세션을 열어 스크립트를 한 번 실행하고 닫는다 (소요 시간 초 반환)."""
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.runtime import Runtime
+
+    runtime = Runtime.instance()
+    client = _HeadlessClient()
+    session_id = runtime.connect_session(client, user_info={})
+    try:
+        msg = BackMsg()
+        msg.rerun_script.query_string = query_string
+        start = time.perf_counter()
+        runtime.handle_backmsg(session_id, msg)
+        await asyncio.wait_for(client.finished.wait(), timeout)
+        return time.perf_counter() - start
+    finally:
+        runtime.close_session(session_id)
+
+
+@asynccontextmanager
+async def warm_on_start(app):
+    """`st.App(..., lifespan=warm_on_start)`: 요청을 받기 전에 예열 세션을 한 번 실행 (실패해도 서버는 시작)."""
+    try:
+        elapsed = await run_headless_session()
+        logger.info("cache warm-up finished in %.2fs", elapsed)
+    except Exception:
+        logger.exception("cache warm-up failed; the first session will load the data instead")
+    yield
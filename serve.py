@@ -0,0 +1,10 @@
+"""
+ASGI 진입점: 서버가 요청을 받기 전에 캐시를 예열한 뒤 `streamlit_app.py`를 제공합니다.
+
+    $ streamlit run serve.py
+"""
+import streamlit as st
+
+from dashboard.warmup import warm_on_start
+
+app = st.App("streamlit_app.py", lifespan=warm_on_start)
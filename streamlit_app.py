@@ -1,15 +1,35 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
-import requests
-import io
+from functools import partial
+import logging
 import os
-import matplotlib.font_manager as fm
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+from dashboard import synthetic
+from dashboard.climate import fetch_climate
+from dashboard.etl import ARTIFACT_DIR, MANIFEST_NAME, load_manifest, read_artifact
+from dashboard.events import user_events_frame
+from dashboard.export import EXPORT_FORMATS, ExportCache, export_bytes
+from dashboard.figures import (
+    FigureCache,
+    build_climate_chart,
+    build_gdp_bar,
+    build_gdp_line,
+    build_rain_detail_bar,
+    build_region_pie,
+    build_user_bar,
+)
+from dashboard.fonts import register_font
+from dashboard.gdp_cache import cache_key, load_gdp_table
+from dashboard.gdp_store import GDPStore
+from dashboard.http_cache import HTTPCache
+from dashboard.metrics import DashboardMetrics, instrument_cache, start_http_server
+from dashboard.rolling import ROLLING_METHODS
+from dashboard.stale import StaleWhileRevalidate
+from dashboard.timeseries import TimeSeries
+from dashboard.timing import TimingRecorder
+from dashboard.warmup import REFRESH_PERIOD, RefreshAhead, is_warmup_run
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
 # --- 페이지 설정 ---
 st.set_page_config(
@@ -18,241 +38,374 @@ st.set_page_config(
     layout="wide",
 )
 
+# --- 성능 계측 / 메트릭 ---
+# Prometheus /metrics 엔드포인트 (포트를 0으로 두면 시작하지 않음)
+METRICS_PORT = int(os.environ.get("DASHBOARD_METRICS_PORT", "9464"))
+METRICS_ADDR = os.environ.get("DASHBOARD_METRICS_ADDR", "127.0.0.1")
+
+logger = logging.getLogger(__name__)
+
+@st.cache_resource
+def get_metrics():
+    """캐시 적중률, rerun 시간, 세션 수 메트릭 (서버 프로세스당 1회 생성, HTTP 엔드포인트도 이때 1회 시작)"""
+    metrics = DashboardMetrics()
+    if METRICS_PORT:
+        try:
+            start_http_server(metrics.registry, METRICS_PORT, METRICS_ADDR)
+        except OSError as e:
+            # 같은 호스트에서 여러 서버 프로세스를 띄우면 포트가 겹칠 수 있음
+            logger.warning("metrics endpoint not started on %s:%s: %s", METRICS_ADDR, METRICS_PORT, e)
+    return metrics
+
+@st.cache_resource
+def get_timing_recorder():
+    """rerun 단계별 소요 시간 링 버퍼 (서버 프로세스당 1개, 모든 세션이 공유)"""
+    return TimingRecorder(maxlen=500, on_end=get_metrics().observe_rerun)
+
+metrics = get_metrics()
+
+def current_session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else None
+
+timings = get_timing_recorder()
+timings.begin("full", session_id=current_session_id())
+
+# 서버 시작 시 예열 세션(serve.py)의 실행이면 기본 화면의 내보내기 바이트까지 미리 만듦
+# (프로세스마다 만드는 토큰과 비교 — 방문자가 ?warmup=...을 붙여도 무시됨)
+WARMING = is_warmup_run(st.query_params)
+
 # --- 폰트 설정 ---
-FONT_PATH = '/fonts/Pretendard-Bold.ttf'
+@st.cache_resource
+def get_font_name():
+    """한글 폰트 탐색/등록은 서버 프로세스당 1회만 수행하고, 찾은 폰트 이름을 모든 차트가 공유"""
+    return register_font()
 
-def get_font_name(font_path):
-    if os.path.exists(font_path):
-        font_name = fm.FontProperties(fname=font_path).get_name()
-        # Matplotlib에 폰트 추가
-        fm.fontManager.addfont(font_path)
-        plt.rc('font', family=font_name)
-        plt.rcParams['axes.unicode_minus'] = False # 마이너스 폰트 깨짐 방지
-        return font_name
-    return None
+with timings.stage("font_setup"):
+    font_name = get_font_name()
 
-font_name = get_font_name(FONT_PATH)
+# --- 오프라인 빌드 산출물 (python -m dashboard.etl build) ---
+ARTIFACT_PATH = os.environ.get("DASHBOARD_ARTIFACT_DIR", ARTIFACT_DIR)
+
+def manifest_version():
+    """빌드 매니페스트의 현재 버전: mtime/크기 (없으면 None). 다시 빌드하면 바뀌어 산출물 로더가 매니페스트를 새로 읽음"""
+    try:
+        return cache_key(os.path.join(ARTIFACT_PATH, MANIFEST_NAME))
+    except OSError:
+        return None
 
 # --- 데이터 로드 및 전처리 (공식 데이터) ---
-@st.cache_data(ttl=3600) # 1시간 동안 캐시
-def load_public_data():
+GDP_CSV_PATH = "data/gdp_data.csv"
+DEFAULT_COUNTRY = "KOR"
+
+def gdp_source_version(csv_path=GDP_CSV_PATH):
+    """
+    GDP 원본의 현재 버전: (빌드 매니페스트, CSV)의 mtime/크기 (파일 내용은 읽지 않음, 없는 파일은 None).
+    CSV를 교체하거나 산출물을 다시 빌드하면 값이 바뀌어 저장소를 다시 불러옴
+    """
+    try:
+        csv_key = cache_key(csv_path)
+    except OSError:
+        csv_key = None
+    return manifest_version(), csv_key
+
+def load_gdp_store(csv_path=GDP_CSV_PATH):
+    """
+    전체 국가 GDP 저장소
+    빌드 산출물이 있으면 그대로 메모리 매핑하고, 없으면 CSV를 버전마다 1회만 파싱해 롱 포맷 Arrow 캐시로 저장.
+    실패하면 예외를 그대로 냄 (예시 데이터로 대체할지는 호출한 쪽에서 결정 — 대체 데이터를 캐시하지 않도록)
+    """
+    # 매니페스트도 다시 빌드되었을 수 있으므로 매번 새로 읽음
+    table, version = read_artifact(load_manifest(ARTIFACT_PATH), "gdp", ARTIFACT_PATH)
+    if table is not None:
+        return GDPStore.from_table(table, version=version)
+    return GDPStore.from_table(load_gdp_table(csv_path), version=cache_key(csv_path))
+
+@instrument_cache(metrics.cache_requests, "load_public_data", st.cache_resource(max_entries=64))
+def load_public_data(_gdp_store, version, country=DEFAULT_COUNTRY):
     """
     기상청 AWS S3에서 서울 월별 평균 기온 및 강수량 데이터 로드
     출처: 기상청 기상자료개방포털 (https://data.kma.go.kr/resources/AWS/since_2000_202312/CSV/MONTH/)
     데이터셋 설명: 2000년부터의 월별 기상 데이터
+    (저장소 버전, 국가)마다 1회 생성해 모든 세션이 공유 — 이동 통계용 누적합도 이 객체에 보관됨
     """
     # 데이터 URL (2000년부터 2023년까지의 데이터 예시, 실제 운영시 최신 데이터 경로로 변경 필요)
     # 기상청 데이터는 연도별로 파일이 나뉘어 있어, 대표적인 파일 하나를 예시로 사용합니다.
     # 여러 연도를 합치려면 반복문으로 URL을 생성하여 로드해야 합니다.
-    local_path = "data/gdp_data.csv"
-    try:
-        df = pd.read_csv(local_path, encoding='euc-kr')
-
-        # gdp_data.csv에 맞는 데이터 전처리
-        # 예시: 'Country Name', '1960', ..., '2022' 등 연도별 GDP 데이터
-        # 대한민국 데이터만 추출
-        df_korea = df[df['Country Name'] == 'Korea, Rep.'].copy()
-        # 연도별 GDP 데이터만 추출
-        years = [str(y) for y in range(1960, 2023)]
-        gdp_values = df_korea[years].T.reset_index()
-        gdp_values.columns = ['date', 'gdp']
-        gdp_values['date'] = pd.to_datetime(gdp_values['date'], format='%Y')
-        gdp_values['gdp'] = pd.to_numeric(gdp_values['gdp'], errors='coerce')
-        gdp_values = gdp_values.dropna()
-        gdp_values = gdp_values[gdp_values['date'] <= pd.to_datetime(datetime.now().date())]
-        gdp_values.sort_values('date', inplace=True)
-        return gdp_values, True
+    # 선택한 국가의 행을 인덱스로 바로 조회 (국가코드 또는 국가명)
+    gdp_values = _gdp_store.frame(country)
+    gdp_values = gdp_values[gdp_values['date'] <= pd.to_datetime(datetime.now().date())]
+    return TimeSeries(gdp_values, version=version)
 
-    except Exception as e:
-        st.error(f"공식 데이터를 불러오는 데 실패했습니다: {e}. 예시 데이터로 대시보드를 표시합니다.")
-        # 예시 데이터 생성
-        dates = pd.to_datetime(pd.date_range(start="2022-01-01", end="2023-12-31", freq='MS'))
-        # 오늘 이후 데이터 제거
-        today = pd.to_datetime(datetime.now().date())
-        dates = dates[dates <= today]
-        
-        data = {
-            'date': dates,
-            'value_temp': np.random.uniform(-5, 28, size=len(dates)) + np.sin(np.arange(len(dates)) * np.pi / 6) * 10,
-            'value_rain': np.random.uniform(10, 350, size=len(dates)) * (np.sin(np.arange(len(dates)) * np.pi / 6) ** 2 + 0.1)
-        }
-        return pd.DataFrame(data), False
+@st.cache_resource
+def example_public_data():
+    """
+    공식 데이터를 한 번도 불러오지 못했을 때 보여줄 예시 데이터
+    시드를 고정한 합성 GDP 시계열이라 세션·서버 재시작과 관계없이 항상 같은 값 (1960년부터 작년까지)
+    """
+    last_year = datetime.now().year - 1
+    return TimeSeries(synthetic.gdp_frame(periods=last_year - 1960 + 1, start="1960"))
+
+# --- 데이터 로드 (기상청 월별 기후 자료, 선택) ---
+# 연도별 파일이 있는 로컬 디렉터리 또는 HTTP 기준 URL (지정하지 않으면 빌드 산출물의 기후 데이터, 그것도 없으면 기후 구간 생략)
+CLIMATE_SOURCE = os.environ.get("DASHBOARD_CLIMATE_SOURCE")
+
+@st.cache_resource
+def get_http_cache():
+    """원격 파일 본문 + ETag/Last-Modified 디스크 캐시 (서버 프로세스당 1개, 304 적중/200 미스를 메트릭으로 노출)"""
+    cache = HTTPCache()
+    metrics.track_cache_stats("http_revalidation", cache)
+    return cache
+
+def load_climate_data(source):
+    """
+    서울 월별 평균 기온/강수량
+    연도별 CSV를 연결 풀을 공유하는 스레드 풀에서 동시에 받아 하나의 월별 프레임으로 합침.
+    다시 불러올 때는 조건부 요청으로 재검증하고, 바뀐(200) 연도 파일만 다시 받아 파싱함
+    """
+    df = fetch_climate(source, http_cache=get_http_cache())
+    # 다시 받은 데이터가 같으면 같은 버전 → Figure 캐시를 그대로 재사용
+    version = f"{len(df):x}-{pd.util.hash_pandas_object(df, index=False).sum():x}"
+    return TimeSeries(df, version=version)
+
+# 산출물 로더는 매니페스트 버전(manifest_version())마다 1회 — 다시 빌드하면 재시작 없이 새 산출물을 읽음
+@instrument_cache(metrics.cache_requests, "load_climate_artifact", st.cache_resource(max_entries=1))
+def load_climate_artifact(manifest_version):
+    """빌드 시점에 받아 둔 기후 산출물 (DASHBOARD_CLIMATE_SOURCE가 없을 때 사용, 없으면 None)"""
+    table, version = read_artifact(load_manifest(ARTIFACT_PATH), "climate", ARTIFACT_PATH)
+    return TimeSeries(table.to_pandas(), version=version) if table is not None else None
 
 # --- 데이터 준비 (사용자 입력) ---
-@st.cache_data
-def load_user_data():
-    """사용자 입력 텍스트를 기반으로 데이터프레임 생성"""
-    data = {
-        'event': [
-            '태풍 카눈', '태풍 카눈', '태풍 카눈', '태풍 카눈',
-            '전국 폭우', '전국 폭우', '전국 폭우', '전국 폭우', '전국 폭우', '전국 폭우',
-            '충북 호우', '충북 호우', '충북 호우'
-        ],
-        'year': [
-            2023, 2023, 2023, 2023,
-            2025, 2025, 2025, 2025, 2025, 2025,
-            2023, 2023, 2023
-        ],
-        'region': [
-            '강원', '강원', '강원', '강원',
-            '전국', '전국', '전국', '전국', '전국', '전국',
-            '충북', '충북', '충북'
-        ],
-        'type': [
-            '휴업', '등교시간 조정', '개학 연기', '원격수업',
-            '학사일정 조정', '단축수업', '등교시간 조정', '휴업', '원격수업', '시설 피해',
-            '피해 학교·유치원', '등교시간 조정', '원격수업'
-        ],
-        'value': [
-            5, 1, 2, 2,
-            247, 156, 59, 29, 3, 451,
-            24, 7, 1
-        ],
-        'unit': ['곳'] * 13
-    }
-    df = pd.DataFrame(data)
-    
-    # 2025년 데이터는 가상의 데이터이므로, 오늘 날짜와 비교하여 필터링
-    today = datetime.now()
-    if today.year < 2025:
-        # st.warning("2025년 데이터는 미래 시점의 가상 데이터입니다.")
-        pass # 가상 데이터라도 일단 표시
-    
-    # 데이터 표준화: 'date' 컬럼 생성 (연도만 사용)
-    df['date'] = pd.to_datetime(df['year'], format='%Y')
-    df.rename(columns={'type': 'group'}, inplace=True)
-    return df
+@instrument_cache(metrics.cache_requests, "load_user_data", st.cache_resource(max_entries=1))
+def load_user_data(manifest_version):
+    """사용자 입력 텍스트 기반 재해 데이터 (빌드 산출물이 있으면 그대로 읽고, 없으면 여기서 변환)"""
+    table, version = read_artifact(load_manifest(ARTIFACT_PATH), "user_events", ARTIFACT_PATH)
+    if table is not None:
+        return TimeSeries(table.to_pandas(), version=version)
+    # 산출물이 없으면 내용 해시를 버전으로 (dashboard.events가 바뀌면 캐시 키도 바뀜)
+    df = user_events_frame()
+    return TimeSeries(df, version=f"{len(df):x}-{pd.util.hash_pandas_object(df, index=False).sum():x}")
+
+# cache_data는 호출마다 반환값을 피클/언피클해 세션마다 복사본을 만들므로,
+# 읽기 전용 저장소/TimeSeries를 모든 세션이 공유하는 로더에 보관 (제자리 수정 대신 파생 프레임 사용).
+# 갱신 주기가 지나거나 원본이 바뀌면 마지막 정상 값을 계속 내보내면서 백그라운드에서 다시 불러오고, 성공했을 때만 교체
+@st.cache_resource
+def get_gdp_loader():
+    """GDP 저장소 stale-while-revalidate 로더 (서버 프로세스당 1개, 원본 파일이 바뀌면 바로 갱신 시작)"""
+    loader = StaleWhileRevalidate(load_gdp_store, ttl=REFRESH_PERIOD, version=gdp_source_version)
+    metrics.track_loader("load_gdp_store", loader)
+    return loader
+
+@st.cache_resource
+def get_climate_loader():
+    """기후 데이터 stale-while-revalidate 로더 (서버 프로세스당 1개)"""
+    loader = StaleWhileRevalidate(load_climate_data, ttl=REFRESH_PERIOD)
+    metrics.track_loader("load_climate_data", loader)
+    return loader
+
+@st.cache_resource
+def get_refresher():
+    """로더 값을 주기 경계 전에 미리 갱신하는 스레드 (서버 프로세스당 1개, 마지막 갱신 시각을 메트릭으로 노출)"""
+    refresher = RefreshAhead()
+    # 갱신 스레드에는 스크립트 실행 컨텍스트가 없으므로 cache_resource 게터를 거치지 않고 로더 객체를 직접 잡아 둠
+    gdp_loader, climate_loader = get_gdp_loader(), get_climate_loader()
+    refresher.register("load_gdp_store", lambda csv_path, epoch: gdp_loader.refresh(csv_path))
+    refresher.register("load_climate_data", lambda source, epoch: climate_loader.refresh(source))
+    metrics.track_refresh(refresher)
+    return refresher.start()
+
+refresher = get_refresher()
 
 # --- 헬퍼 함수 ---
-def to_csv(df):
-    return df.to_csv(index=False).encode('utf-8-sig')
+@st.cache_resource
+def get_export_cache():
+    """다운로드용 내보내기 바이트 캐시 (서버 프로세스당 1개, 모든 세션이 공유)"""
+    cache = ExportCache(maxsize=64)
+    metrics.track_cache_stats("export_cache", cache)
+    return cache
 
-# --- UI 그리기 ---
-st.title("🌪️ 기후 위기와 학업 성취도 영향 대시보드")
-st.write("이 대시보드는 기후 위기로 인한 자연재해가 학생들의 수업에 미치는 영향을 분석합니다.")
+@st.cache_resource
+def get_figure_cache():
+    """Plotly Figure 캐시 (서버 프로세스당 1개, 모든 세션이 같은 Figure 객체를 읽기 전용으로 공유)"""
+    cache = FigureCache(maxsize=256)
+    metrics.track_cache_stats("figure_cache", cache)
+    return cache
 
-tab1, tab2 = st.tabs(["공식 공개 데이터 대시보드", "사용자 입력 데이터 대시보드"])
+def cached_figure(builder, df, cache_key):
+    """
+    (빌더, 데이터 버전·필터 입력, 폰트)가 같으면 캐시된 Figure를 재사용.
+    cache_key가 None이면(예시 데이터 등) 캐시하지 않음
+    """
+    with timings.stage(f"figure:{builder.__name__}"):
+        if cache_key is None:
+            return builder(df, font_name)
+        key = (builder.__name__, cache_key, font_name)
+        return get_figure_cache().get_or_build(key, partial(builder, df, font_name))
 
-# --- 탭 1: 공식 공개 데이터 ---
-with tab1:
-    st.header("서울 월별 평균 기온 및 강수량 변화 (기상청)")
-    
-    df_public, data_loaded_successfully = load_public_data()
+def download_section(df, file_stem, cache_key, key):
+    """
+    내보내기 형식 선택 + 다운로드 버튼.
+    캐시에 있으면 그 바이트를, 작은 프레임은 지금 청크 단위로 직렬화한 바이트를 넘기고, 큰 프레임은 버튼을 눌렀을 때만 직렬화.
+    같은 조건의 재다운로드는 캐시에서 반환 (cache_key가 None이면 캐시하지 않음)
+    """
+    fmt = st.selectbox(
+        "다운로드 형식",
+        options=list(EXPORT_FORMATS),
+        format_func=lambda f: EXPORT_FORMATS[f].label,
+        key=key,
+    )
+    spec = EXPORT_FORMATS[fmt]
+    if WARMING and cache_key:
+        for warm_fmt in EXPORT_FORMATS:
+            get_export_cache().get_or_create(cache_key + (warm_fmt,), partial(export_bytes, df, warm_fmt))
+    export = partial(export_bytes, df, fmt)
+    # rerun 중 직렬화는 이번 rerun의 단계로, 클릭 시 직렬화(다른 스레드일 수 있음)만 별도 download 항목으로 기록
+    with timings.stage(f"export:{fmt}"):
+        data = get_export_cache().download_data(
+            cache_key + (fmt,) if cache_key else None, export, len(df),
+            deferred_factory=timings.timed("download", f"export:{fmt}", export),
+        )
+    st.download_button(
+        label=f"처리된 데이터 다운로드 ({spec.label})",
+        data=data,
+        file_name=file_stem + spec.extension,
+        mime=spec.mime,
+    )
 
-    if data_loaded_successfully:
-        st.markdown("데이터 출처: [기상청 기상자료개방포털](https://data.kma.go.kr/resources/AWS/since_2000_202312/CSV/MONTH/) (예시: 2023년 데이터)")
-    else:
-        st.warning("공식 데이터 로드에 실패하여, 임의의 예시 데이터를 사용합니다.")
+# --- 탭 렌더링 ---
+def render_public_tab(public_series, data_loaded_successfully, country_label, data_key, climate_series, climate_error, is_open,
+                      public_age=None):
+    """탭 1: 공식 공개 데이터"""
+    if is_open:
+        st.header("서울 월별 평균 기온 및 강수량 변화 (기상청)")
 
-    # 사이드바 옵션
-    st.sidebar.header("공식 데이터 옵션")
+        if data_loaded_successfully:
+            st.markdown("데이터 출처: [기상청 기상자료개방포털](https://data.kma.go.kr/resources/AWS/since_2000_202312/CSV/MONTH/) (예시: 2023년 데이터)")
+            # 갱신 주기가 지났는데 아직 새 값으로 바뀌지 않았으면(백그라운드 갱신 중이거나 실패) 데이터 시점을 알림
+            if public_age is not None and public_age >= REFRESH_PERIOD:
+                st.caption(f"약 {public_age / 60:.0f}분 전에 불러온 데이터입니다. 최신 데이터로 갱신하는 중입니다.")
+        else:
+            st.warning("공식 데이터 로드에 실패하여, 예시(합성) 데이터를 사용합니다.")
+        if climate_error:
+            st.warning(f"기상청 기후 데이터를 불러오지 못했습니다: {climate_error}")
+
+    # 사이드바 위젯 상태를 유지하려면 탭이 닫혀 있어도 프래그먼트는 호출해야 함
+    public_data_section(public_series, country_label, data_key, climate_series, is_open)
+
+@st.fragment
+def public_data_section(public_series, country_label, data_key, climate_series, is_open):
+    """
+    연도 필터 → 차트 2개 → 표 → 다운로드 → (기후 자료가 있으면) 월별 기온/강수량 구간.
+    연도 슬라이더/이동 통계 옵션을 조작하면 전체 스크립트가 아니라 이 구간만 다시 실행됨
+    """
+    # 전체 실행 안에서 호출되면 그 rerun에 합산되고, 단독 재실행이면 별도 rerun으로 기록됨
+    with timings.rerun("fragment", session_id=current_session_id()):
+        render_public_data(public_series, country_label, data_key, climate_series, is_open)
+
+def render_public_data(public_series, country_label, data_key, climate_series, is_open):
     selected_years = st.sidebar.slider(
         "연도 선택",
-        min_value=df_public['date'].dt.year.min(),
-        max_value=df_public['date'].dt.year.max(),
-        value=(df_public['date'].dt.year.min(), df_public['date'].dt.year.max())
+        min_value=public_series.year_min,
+        max_value=public_series.year_max,
+        value=(public_series.year_min, public_series.year_max)
     )
 
-    smoothing = st.sidebar.checkbox("이동 평균 보기 (3개월)")
+    smoothing = st.sidebar.checkbox("이동 통계 보기")
+    rolling_method = st.sidebar.selectbox(
+        "이동 통계 방법",
+        options=list(ROLLING_METHODS),
+        format_func=lambda method: ROLLING_METHODS[method].label,
+        disabled=not smoothing,
+    )
+    window = st.sidebar.slider(
+        "윈도 크기 (포인트)",
+        min_value=2,
+        max_value=24,
+        value=3,
+        disabled=not smoothing or rolling_method == "yoy",
+    )
 
-    df_filtered = df_public[
-        (df_public['date'].dt.year >= selected_years[0]) &
-        (df_public['date'].dt.year <= selected_years[1])
-    ]
+    if not is_open:
+        return
 
-    if smoothing:
-        df_filtered['value_temp_smooth'] = df_filtered['value_temp'].rolling(window=3, min_periods=1).mean()
-        df_filtered['value_rain_smooth'] = df_filtered['value_rain'].rolling(window=3, min_periods=1).mean()
+    # 캐시 키에 쓰이는 이동 통계 조건 (증가율은 윈도와 무관)
+    rolling_spec = (rolling_method, None if rolling_method == "yoy" else window) if smoothing else None
 
-    # 시각화
+    with timings.stage("filter"):
+        if rolling_spec:
+            # 열마다 한 번 계산해 둔 누적합에서 선택 구간만 잘라 이동 통계 열을 붙인 새 프레임
+            df_filtered = public_series.rolling_slice(*selected_years, rolling_method, window)
+        else:
+            # 정렬된 연도 배열에서 searchsorted로 구한 위치 슬라이스 (복사 없음)
+            df_filtered = public_series.slice_years(*selected_years)
+
+    # 시각화 (예시 데이터는 캐시하지 않음)
+    figure_key = (data_key, selected_years, rolling_spec) if data_key else None
     col1, col2 = st.columns(2)
     
     with col1:
-        st.subheader("📈 연도별 GDP 변화")
-        fig_temp = go.Figure()
-        fig_temp.add_trace(go.Scatter(x=df_filtered['date'], y=df_filtered['gdp'], mode='lines+markers', name='GDP', marker_color='#ff6347'))
-        # smoothing은 GDP에는 적용하지 않음
-        fig_temp.update_layout(
-            yaxis_title="GDP (current US$)",
-            xaxis_title="연도",
-            font=dict(family=font_name) if font_name else None
-        )
+        st.subheader(f"📈 {country_label} 연도별 GDP 변화")
+        fig_temp = cached_figure(build_gdp_line, df_filtered, figure_key)
         st.plotly_chart(fig_temp, use_container_width=True)
 
     with col2:
-        st.subheader("� 연도별 GDP 막대그래프")
-        fig_gdp_bar = px.bar(df_filtered, x='date', y='gdp', title="", labels={'gdp': 'GDP (current US$)', 'date': '연도'})
-        fig_gdp_bar.update_layout(
-            yaxis_title="GDP (current US$)",
-            xaxis_title="연도",
-            font=dict(family=font_name) if font_name else None
-        )
+        st.subheader(f"� {country_label} 연도별 GDP 막대그래프")
+        fig_gdp_bar = cached_figure(build_gdp_bar, df_filtered, figure_key)
         st.plotly_chart(fig_gdp_bar, use_container_width=True)
 
     # 데이터 테이블 및 다운로드
     st.subheader("데이터 원본")
-    st.dataframe(df_filtered)
-    st.download_button(
-        label="처리된 데이터 다운로드 (CSV)",
-        data=to_csv(df_filtered),
-        file_name="public_climate_data_processed.csv",
-        mime="text/csv",
+    with timings.stage("dataframe"):
+        st.dataframe(df_filtered)
+    # 예시 데이터는 캐시하지 않음
+    download_section(
+        df_filtered,
+        "public_climate_data_processed",
+        ("public", data_key, selected_years, rolling_spec) if data_key else None,
+        key="public_export_format",
     )
 
-# --- 탭 2: 사용자 입력 데이터 ---
-with tab2:
+    if climate_series is not None:
+        render_climate(climate_series, selected_years)
+
+def render_climate(climate_series, selected_years):
+    """같은 연도 범위의 서울 월별 평균 기온/강수량"""
+    st.subheader("🌡️ 서울 월별 평균 기온 및 강수량 (기상청)")
+    with timings.stage("filter_climate"):
+        df_climate = climate_series.slice_years(*selected_years)
+    if df_climate.empty:
+        st.info("선택한 연도 범위에 기후 데이터가 없습니다.")
+        return
+    fig_climate = cached_figure(build_climate_chart, df_climate, (climate_series.version, selected_years))
+    st.plotly_chart(fig_climate, use_container_width=True)
+
+def render_user_tab(user_series, selected_events):
+    """탭 2: 사용자 입력 데이터"""
     st.header("기상 이변으로 인한 학교 수업 차질 통계")
     st.markdown("사용자가 제공한 기사 및 연구 자료 기반 데이터 시각화입니다.")
 
-    df_user = load_user_data()
-
-    # 사이드바 옵션
-    st.sidebar.header("사용자 데이터 옵션")
-    selected_events = st.sidebar.multiselect(
-        "재해 유형 선택",
-        options=df_user['event'].unique(),
-        default=df_user['event'].unique()
-    )
-    
-    df_user_filtered = df_user[df_user['event'].isin(selected_events)]
+    with timings.stage("filter_user"):
+        df_user = user_series.frame
+        df_user_filtered = df_user[df_user['event'].isin(selected_events)]
 
     # 시각화
+    # Figure/내보내기 캐시 키에 데이터 버전을 넣어 다른 버전의 데이터로 만든 결과를 재사용하지 않음 (공식 데이터 탭의 data_key와 같은 규칙)
+    figure_key = ("user", user_series.version, tuple(selected_events))
     st.subheader("📊 재해 유형별 학교 피해 현황")
-    fig_user_bar = px.bar(
-        df_user_filtered,
-        x='event',
-        y='value',
-        color='group',
-        barmode='group',
-        title="주요 기상 재해별 학사일정 조정 및 피해 건수",
-        labels={'value': '학교/피해 건수', 'event': '재해 유형', 'group': '조치 유형'}
-    )
-    fig_user_bar.update_layout(font=dict(family=font_name) if font_name else None)
+    fig_user_bar = cached_figure(build_user_bar, df_user_filtered, figure_key)
     st.plotly_chart(fig_user_bar, use_container_width=True)
 
     col3, col4 = st.columns(2)
     with col3:
         st.subheader("📍 지역별 피해 현황")
-        # '전국' 제외
-        df_region = df_user_filtered[df_user_filtered['region'] != '전국'].groupby('region')['value'].sum().reset_index()
-        fig_region = px.pie(df_region, values='value', names='region', title="지역별 총 피해/조정 건수 (전국 제외)", hole=0.3)
-        fig_region.update_traces(textposition='inside', textinfo='percent+label')
-        fig_region.update_layout(font=dict(family=font_name) if font_name else None)
+        fig_region = cached_figure(build_region_pie, df_user_filtered, figure_key)
         st.plotly_chart(fig_region, use_container_width=True)
     
     with col4:
         st.subheader("🗓️ 2025년 전국 폭우 상세 분석")
         df_2025_rain = df_user_filtered[df_user_filtered['event'] == '전국 폭우']
         if not df_2025_rain.empty:
-            fig_2025 = px.bar(
-                df_2025_rain,
-                x='group',
-                y='value',
-                color='group',
-                title="2025년 전국 폭우 조치 유형별 상세",
-                labels={'value': '학교/피해 건수', 'group': '조치 유형'}
-            )
-            fig_2025.update_layout(font=dict(family=font_name) if font_name else None, showlegend=False)
+            fig_2025 = cached_figure(build_rain_detail_bar, df_2025_rain, figure_key)
             st.plotly_chart(fig_2025, use_container_width=True)
         else:
             st.info("'전국 폭우' 데이터가 선택되지 않았습니다.")
@@ -260,10 +413,108 @@ with tab2:
 
     # 데이터 테이블 및 다운로드
     st.subheader("데이터 원본")
-    st.dataframe(df_user_filtered)
-    st.download_button(
-        label="처리된 데이터 다운로드 (CSV)",
-        data=to_csv(df_user_filtered),
-        file_name="user_disaster_data_processed.csv",
-        mime="text/csv",
+    with timings.stage("dataframe_user"):
+        st.dataframe(df_user_filtered)
+    download_section(
+        df_user_filtered,
+        "user_disaster_data_processed",
+        figure_key,
+        key="user_export_format",
     )
+
+# --- UI 그리기 ---
+st.title("🌪️ 기후 위기와 학업 성취도 영향 대시보드")
+st.write("이 대시보드는 기후 위기로 인한 자연재해가 학생들의 수업에 미치는 영향을 분석합니다.")
+
+# 탭 상태를 추적해(on_change="rerun") 선택되지 않은 탭의 본문은 실행하지 않음
+tab1, tab2 = st.tabs(
+    ["공식 공개 데이터 대시보드", "사용자 입력 데이터 대시보드"],
+    key="active_tab",
+    on_change="rerun",
+)
+
+# --- 탭 1: 공식 공개 데이터 ---
+st.sidebar.header("공식 데이터 옵션")
+gdp_loader = get_gdp_loader()
+with timings.stage("load_public_data"):
+    refresher.touch("load_gdp_store", GDP_CSV_PATH)
+    try:
+        gdp_store = gdp_loader.get(GDP_CSV_PATH)
+    except Exception as e:
+        # 불러온 적이 없거나 허용한 기간보다 오래된 값만 있을 때 (일시적 실패에는 마지막 정상 값이 쓰임)
+        st.error(f"공식 데이터를 불러오는 데 실패했습니다: {e}. 예시 데이터로 대시보드를 표시합니다.")
+        gdp_store = None
+
+if gdp_store is not None:
+    selected_country = st.sidebar.selectbox(
+        "국가 선택",
+        options=gdp_store.codes,
+        index=gdp_store.row(DEFAULT_COUNTRY),
+        format_func=lambda code: f"{gdp_store.name(code)} ({code})",
+    )
+    country_label = gdp_store.name(selected_country)
+    with timings.stage("load_public_data"):
+        public_series = load_public_data(gdp_store, gdp_store.version, selected_country)
+    data_loaded_successfully = True
+else:
+    selected_country, country_label = DEFAULT_COUNTRY, ""
+    public_series, data_loaded_successfully = example_public_data(), False
+public_age = gdp_loader.age(GDP_CSV_PATH) if data_loaded_successfully else None
+# 내보내기 캐시 키에 쓰이는 (데이터 버전, 국가) — 예시 데이터면 None
+data_key = (public_series.version, selected_country) if data_loaded_successfully else None
+
+climate_series, climate_error = None, None
+with timings.stage("load_climate_data"):
+    if CLIMATE_SOURCE:
+        try:
+            refresher.touch("load_climate_data", CLIMATE_SOURCE)
+            climate_series = get_climate_loader().get(CLIMATE_SOURCE)
+        except Exception as e:
+            climate_error = e
+    else:
+        climate_series = load_climate_artifact(manifest_version())
+
+with tab1, timings.stage("tab:public"):
+    render_public_tab(
+        public_series, data_loaded_successfully, country_label, data_key,
+        climate_series, climate_error, tab1.open, public_age,
+    )
+
+# --- 탭 2: 사용자 입력 데이터 ---
+# 사이드바 위젯은 탭과 관계없이 항상 그려야 탭을 오가도 선택값이 유지됨 (데이터 로드는 캐시되어 저렴함)
+st.sidebar.header("사용자 데이터 옵션")
+with timings.stage("load_user_data"):
+    user_series = load_user_data(manifest_version())
+selected_events = st.sidebar.multiselect(
+    "재해 유형 선택",
+    options=user_series.frame['event'].unique(),
+    default=user_series.frame['event'].unique()
+)
+
+with tab2:
+    if tab2.open:
+        with timings.stage("tab:user"):
+            render_user_tab(user_series, selected_events)
+
+timings.end()
+if WARMING:
+    refresher.record("warmup")
+
+# --- 성능 패널 (?perf=1 일 때만 표시) ---
+def render_performance_panel(recorder, n=10):
+    """최근 n개 rerun의 단계별 소요 시간(ms) 표"""
+    rows = []
+    for run in recorder.recent(n):
+        row = {
+            "시각": datetime.fromtimestamp(run["started"]).strftime("%H:%M:%S"),
+            "종류": run["kind"],
+            "합계": round(run["total_ms"], 1),
+        }
+        for stage, ms in run["stages"]:
+            row[stage] = round(row.get(stage, 0) + ms, 1)
+        rows.append(row)
+    with st.sidebar.expander("⏱️ 성능 (최근 rerun, ms)", expanded=True):
+        st.dataframe(pd.DataFrame(rows), hide_index=True)
+
+if st.query_params.get("perf") == "1":
+    render_performance_panel(timings)
@@ -0,0 +1,78 @@
+"""
+다운로드 버튼 데이터(`ExportCache.download_data`)와 앱의 다운로드 계측 테스트.
+
+    $ python -m unittest discover tests
+"""
+import os
+import unittest
+from unittest import mock
+
+from dashboard.export import ExportCache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class DownloadDataTest(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+    def factory(self, name):
+        def create():
+            self.calls.append(name)
+            return name.encode()
+        return create
+
+    def test_small_frame_is_eager_without_deferred_factory(self):
+        cache = ExportCache()
+        data = cache.download_data(("k",), self.factory("eager"), rows=10, eager_max_rows=100,
+                                   deferred_factory=self.factory("click"))
+        self.assertEqual(data, b"eager")
+        self.assertEqual(self.calls, ["eager"])
+
+    def test_hit_returns_bytes(self):
+        cache = ExportCache()
+        cache.get_or_create(("k",), self.factory("cached"))
+        data = cache.download_data(("k",), self.factory("eager"), rows=1000, eager_max_rows=100,
+                                   deferred_factory=self.factory("click"))
+        self.assertEqual(data, b"cached")
+        self.assertEqual(self.calls, ["cached"])
+
+    def test_large_miss_defers_to_click(self):
+        cache = ExportCache()
+        data = cache.download_data(("k",), self.factory("eager"), rows=1000, eager_max_rows=100,
+                                   deferred_factory=self.factory("click"))
+        self.assertTrue(callable(data))
+        self.assertEqual(self.calls, [])
+        self.assertEqual(data(), b"click")
+        # 클릭 결과는 캐시되어 다음 rerun은 바이트를 받음
+        self.assertEqual(cache.download_data(("k",), self.factory("eager"), rows=1000, eager_max_rows=100), b"click")
+        self.assertEqual(self.calls, ["click"])
+
+    def test_uncached(self):
+        cache = ExportCache()
+        self.assertEqual(cache.download_data(None, self.factory("eager"), rows=10, eager_max_rows=100), b"eager")
+        deferred = cache.download_data(None, self.factory("eager"), rows=1000, eager_max_rows=100,
+                                       deferred_factory=self.factory("click"))
+        self.assertEqual(deferred(), b"click")
+        self.assertEqual(len(cache), 0)
+
+
+class AppDownloadTimingTest(unittest.TestCase):
+    def test_rerun_without_click_records_no_download_run(self):
+        from streamlit.testing.v1 import AppTest
+
+        with mock.patch.dict(os.environ, {"DASHBOARD_METRICS_PORT": "0"}):
+            app = AppTest.from_file(os.path.join(ROOT, "streamlit_app.py"), default_timeout=120)
+            # ?perf=1: 사이드바에 최근 rerun 표 (종류 열)
+            app.query_params["perf"] = "1"
+            app.run()
+            app.run()
+        self.assertFalse(app.exception)
+        runs = app.sidebar.dataframe[-1].value
+        self.assertEqual(set(runs["종류"]), {"full"})
+        # 내보내기 비용은 그 값을 만든 rerun의 단계로 기록됨
+        self.assertIn("export:csv", runs.columns)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+오프라인 빌드(`dashboard.etl`)의 매니페스트 교체와 이전 산출물 정리 테스트.
+
+    $ python -m unittest discover tests
+"""
+import json
+import os
+import tempfile
+import unittest
+
+import pyarrow as pa
+
+from dashboard import etl
+from dashboard.events import user_events_frame
+
+
+def write_generation(out_dir, event_prefix):
+    """user_events만 바뀐 매니페스트를 직접 써서 새 세대를 만들고 그 파일 이름을 돌려준다."""
+    df = user_events_frame()
+    df["event"] = event_prefix + df["event"]
+    entry = etl._write_table(pa.Table.from_pandas(df, preserve_index=False), "user_events", out_dir)
+    manifest = etl.load_manifest(out_dir)
+    manifest["artifacts"]["user_events"].update(entry)
+    with open(os.path.join(out_dir, etl.MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    return entry["file"]
+
+
+class BuildTest(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.out = self._dir.name
+        self.addCleanup(self._dir.cleanup)
+
+    def arrow_files(self):
+        return {name for name in os.listdir(self.out) if name.endswith(".arrow")}
+
+    def test_manifest_lists_readable_artifacts(self):
+        manifest = etl.build(self.out)
+        for name in ("gdp", "user_events"):
+            table, version = etl.read_artifact(manifest, name, self.out)
+            self.assertEqual(table.num_rows, manifest["artifacts"][name]["rows"])
+            self.assertEqual(version, manifest["artifacts"][name]["sha256"][:16])
+
+    def test_build_keeps_previous_generation(self):
+        etl.build(self.out)
+        old = write_generation(self.out, "old ")
+        manifest = etl.build(self.out)
+        current = {a["file"] for a in manifest["artifacts"].values()}
+        # 실행 중인 앱이 아직 직전 매니페스트의 파일을 열고 있을 수 있음
+        self.assertEqual(self.arrow_files(), current | {old})
+        etl.build(self.out)
+        self.assertEqual(self.arrow_files(), current)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+누적합 기반 이동 통계(`dashboard.rolling`)와 `TimeSeries.rolling_slice` 테스트.
+
+    $ python -m unittest discover tests
+"""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from dashboard.rolling import RollingStats
+from dashboard.timeseries import TimeSeries
+
+
+def yearly(values_by_year):
+    return pd.DataFrame({
+        "date": pd.to_datetime([str(year) for year in values_by_year], format="%Y"),
+        "gdp": list(values_by_year.values()),
+    })
+
+
+class YoYTest(unittest.TestCase):
+    def test_gap_has_no_previous_year(self):
+        # GDPStore.frame()처럼 결측 연도(1982~2001)를 뺀 연간 시계열
+        series = TimeSeries(yearly({1980: 100.0, 1981: 110.0, 2002: 121.0, 2003: 133.1}))
+        df = series.rolling_slice(1980, 2003, "yoy", 3)
+        np.testing.assert_allclose(df["gdp_yoy_pct"].to_numpy(), [np.nan, 10.0, np.nan, 10.0])
+
+    def test_slice_after_gap(self):
+        series = TimeSeries(yearly({1980: 100.0, 1981: 110.0, 2002: 121.0, 2003: 133.1}))
+        df = series.rolling_slice(2002, 2003, "yoy", 3)
+        np.testing.assert_allclose(df["gdp_yoy_pct"].to_numpy(), [np.nan, 10.0])
+
+    def test_monthly_compares_same_month(self):
+        dates = pd.date_range("2020-01", periods=30, freq="MS")
+        # 2021년 3월 결측: 2022년 3월은 비교 대상이 없고, 나머지 달은 12개월 전과 비교
+        dates = dates.delete(14)
+        values = np.arange(1.0, len(dates) + 1)
+        stats = RollingStats(values, periods_per_year=12, dates=dates.to_numpy())
+        growth = stats.yoy()
+        march_2022 = dates.get_loc(pd.Timestamp("2022-03-01"))
+        april_2021 = dates.get_loc(pd.Timestamp("2021-04-01"))
+        self.assertTrue(np.isnan(growth[march_2022]))
+        self.assertAlmostEqual(growth[april_2021], (values[april_2021] / values[3] - 1.0) * 100.0)
+        self.assertTrue(np.isnan(growth[:12]).all())
+
+    def test_zero_base_is_nan(self):
+        series = TimeSeries(yearly({2000: 0.0, 2001: 5.0}))
+        self.assertTrue(np.isnan(series.rolling_slice(2000, 2001, "yoy", 3)["gdp_yoy_pct"]).all())
+
+    def test_without_dates_uses_positions(self):
+        stats = RollingStats([100.0, 110.0, 121.0])
+        np.testing.assert_allclose(stats.yoy(), [np.nan, 10.0, 10.0])
+
+
+class WindowTest(unittest.TestCase):
+    values = np.array([1.0, 4.0, np.nan, 2.0, 8.0, 5.0, np.nan, 7.0])
+
+    def test_mean_matches_pandas(self):
+        stats = RollingStats(self.values)
+        expected = pd.Series(self.values).rolling(3, min_periods=1).mean().to_numpy()
+        np.testing.assert_allclose(stats.mean(3), expected)
+        np.testing.assert_allclose(stats.mean(3, 2, 6), expected[2:6])
+
+    def test_median_matches_pandas(self):
+        stats = RollingStats(self.values)
+        expected = pd.Series(self.values).rolling(3, min_periods=1).median().to_numpy()
+        np.testing.assert_allclose(stats.median(3), expected)
+        np.testing.assert_allclose(stats.median(3, 4, 8), expected[4:8])
+
+    def test_ema_matches_pandas(self):
+        stats = RollingStats(self.values)
+        expected = pd.Series(self.values).ewm(span=3, ignore_na=True).mean().to_numpy()
+        np.testing.assert_allclose(stats.ema(3), expected)
+        np.testing.assert_allclose(stats.ema(3, 1, 5), expected[1:5])
+
+    def test_window_reaches_before_slice(self):
+        series = TimeSeries(yearly({2000: 1.0, 2001: 2.0, 2002: 3.0, 2003: 4.0}))
+        df = series.rolling_slice(2002, 2003, "mean", 3)
+        np.testing.assert_allclose(df["gdp_smooth"].to_numpy(), [2.0, 3.0])
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            RollingStats(self.values).compute("max", 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+stale-while-revalidate 로더(`dashboard.stale`) 테스트. 시계는 가짜 시계로 움직이고, 백그라운드 갱신은 끝날 때까지 기다린다.
+
+    $ python -m unittest discover tests
+"""
+import logging
+import time
+import unittest
+
+from dashboard.stale import StaleWhileRevalidate
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class Source:
+    """호출마다 (key, 회차)를 돌려주고, fail이 참이면 예외를 내는 원본."""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def __call__(self, key):
+        self.calls += 1
+        if self.fail:
+            raise OSError("source down")
+        return (key, self.calls)
+
+
+def wait_background(loader, timeout=5):
+    """진행 중인 백그라운드 갱신이 모두 끝날 때까지 기다린다."""
+    deadline = time.monotonic() + timeout
+    while any(entry.refreshing for entry in loader._entries.values()):
+        if time.monotonic() > deadline:
+            raise AssertionError("background refresh did not finish")
+        time.sleep(0.005)
+
+
+class StaleWhileRevalidateTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.source = Source()
+        self.loader = StaleWhileRevalidate(self.source, ttl=10, max_staleness=60, retry_after=5, clock=self.clock)
+        # 백그라운드 갱신 실패 경고는 테스트 출력에서 숨김
+        logging.getLogger("dashboard.stale").setLevel(logging.ERROR)
+
+    def test_cold_load_then_fresh_hit(self):
+        self.assertEqual(self.loader.get("a"), ("a", 1))
+        self.clock.advance(9)
+        self.assertEqual(self.loader.get("a"), ("a", 1))
+        self.assertEqual(self.source.calls, 1)
+        self.assertEqual((self.loader.misses, self.loader.hits, self.loader.stale_hits), (1, 1, 0))
+
+    def test_stale_hit_serves_previous_value_and_refreshes(self):
+        first = self.loader.get("a")
+        self.clock.advance(10)
+        self.assertIs(self.loader.get("a"), first)
+        self.assertEqual(self.loader.stale_hits, 1)
+        wait_background(self.loader)
+        self.assertEqual(self.loader.get("a"), ("a", 2))
+        self.assertEqual(self.loader.age("a"), 0)
+
+    def test_failed_refresh_keeps_previous_value(self):
+        first = self.loader.get("a")
+        self.clock.advance(10)
+        self.source.fail = True
+        self.assertIs(self.loader.get("a"), first)
+        wait_background(self.loader)
+        self.assertEqual(self.loader.failures, 1)
+        self.assertIs(self.loader.get("a"), first)
+
+    def test_version_change_is_stale(self):
+        version = ["v1"]
+        loader = StaleWhileRevalidate(self.source, ttl=10, clock=self.clock, version=lambda key: version[0])
+        first = loader.get("a")
+        version[0] = "v2"
+        self.assertIs(loader.get("a"), first)
+        wait_background(loader)
+        self.assertEqual(loader.get("a"), ("a", 2))
+        self.assertEqual(loader.hits, 1)
+
+    def test_past_max_staleness_loads_in_caller(self):
+        self.loader.get("a")
+        self.clock.advance(60)
+        self.assertEqual(self.loader.get("a"), ("a", 2))
+        self.assertEqual(self.loader.stale_hits, 0)
+
+    def test_past_max_staleness_raises_instead_of_old_value(self):
+        self.loader.get("a")
+        self.clock.advance(60)
+        self.source.fail = True
+        with self.assertRaises(OSError):
+            self.loader.get("a")
+
+    def test_load_error_is_not_cached_as_value(self):
+        self.source.fail = True
+        with self.assertRaises(OSError):
+            self.loader.get("a")
+        self.assertIsNone(self.loader.age("a"))
+        self.source.fail = False
+        self.clock.advance(5)
+        self.assertEqual(self.loader.get("a"), ("a", 2))
+
+    def test_retry_after_answers_without_loading(self):
+        self.source.fail = True
+        with self.assertRaises(OSError):
+            self.loader.get("a")
+        self.clock.advance(1)
+        for _ in range(2):
+            with self.assertRaises(RuntimeError) as raised:
+                self.loader.get("a")
+            # 매번 새 예외 (보관한 예외는 원인으로만 연결)
+            self.assertIsInstance(raised.exception.__cause__, OSError)
+        self.assertEqual(self.source.calls, 1)
+
+    def test_refresh_replaces_value(self):
+        self.loader.get("a")
+        self.clock.advance(3)
+        self.assertEqual(self.loader.refresh("a"), ("a", 2))
+        self.assertEqual(self.loader.age("a"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
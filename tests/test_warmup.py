@@ -0,0 +1,23 @@
+"""
+예열 실행 판별(`dashboard.warmup.is_warmup_run`) 테스트.
+
+    $ python -m unittest discover tests
+"""
+import unittest
+from urllib.parse import parse_qsl
+
+from dashboard.warmup import WARMUP_QUERY, WARMUP_TOKEN, is_warmup_run
+
+
+class WarmupRunTest(unittest.TestCase):
+    def test_headless_session_query_is_warmup(self):
+        self.assertTrue(is_warmup_run(dict(parse_qsl(WARMUP_QUERY))))
+
+    def test_visitor_query_is_not_warmup(self):
+        for value in ("1", "true", "", WARMUP_TOKEN[:-1], "예열"):
+            self.assertFalse(is_warmup_run({"warmup": value}), value)
+        self.assertFalse(is_warmup_run({}))
+
+
+if __name__ == "__main__":
+    unittest.main()